@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+
+import joblib
+
+
+ARTIFACT_VERSION = 2
+MANIFEST_FILE = 'manifest.json'
+MODEL_FILE = 'model.joblib'
+
+
+def schema_hash(schema):
+    """
+    Calcula el hash del esquema de preprocesamiento.
+
+    Args:
+        schema (dict): Esquema devuelto por HousingPreprocessor.get_schema()
+
+    Returns:
+        str: Hash SHA-256 hexadecimal del esquema y la versión del artefacto
+    """
+    payload = json.dumps({'version': ARTIFACT_VERSION, 'schema': schema}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_hash(path):
+    """
+    Calcula el hash de un archivo leyéndolo por bloques.
+
+    Args:
+        path (str): Ruta del archivo
+
+    Returns:
+        str: Hash SHA-256 hexadecimal del contenido
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _atomic_write(path, write):
+    """Escribe en un archivo temporal y lo renombra, para no dejar artefactos a medias."""
+    temporary = f'{path}.tmp'
+    write(temporary)
+    os.replace(temporary, path)
+
+
+def save_pipeline(pipeline, path):
+    """
+    Guarda un DataPipeline ajustado en un directorio de artefacto.
+
+    El directorio contiene ``manifest.json`` (versión, hash del esquema,
+    vocabulario y orden de columnas, hash del modelo) y ``model.joblib`` sin compresión, de
+    modo que los arreglos grandes del modelo se pueden abrir como memmap.
+
+    Args:
+        pipeline (DataPipeline): Pipeline con preprocesador ajustado y modelo entrenado
+        path (str): Directorio de destino (se crea si no existe)
+
+    Returns:
+        str: Hash del esquema guardado
+
+    Raises:
+        RuntimeError: Si el pipeline no tiene modelo o preprocesador ajustado
+    """
+    if pipeline.model is None or not pipeline.preprocessor.is_fitted:
+        raise RuntimeError('Solo se puede guardar un pipeline con preprocesador ajustado y modelo entrenado.')
+
+    os.makedirs(path, exist_ok=True)
+    schema = pipeline.preprocessor.get_schema()
+    model_path = os.path.join(path, MODEL_FILE)
+    _atomic_write(model_path, lambda target: joblib.dump(pipeline.model, target))
+    manifest = {
+        'version': ARTIFACT_VERSION,
+        'schema_hash': schema_hash(schema),
+        'schema': schema,
+        'model_class': f'{type(pipeline.model).__module__}.{type(pipeline.model).__name__}',
+        'model_sha256': file_hash(model_path),
+    }
+
+    def write_manifest(target):
+        with open(target, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, indent=2, ensure_ascii=False)
+
+    # El manifiesto se escribe al final: un directorio sin manifiesto no es un artefacto válido
+    _atomic_write(os.path.join(path, MANIFEST_FILE), write_manifest)
+    return manifest['schema_hash']
+
+
+def load_manifest(path, expected_schema_hash=None):
+    """
+    Lee y valida el manifiesto de un artefacto.
+
+    Args:
+        path (str): Directorio del artefacto
+        expected_schema_hash (str, optional): Hash que debe tener el esquema
+
+    Returns:
+        dict: Manifiesto validado
+
+    Raises:
+        ValueError: Si la versión no es compatible, si el esquema no coincide
+            con su hash o con el hash esperado
+    """
+    with open(os.path.join(path, MANIFEST_FILE), encoding='utf-8') as file:
+        manifest = json.load(file)
+    if manifest.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f"Versión de artefacto no compatible: {manifest.get('version')} "
+                         f'(se esperaba {ARTIFACT_VERSION})')
+    if schema_hash(manifest['schema']) != manifest['schema_hash']:
+        raise ValueError('El esquema del artefacto no coincide con su hash; el artefacto está dañado.')
+    if expected_schema_hash is not None and manifest['schema_hash'] != expected_schema_hash:
+        raise ValueError(f"Artefacto obsoleto: hash de esquema {manifest['schema_hash'][:12]} "
+                         f'distinto del esperado {expected_schema_hash[:12]}')
+    return manifest
+
+
+def load_model(path, mmap_mode='r', expected_sha256=None):
+    """
+    Carga el modelo de un artefacto.
+
+    Args:
+        path (str): Directorio del artefacto
+        mmap_mode (str, optional): Modo memmap para los arreglos NumPy ('r'
+            comparte las páginas entre procesos; None los copia en memoria)
+        expected_sha256 (str, optional): Hash que debe tener el archivo del
+            modelo (el registrado en el manifiesto)
+
+    Returns:
+        object: Modelo entrenado
+
+    Raises:
+        ValueError: Si el archivo del modelo no coincide con el hash esperado
+    """
+    model_path = os.path.join(path, MODEL_FILE)
+    # Se verifica antes de deserializar: joblib no debe abrir un modelo reemplazado o dañado
+    if expected_sha256 is not None and file_hash(model_path) != expected_sha256:
+        raise ValueError('El modelo del artefacto no coincide con el hash del manifiesto; '
+                         'el artefacto está dañado o fue modificado.')
+    return joblib.load(model_path, mmap_mode=mmap_mode)
@@ -0,0 +1,316 @@
+import numpy as np
+import pandas as pd
+
+
+class QuantileSketch:
+    """
+    Sketch KLL para cuantiles aproximados en una sola pasada.
+
+    Guarda los valores en una jerarquía de compactadores: cuando un nivel se
+    llena se ordena y la mitad de sus elementos (elegida con un desplazamiento
+    aleatorio) sube al siguiente nivel con el doble de peso. Un bloque grande
+    se compacta en sub-bloques del tamaño del nivel, ordenados todos a la vez,
+    en lugar de ordenarlo completo. El error de rango
+    normalizado es aproximadamente ``epsilon`` y la memoria es O(1/epsilon),
+    independiente del número de valores. Mientras no haya habido ninguna
+    compactación el resultado es exacto (igual a ``numpy.quantile``).
+
+    Attributes:
+        epsilon (float): Error de rango normalizado objetivo
+        k (int): Capacidad del compactador superior, derivada de epsilon
+        n (int): Número de valores ingresados
+        size (int): Número de valores retenidos (la memoria que ocupa el sketch)
+    """
+
+    def __init__(self, epsilon=0.001, seed=None):
+        """
+        Inicializa un sketch vacío.
+
+        Args:
+            epsilon (float): Error de rango normalizado objetivo (0 < epsilon < 1)
+            seed (int, optional): Semilla para las compactaciones aleatorias
+
+        Raises:
+            ValueError: Si epsilon no está en el intervalo (0, 1)
+        """
+        if not 0 < epsilon < 1:
+            raise ValueError('epsilon debe estar en el intervalo (0, 1)')
+        self.epsilon = epsilon
+        self.k = max(8, int(np.ceil(1.7 / epsilon)))
+        self.n = 0
+        self._compactors = [np.empty(0)]
+        self._exact = True
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def size(self):
+        """int: Número de valores retenidos en todos los compactadores."""
+        return sum(items.size for items in self._compactors)
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self._compactors):
+            items = self._compactors[level]
+            if items.size <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self._compactors):
+                self._compactors.append(np.empty(0))
+            # Sub-bloques de tamaño par (a lo sumo capacidad + 1), cada uno ordenado y
+            # compactado con su propio desplazamiento; el resto se queda en este nivel
+            width = self._capacity(level) + self._capacity(level) % 2
+            n_blocks = items.size // width
+            blocks = np.sort(items[:n_blocks * width].reshape(n_blocks, width), axis=1)
+            offsets = self._rng.integers(2, size=(n_blocks, 1))
+            promoted = np.take_along_axis(blocks, offsets + np.arange(0, width, 2), axis=1)
+            self._compactors[level] = items[n_blocks * width:]
+            self._compactors[level + 1] = np.concatenate([self._compactors[level + 1], promoted.ravel()])
+            self._exact = False
+            # Las capacidades dependen del número de niveles: se revisa desde el inicio
+            level = 0
+
+    def update(self, values):
+        """
+        Agrega un bloque de valores al sketch (los NaN se ignoran).
+
+        Args:
+            values (array-like): Valores numéricos del bloque
+
+        Returns:
+            QuantileSketch: La propia instancia
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.n += values.size
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Combina otro sketch con la misma precisión.
+
+        Args:
+            other (QuantileSketch): Sketch de otro bloque, hilo o proceso
+
+        Returns:
+            QuantileSketch: La propia instancia
+
+        Raises:
+            ValueError: Si los sketches tienen distinta capacidad k
+        """
+        if other.k != self.k:
+            raise ValueError('Solo se pueden combinar sketches con el mismo epsilon')
+        while len(self._compactors) < len(other._compactors):
+            self._compactors.append(np.empty(0))
+        for level, items in enumerate(other._compactors):
+            self._compactors[level] = np.concatenate([self._compactors[level], items])
+        self.n += other.n
+        self._exact = self._exact and other._exact
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """
+        Estima el cuantil q de los valores ingresados.
+
+        Args:
+            q (float): Cuantil buscado, entre 0 y 1
+
+        Returns:
+            float: Valor estimado del cuantil (NaN si el sketch está vacío)
+        """
+        if self.n == 0:
+            return float('nan')
+        if self._exact:
+            return float(np.quantile(self._compactors[0], q))
+        values = np.concatenate(self._compactors)
+        weights = np.concatenate([
+            np.full(items.size, 2.0 ** level) for level, items in enumerate(self._compactors)
+        ])
+        order = np.argsort(values, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        position = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(values[order[min(position, values.size - 1)]])
+
+
+class StreamingStats:
+    """
+    Acumulador de estadísticas de una columna en una sola pasada.
+
+    Calcula en un único recorrido el número de valores, la media y la
+    desviación estándar (Welford, combinando bloques con la fórmula paralela
+    de Chan), el mínimo y el máximo con sus índices, y la mediana mediante un
+    ``QuantileSketch``. Los acumuladores se pueden combinar con ``merge``, así
+    que los resultados parciales de bloques, hilos o procesos se unen sin
+    volver a leer los datos.
+
+    Attributes:
+        count (int): Número de valores no nulos
+        mean (float): Media acumulada
+        m2 (float): Suma de cuadrados centrada
+        min_value, max_value (float): Extremos observados
+        min_index, max_index: Etiquetas de índice de los extremos
+        sketch (QuantileSketch): Sketch para la mediana
+    """
+
+    def __init__(self, epsilon=0.001, seed=None):
+        """
+        Inicializa un acumulador vacío.
+
+        Args:
+            epsilon (float): Error de rango de la mediana aproximada
+            seed (int, optional): Semilla del sketch de cuantiles
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_value = float('nan')
+        self.max_value = float('nan')
+        self.min_index = None
+        self.max_index = None
+        self.sketch = QuantileSketch(epsilon, seed)
+
+    def update(self, values, index=None):
+        """
+        Agrega un bloque de valores.
+
+        Args:
+            values (pandas.Series or array-like): Valores del bloque
+            index (array-like, optional): Etiquetas de cada valor. Si values es
+                una Series se usa su índice; si no, posiciones consecutivas.
+
+        Returns:
+            StreamingStats: La propia instancia
+        """
+        data, index = self._valid(values, index)
+        if data.size:
+            self._add_moments(data, index)
+            self.sketch.update(data)
+        return self
+
+    def _valid(self, values, index):
+        """Valores float64 no nulos del bloque y sus etiquetas."""
+        if index is None:
+            index = values.index if isinstance(values, pd.Series) else None
+        data = np.asarray(values, dtype=np.float64)
+        if index is None:
+            index = np.arange(self.count, self.count + data.size)
+        valid = ~np.isnan(data)
+        if not valid.all():
+            data = data[valid]
+            index = np.asarray(index)[valid]
+        return data, index
+
+    def _add_moments(self, data, index):
+        """Suma los momentos y extremos de un bloque sin nulos (no alimenta el sketch)."""
+        mean = float(data.mean())
+        deviations = data - mean
+        m2 = float(np.dot(deviations, deviations))
+        position_min = int(data.argmin())
+        position_max = int(data.argmax())
+        return self._merge_moments(data.size, mean, m2, float(data[position_min]), index[position_min],
+                                   float(data[position_max]), index[position_max])
+
+    def merge(self, other):
+        """
+        Combina los resultados parciales de otro acumulador.
+
+        Ante empates en los extremos se conserva el índice de este acumulador,
+        por lo que combinar en el orden de los datos reproduce idxmin/idxmax.
+
+        Args:
+            other (StreamingStats): Acumulador de otro bloque, hilo o proceso
+
+        Returns:
+            StreamingStats: La propia instancia
+        """
+        if other.count == 0:
+            return self
+        self.sketch.merge(other.sketch)
+        return self._merge_moments(other.count, other.mean, other.m2, other.min_value, other.min_index,
+                                   other.max_value, other.max_index)
+
+    def _merge_moments(self, count, mean, m2, min_value, min_index, max_value, max_index):
+        if self.count == 0 or min_value < self.min_value:
+            self.min_value, self.min_index = min_value, min_index
+        if self.count == 0 or max_value > self.max_value:
+            self.max_value, self.max_index = max_value, max_index
+        n = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / n
+        self.mean += delta * count / n
+        self.count = n
+        return self
+
+    @property
+    def std(self):
+        """float: Desviación estándar muestral (ddof=1), como pandas."""
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan')
+
+    @property
+    def median(self):
+        """float: Mediana (exacta mientras el sketch no haya compactado)."""
+        return self.sketch.quantile(0.5)
+
+
+def _exact_median(data):
+    """Mediana exacta con una selección parcial (np.partition) en lugar de ordenar."""
+    if data.size == 0:
+        return float('nan')
+    middle = data.size // 2
+    if data.size % 2:
+        return float(np.partition(data, middle)[middle])
+    lower, upper = np.partition(data, [middle - 1, middle])[middle - 1:middle + 1]
+    return float((lower + upper) / 2)
+
+
+def get_house_values(df, epsilon=0.001):
+    """
+    Función que devuelve estadísticas de los valores de las casas
+
+    Los momentos y extremos se calculan en una sola pasada con StreamingStats.
+    Con un único DataFrame en memoria la mediana es exacta (np.partition);
+    con un iterable de bloques se estima con el sketch KLL de StreamingStats,
+    de modo que también sirve para archivos leídos por bloques.
+
+    Args:
+        df: DataFrame con los datos de las casas, o un iterable de DataFrames
+            (por ejemplo los bloques de streaming.iter_csv_chunks)
+        epsilon: Error de rango admitido para la mediana de datos por bloques
+
+    Returns:
+        dict: Diccionario con estadísticas de los valores de las casas
+    """
+    stats = StreamingStats(epsilon)
+    if isinstance(df, pd.DataFrame):
+        if 'price' not in df.columns:
+            raise ValueError("El DataFrame debe contener una columna 'price'")
+        data, index = stats._valid(df['price'], None)
+        if data.size:
+            stats._add_moments(data, index)
+        median = _exact_median(data)
+        total_houses = len(df)
+    else:
+        total_houses = 0
+        for chunk in df:
+            if 'price' not in chunk.columns:
+                raise ValueError("El DataFrame debe contener una columna 'price'")
+            stats.update(chunk['price'])
+            total_houses += len(chunk)
+        median = stats.median
+
+    return {
+        'max_value': stats.max_value,
+        'min_value': stats.min_value,
+        'mean_value': stats.mean,
+        'median_value': median,
+        'std_value': stats.std,
+        'total_houses': total_houses,
+        'max_value_house_index': stats.max_index,
+        'min_value_house_index': stats.min_index
+    }
@@ -0,0 +1,188 @@
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class StageMetrics:
+    """
+    Medición de una etapa del pipeline (split, preprocess, fit, predict...).
+
+    Attributes:
+        stage (str): Nombre de la etapa
+        rows (int): Filas procesadas
+        wall_time (float): Tiempo real en segundos
+        cpu_time (float): Tiempo de CPU del proceso en segundos
+        peak_memory_bytes (int): Pico de memoria asignada durante la etapa por
+            encima de la que había al empezar (None si tracemalloc no está activo)
+        process_peak_rss_bytes (int): Pico de memoria residente del proceso desde
+            que arrancó, no solo de la etapa (None si no está disponible)
+    """
+    stage: str
+    rows: int
+    wall_time: float
+    cpu_time: float
+    peak_memory_bytes: int = None
+    process_peak_rss_bytes: int = None
+
+    @property
+    def rows_per_second(self):
+        """float: Filas procesadas por segundo de tiempo real."""
+        return self.rows / self.wall_time if self.wall_time > 0 else float('inf')
+
+    def to_dict(self):
+        """
+        Convierte la medición en un diccionario plano para un backend de métricas.
+
+        Returns:
+            dict: Campos de la medición más rows_per_second
+        """
+        return {
+            'stage': self.stage,
+            'rows': self.rows,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'rows_per_second': self.rows_per_second,
+            'peak_memory_bytes': self.peak_memory_bytes,
+            'process_peak_rss_bytes': self.process_peak_rss_bytes,
+        }
+
+
+@dataclass
+class TrainResult:
+    """
+    Resultado de DataPipeline.train.
+
+    Attributes:
+        model: Modelo entrenado
+        n_train (int): Filas de entrenamiento
+        n_test (int): Filas reservadas para prueba
+        test_mse (float): MSE sobre el conjunto de prueba
+        test_r2 (float): R² sobre el conjunto de prueba
+        stages (list): StageMetrics de split, fit y predict (en modo por
+            bloques: schema, preprocess y fit, sumadas sobre todos los bloques)
+
+    En modo por bloques (train_streaming) no se reserva un conjunto de prueba:
+    n_train son las filas de una pasada, n_test es 0 y test_mse/test_r2 son None.
+    """
+    model: object
+    n_train: int
+    n_test: int
+    test_mse: float
+    test_r2: float
+    stages: list = field(default_factory=list)
+
+
+@dataclass
+class EvaluationResult:
+    """
+    Resultado de DataPipeline.evaluate.
+
+    Attributes:
+        mse (float): Error cuadrático medio
+        r2 (float): Coeficiente de determinación
+        n_rows (int): Filas evaluadas
+        stages (list): StageMetrics de predict y metrics (en modo por bloques
+            también preprocess, sumadas sobre todos los bloques)
+    """
+    mse: float
+    r2: float
+    n_rows: int
+    stages: list = field(default_factory=list)
+
+
+# Etapas medidas en curso (la más interna al final): memoria al empezar y
+# mayor pico visto antes de que una etapa anidada reiniciara el de tracemalloc
+_active_stages = []
+
+
+def _process_peak_rss():
+    if resource is None:
+        return None
+    # ru_maxrss está en bytes en macOS y en KiB en Linux y los BSD
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit
+
+
+def combine_stages(measurements):
+    """
+    Suma las mediciones por bloque de cada etapa en una sola StageMetrics.
+
+    Args:
+        measurements (list): StageMetrics de cada bloque, posiblemente con
+            varias mediciones por etapa
+
+    Returns:
+        list: Una StageMetrics por etapa, en el orden en que aparecieron, con
+            filas y tiempos sumados y el mayor de los picos de memoria
+    """
+    combined = {}
+    for metrics in measurements:
+        total = combined.get(metrics.stage)
+        if total is None:
+            combined[metrics.stage] = StageMetrics(**vars(metrics))
+            continue
+        total.rows += metrics.rows
+        total.wall_time += metrics.wall_time
+        total.cpu_time += metrics.cpu_time
+        peaks = [peak for peak in (total.peak_memory_bytes, metrics.peak_memory_bytes) if peak is not None]
+        total.peak_memory_bytes = max(peaks) if peaks else None
+        total.process_peak_rss_bytes = metrics.process_peak_rss_bytes
+    return list(combined.values())
+
+
+@contextmanager
+def measure_stage(stage, rows, hooks=(), collected=None):
+    """
+    Mide una etapa y notifica la medición a los hooks registrados.
+
+    Las etapas se pueden anidar: el pico de cada una se mide por encima de
+    la memoria que había al empezarla, y como tracemalloc tiene un único
+    pico global, el que una etapa anidada reinicia se conserva para las
+    etapas que la contienen.
+
+    Sin tracemalloc activo no hay pico propio de la etapa (peak_memory_bytes
+    es None); siempre se informa el pico residente del proceso.
+
+    Args:
+        stage (str): Nombre de la etapa
+        rows (int or callable): Filas que procesa la etapa, o una función que
+            las devuelve al terminar (si se conocen solo después de leer)
+        hooks (iterable): Funciones que reciben cada StageMetrics
+        collected (list, optional): Lista donde agregar la medición
+
+    Returns:
+        contextmanager: Contexto que produce la StageMetrics al salir
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        for outer in _active_stages:
+            outer['peak'] = max(outer['peak'], peak)
+        tracemalloc.reset_peak()
+        frame = {'start': current, 'peak': current}
+        _active_stages.append(frame)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        if tracing:
+            _active_stages.remove(frame)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+    peak = max(frame['peak'], tracemalloc.get_traced_memory()[1]) - frame['start'] if tracing else None
+    rows = rows() if callable(rows) else rows
+
+    metrics = StageMetrics(stage, rows, wall_time, cpu_time, peak, _process_peak_rss())
+    if collected is not None:
+        collected.append(metrics)
+    for hook in hooks:
+        hook(metrics)
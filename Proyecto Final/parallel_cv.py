@@ -0,0 +1,176 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import KFold, ParameterGrid
+
+
+# Matrices compartidas por cada proceso trabajador (cargadas una vez como memmap)
+_shared = {}
+
+
+def _init_worker(x_path, y_path, folds_path):
+    """Abre las matrices compartidas y el pliegue de cada fila en modo memmap de solo lectura."""
+    _shared['X'] = np.load(x_path, mmap_mode='r')
+    _shared['y'] = np.load(y_path, mmap_mode='r')
+    _shared['folds'] = np.load(folds_path, mmap_mode='r')
+
+
+def _fit_fold(task):
+    """Ajusta y evalúa un candidato en un pliegue; se ejecuta en un trabajador."""
+    candidate, name, estimator, params, fold = task
+    X, y = _shared['X'], _shared['y']
+    # Los pliegues de K-fold son disjuntos: basta el pliegue de prueba de cada fila
+    test_mask = _shared['folds'] == fold
+    train_idx, test_idx = np.flatnonzero(~test_mask), np.flatnonzero(test_mask)
+
+    start = time.perf_counter()
+    estimator.fit(X[train_idx], y[train_idx])
+    fit_time = time.perf_counter() - start
+    y_pred = estimator.predict(X[test_idx])
+    return {
+        'candidate': candidate,
+        'model': name,
+        'params': params,
+        'fold': fold,
+        'mse': mean_squared_error(y[test_idx], y_pred),
+        'r2': r2_score(y[test_idx], y_pred),
+        'fit_time': fit_time,
+        'n_train': len(train_idx),
+        'n_test': len(test_idx),
+    }
+
+
+def _named_estimators(estimators):
+    """
+    Asigna un nombre único a cada estimador de una lista.
+
+    Los elementos pueden ser estimadores o pares (nombre, estimador). Sin
+    nombre se usa la clase; si la clase se repite, se numera
+    (Ridge_1, Ridge_2) para que ningún candidato reemplace a otro.
+    """
+    pairs = [item if isinstance(item, tuple) else (None, item) for item in estimators]
+    classes = [type(estimator).__name__ for name, estimator in pairs if name is None]
+    named, seen = {}, {}
+    for name, estimator in pairs:
+        if name is None:
+            name = type(estimator).__name__
+            if classes.count(name) > 1:
+                seen[name] = seen.get(name, 0) + 1
+                name = f'{name}_{seen[name]}'
+        if name in named:
+            raise ValueError(f"Nombre de modelo repetido: '{name}'")
+        named[name] = estimator
+    return named
+
+
+def _candidates(estimators, param_grid):
+    """
+    Expande estimadores y rejilla de parámetros en (nombre, estimador, params).
+
+    Una rejilla por modelo se busca primero por el nombre del candidato y,
+    si no existe, por su clase, así {'Ridge': ...} se aplica a Ridge_1 y
+    Ridge_2. Una clave que no corresponde a ningún estimador lanza
+    KeyError en lugar de ignorarse.
+    """
+    if not isinstance(estimators, dict):
+        estimators = _named_estimators(estimators)
+    per_model = bool(param_grid) and all(isinstance(grid, dict) for grid in param_grid.values())
+    if per_model:
+        known = set(estimators) | {type(estimator).__name__ for estimator in estimators.values()}
+        unknown = [key for key in param_grid if key not in known]
+        if unknown:
+            raise KeyError(f'Rejilla para modelos inexistentes: {unknown}; modelos disponibles: {list(estimators)}')
+    candidates = []
+    for name, estimator in estimators.items():
+        if per_model:
+            grid = param_grid.get(name, param_grid.get(type(estimator).__name__, {}))
+        else:
+            grid = param_grid or {}
+        for params in ParameterGrid(grid):
+            candidates.append((name, clone(estimator).set_params(**params), params))
+    return candidates
+
+
+def cross_validate_models(X, y, estimators, param_grid=None, n_splits=5, shuffle=True,
+                          random_state=42, n_jobs=None, return_folds=False):
+    """
+    Evalúa varios modelos y combinaciones de parámetros con K-fold en paralelo.
+
+    Cada pareja (candidato, pliegue) se ajusta en un proceso de un
+    ProcessPoolExecutor. X e y se escriben una sola vez en archivos .npy
+    temporales que cada trabajador abre como memmap, de modo que las
+    matrices no se serializan para cada tarea y el sistema operativo
+    comparte las páginas entre procesos.
+
+    Args:
+        X (pandas.DataFrame or numpy.ndarray): Matriz de características
+        y (pandas.Series or numpy.ndarray): Vector objetivo
+        estimators (list or dict): Estimadores a comparar. Si es un dict, sus
+            claves se usan como nombre del modelo; una lista puede mezclar
+            estimadores (se nombran por su clase, numerada si se repite:
+            Ridge_1, Ridge_2) y pares (nombre, estimador)
+        param_grid (dict, optional): Rejilla común a todos los estimadores
+            ({'alpha': [0.1, 1.0]}) o una rejilla por nombre de modelo
+            ({'Ridge': {'alpha': [0.1, 1.0]}}); el nombre de la clase vale
+            para todos los estimadores numerados de esa clase
+        n_splits (int): Número de pliegues de K-fold
+        shuffle (bool): Si se barajan las filas antes de dividir
+        random_state (int): Semilla de la división
+        n_jobs (int, optional): Número de procesos (por defecto todos los núcleos)
+        return_folds (bool): Si es True devuelve también la tabla por pliegue
+
+    Returns:
+        pandas.DataFrame: Tabla con una fila por candidato (modelo y parámetros)
+            y la media/desviación de MSE, R² y tiempo de ajuste, ordenada por R².
+            Si return_folds es True devuelve la tupla (resumen, pliegues).
+
+    Raises:
+        KeyError: Si una rejilla por modelo nombra un estimador inexistente
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    kfold = KFold(n_splits=n_splits, shuffle=shuffle, random_state=random_state if shuffle else None)
+    # La división se calcula una sola vez: pliegue de prueba de cada fila
+    folds = np.empty(len(X), dtype=np.int32)
+    for fold, (_, test_idx) in enumerate(kfold.split(X)):
+        folds[test_idx] = fold
+    tasks = [
+        (candidate, name, estimator, params, fold)
+        for candidate, (name, estimator, params) in enumerate(_candidates(estimators, param_grid))
+        for fold in range(n_splits)
+    ]
+
+    workdir = tempfile.mkdtemp(prefix='parallel_cv_')
+    try:
+        x_path = os.path.join(workdir, 'X.npy')
+        y_path = os.path.join(workdir, 'y.npy')
+        folds_path = os.path.join(workdir, 'folds.npy')
+        np.save(x_path, X)
+        np.save(y_path, y)
+        np.save(folds_path, folds)
+        with ProcessPoolExecutor(max_workers=n_jobs or os.cpu_count(), initializer=_init_worker,
+                                 initargs=(x_path, y_path, folds_path)) as executor:
+            folds = pd.DataFrame(list(executor.map(_fit_fold, tasks)))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = folds.groupby('candidate').agg(
+        model=('model', 'first'),
+        params=('params', 'first'),
+        mean_mse=('mse', 'mean'),
+        std_mse=('mse', 'std'),
+        mean_r2=('r2', 'mean'),
+        std_r2=('r2', 'std'),
+        mean_fit_time=('fit_time', 'mean'),
+    ).sort_values('mean_r2', ascending=False).reset_index(drop=True)
+
+    if return_folds:
+        return summary, folds
+    return summary
@@ -1,6 +1,14 @@
 import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
+from artifact import load_manifest, load_model, save_pipeline
+from instrumentation import EvaluationResult, TrainResult, combine_stages, measure_stage
+from preprocessing import HousingPreprocessor
+from streaming import (DEFAULT_CHUNKSIZE, RegressionMetrics, fit_preprocessor_from_csv,
+                       iter_csv_chunks, iter_preprocessed)
+
+# sklearn (y scipy, que importa) tarda más de un segundo en cargarse: se importa
+# dentro de los métodos que lo usan para que cargar un artefacto y predecir,
+# o usar solo el preprocesamiento, no pague ese costo al arrancar.
+
 
 class DataPipeline:
     """
@@ -12,18 +20,43 @@ class DataPipeline:
     
     Attributes:
         model: El modelo de machine learning entrenado (inicialmente None)
+        preprocessor (HousingPreprocessor): Preprocesador con el esquema de
+            columnas aprendido en la primera llamada a preprocess()
+        hooks (list): Funciones que reciben una StageMetrics por cada etapa medida
     """
     
-    def __init__(self):
+    def __init__(self, preprocessor=None, hooks=None):
         """
         Inicializa una nueva instancia de DataPipeline.
         
         Crea una instancia vacía de la pipeline con el modelo inicializado como None.
         El modelo se asignará durante el proceso de entrenamiento.
+        
+        Args:
+            preprocessor (HousingPreprocessor, optional): Preprocesador ya
+                ajustado a reutilizar. Si es None se crea uno nuevo que se
+                ajusta con el primer DataFrame recibido por preprocess().
+            hooks (list, optional): Funciones de instrumentación; cada una recibe
+                la StageMetrics (tiempo real, CPU, filas/s, memoria) de cada etapa.
         """
         self.model = None
+        self.preprocessor = preprocessor if preprocessor is not None else HousingPreprocessor()
+        self.hooks = list(hooks) if hooks else []
+
+    def add_hook(self, hook):
+        """
+        Registra una función de instrumentación.
         
-    def preprocess(self, df):
+        Args:
+            hook (callable): Función que recibe una StageMetrics por etapa
+                (por ejemplo, para enviarla a un backend de métricas)
+        
+        Returns:
+            None
+        """
+        self.hooks.append(hook)
+        
+    def preprocess(self, df, refit=False):
         """
         Preprocesa los datos de viviendas para el entrenamiento del modelo.
         
@@ -32,23 +65,32 @@ class DataPipeline:
         2. Crea variables dummy para las columnas categóricas
         3. Separa las características (X) del objetivo (y)
         
+        El vocabulario de las columnas categóricas se aprende una sola vez (en
+        la primera llamada o cuando refit=True); los lotes posteriores se
+        codifican siempre con las mismas columnas y en el mismo orden, aunque
+        no contengan todas las categorías.
+        
         Args:
             df (pandas.DataFrame): DataFrame con los datos de viviendas.
                 Debe contener columnas como 'area', 'price' y columnas categóricas.
+            refit (bool): Si es True vuelve a aprender el esquema a partir de df.
         
         Returns:
             tuple: Una tupla (X, y) donde:
                 - X (pandas.DataFrame): Matriz de características preprocesadas
-                - y (pandas.Series): Vector objetivo (precios de las viviendas)
+                - y (pandas.Series): Vector objetivo (precios de las viviendas),
+                  o None si el lote no contiene la columna objetivo
         
         Raises:
             KeyError: Si el DataFrame no contiene las columnas requeridas
         """
-        df = df.copy()
-        df['area_miles'] = df['area'].apply(lambda x: x / 1000)
-        df_dummies = pd.get_dummies(df, drop_first=True)
-        X = df_dummies.drop('price', axis=1)
-        y = df_dummies['price']
+        with measure_stage('preprocess', len(df), self.hooks):
+            if refit or not self.preprocessor.is_fitted:
+                self.preprocessor.fit(df)
+            matrix = self.preprocessor.transform(df)
+        X = pd.DataFrame(matrix, index=df.index, columns=self.preprocessor.feature_names_, copy=False)
+        target = self.preprocessor.target
+        y = df[target] if target in df.columns else None
         return X, y
     
     def train(self, X, y, model_instance):
@@ -56,8 +98,9 @@ class DataPipeline:
         Entrena un modelo de machine learning con los datos proporcionados.
         
         Divide los datos en conjuntos de entrenamiento y prueba (80% - 20%),
-        entrena el modelo con los datos de entrenamiento y lo almacena
-        en la instancia de la clase.
+        entrena el modelo con los datos de entrenamiento, lo almacena
+        en la instancia de la clase y lo evalúa sobre el conjunto de prueba.
+        Cada etapa (split, fit, predict) se mide y se notifica a los hooks.
         
         Args:
             X (pandas.DataFrame): Matriz de características para el entrenamiento
@@ -66,16 +109,28 @@ class DataPipeline:
                 (debe tener métodos fit() y predict())
         
         Returns:
-            None
+            TrainResult: Modelo, tamaños de entrenamiento/prueba, MSE y R² sobre
+                el conjunto de prueba y las mediciones de cada etapa
             
         Note:
             El modelo entrenado se almacena en self.model y puede ser utilizado
             posteriormente para predicciones y evaluación.
         """
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        model_instance.fit(X_train, y_train)
+        from sklearn.metrics import mean_squared_error, r2_score
+        from sklearn.model_selection import train_test_split
+
+        stages = []
+        with measure_stage('split', len(X), self.hooks, stages):
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        with measure_stage('fit', len(X_train), self.hooks, stages):
+            model_instance.fit(X_train, y_train)
         self.model = model_instance
+        with measure_stage('predict', len(X_test), self.hooks, stages):
+            y_pred = model_instance.predict(X_test)
         print('Modelo entrenado correctamente.')
+        return TrainResult(model=model_instance, n_train=len(X_train), n_test=len(X_test),
+                           test_mse=mean_squared_error(y_test, y_pred),
+                           test_r2=r2_score(y_test, y_pred), stages=stages)
 
     def evaluate(self, X, y):
         """
@@ -90,7 +145,8 @@ class DataPipeline:
             y (pandas.Series): Vector objetivo real (precios de las viviendas)
         
         Returns:
-            None
+            EvaluationResult: MSE, R², filas evaluadas y mediciones de las
+                etapas predict y metrics, o None si el modelo no está entrenado
             
         Note:
             Si el modelo no ha sido entrenado previamente, muestra un mensaje
@@ -98,9 +154,222 @@ class DataPipeline:
         """
         if self.model is None:
             print('El modelo no ha sido entrenado.')
-            return
-        y_pred = self.model.predict(X)
-        mse = mean_squared_error(y, y_pred)
-        r2 = r2_score(y, y_pred)
+            return None
+        from sklearn.metrics import mean_squared_error, r2_score
+
+        stages = []
+        with measure_stage('predict', len(X), self.hooks, stages):
+            y_pred = self.model.predict(X)
+        with measure_stage('metrics', len(X), self.hooks, stages):
+            mse = mean_squared_error(y, y_pred)
+            r2 = r2_score(y, y_pred)
         print(f'MSE: {mse:.2f}')
-        print(f'R2 Score: {r2:.2f}') 
\ No newline at end of file
+        print(f'R2 Score: {r2:.2f}')
+        return EvaluationResult(mse=mse, r2=r2, n_rows=len(X), stages=stages)
+
+    def predict(self, df):
+        """
+        Predice precios para un lote de viviendas con el modelo entrenado.
+        
+        El lote se codifica con el esquema aprendido (misma estructura de
+        columnas que en el entrenamiento) y se predice en una sola llamada
+        vectorizada; la columna 'price' no es necesaria.
+        
+        Args:
+            df (pandas.DataFrame): Lote de viviendas con las columnas originales
+        
+        Returns:
+            numpy.ndarray: Precio predicho para cada fila
+        
+        Raises:
+            RuntimeError: Si el modelo no ha sido entrenado
+            KeyError: Si el lote no contiene las columnas requeridas
+        """
+        if self.model is None:
+            raise RuntimeError('El modelo no ha sido entrenado.')
+        X = self.preprocessor.transform(df)
+        if hasattr(self.model, 'feature_names_in_'):
+            X = pd.DataFrame(X, columns=self.preprocessor.feature_names_, copy=False)
+        return self.model.predict(X)
+
+    def cross_validate(self, X, y, estimators, param_grid=None, n_splits=5, n_jobs=None):
+        """
+        Compara varios modelos con validación cruzada K-fold en paralelo.
+        
+        Reparte los ajustes (candidato × pliegue) en un pool de procesos que
+        usa todos los núcleos; X e y se comparten con los trabajadores mediante
+        archivos memmap en lugar de serializarse en cada tarea. No modifica
+        self.model: el modelo elegido se entrena después con train().
+        
+        Args:
+            X (pandas.DataFrame): Matriz de características preprocesadas
+            y (pandas.Series): Vector objetivo (precios de las viviendas)
+            estimators (list or dict): Estimadores candidatos (o pares (nombre, estimador))
+            param_grid (dict, optional): Rejilla de parámetros común o por modelo
+            n_splits (int): Número de pliegues
+            n_jobs (int, optional): Número de procesos (por defecto todos los núcleos)
+        
+        Returns:
+            pandas.DataFrame: Tabla de métricas por candidato, ordenada por R²
+        """
+        from parallel_cv import cross_validate_models
+
+        return cross_validate_models(X, y, estimators, param_grid=param_grid,
+                                     n_splits=n_splits, n_jobs=n_jobs)
+
+    def save(self, path):
+        """
+        Guarda el pipeline ajustado (esquema de preprocesamiento y modelo).
+        
+        Args:
+            path (str): Directorio del artefacto (se crea si no existe)
+        
+        Returns:
+            str: Hash del esquema guardado, útil para rechazar artefactos obsoletos
+        
+        Raises:
+            RuntimeError: Si el modelo no ha sido entrenado
+        """
+        return save_pipeline(self, path)
+
+    @classmethod
+    def load(cls, path, mmap_mode='r', expected_schema_hash=None):
+        """
+        Carga un pipeline guardado con save() sin volver a entrenar.
+        
+        Con mmap_mode='r' los arreglos del modelo se abren como memmap de solo
+        lectura, de modo que varios procesos comparten la misma copia en la
+        caché de páginas del sistema operativo.
+        
+        Args:
+            path (str): Directorio del artefacto
+            mmap_mode (str, optional): Modo memmap de los arreglos (None para copiarlos)
+            expected_schema_hash (str, optional): Hash de esquema exigido
+        
+        Returns:
+            DataPipeline: Pipeline con preprocesador y modelo listos para predecir
+        
+        Raises:
+            ValueError: Si el artefacto es de otra versión, su esquema no coincide
+                o el archivo del modelo no corresponde al manifiesto
+        """
+        manifest = load_manifest(path, expected_schema_hash)
+        pipeline = cls(preprocessor=HousingPreprocessor.from_schema(manifest['schema']))
+        pipeline.model = load_model(path, mmap_mode=mmap_mode, expected_sha256=manifest['model_sha256'])
+        return pipeline
+
+    def _require_target(self, path):
+        """Comprueba en el encabezado del CSV que exista la columna objetivo, antes de leer los datos."""
+        columns = pd.read_csv(path, nrows=0).columns
+        if self.preprocessor.target not in columns:
+            raise ValueError(f"El archivo {path} no contiene la columna objetivo '{self.preprocessor.target}'")
+
+    def train_streaming(self, path, model_instance, chunksize=DEFAULT_CHUNKSIZE, epochs=1):
+        """
+        Entrena un modelo fuera de memoria leyendo un CSV por bloques.
+        
+        Si el preprocesador aún no está ajustado, primero recorre el archivo
+        para aprender el esquema completo. Después cada bloque se preprocesa y
+        se pasa a ``partial_fit`` del modelo, por lo que nunca hay más de
+        ``chunksize`` filas en memoria. Las etapas schema, preprocess (lectura
+        y preprocesamiento de cada bloque) y fit se miden bloque a bloque y se
+        notifican a los hooks sumadas al terminar.
+        
+        Args:
+            path (str): Ruta del CSV con los datos de entrenamiento
+            model_instance: Modelo con método partial_fit() (por ejemplo
+                SGDRegressor). Conviene que las características estén escaladas.
+            chunksize (int): Número máximo de filas por bloque
+            epochs (int): Número de pasadas completas sobre el archivo
+        
+        Returns:
+            TrainResult: Modelo, filas de una pasada (n_train; sin conjunto de
+                prueba, así que n_test es 0 y test_mse/test_r2 son None) y las
+                mediciones de cada etapa
+        
+        Raises:
+            TypeError: Si el modelo no implementa partial_fit()
+            ValueError: Si el CSV no tiene la columna objetivo
+        """
+        if not hasattr(model_instance, 'partial_fit'):
+            raise TypeError('El modelo debe implementar partial_fit() para el entrenamiento por bloques.')
+        self._require_target(path)
+        measurements = []
+        if not self.preprocessor.is_fitted:
+            # Las filas de la pasada de esquema se conocen al terminar la primera época
+            with measure_stage('schema', 0, collected=measurements):
+                fit_preprocessor_from_csv(self.preprocessor, path, chunksize)
+        n_rows = 0
+        for epoch in range(epochs):
+            for X, y in self._measured_chunks(path, chunksize, measurements):
+                with measure_stage('fit', len(X), collected=measurements):
+                    model_instance.partial_fit(X, y)
+                if epoch == 0:
+                    n_rows += len(X)
+        self.model = model_instance
+        stages = combine_stages(measurements)
+        if stages and stages[0].stage == 'schema':
+            stages[0].rows = n_rows
+        self._notify(stages)
+        print('Modelo entrenado correctamente.')
+        return TrainResult(model=model_instance, n_train=n_rows, n_test=0, test_mse=None, test_r2=None,
+                           stages=stages)
+
+    def evaluate_streaming(self, path, chunksize=DEFAULT_CHUNKSIZE):
+        """
+        Evalúa el modelo entrenado sobre un CSV leído por bloques.
+        
+        Las métricas (MSE y R²) se acumulan de forma incremental y coinciden
+        con las que se obtendrían evaluando todo el archivo en memoria. Las
+        etapas preprocess, predict y metrics se miden bloque a bloque y se
+        notifican a los hooks sumadas al terminar.
+        
+        Args:
+            path (str): Ruta del CSV con los datos de evaluación
+            chunksize (int): Número máximo de filas por bloque
+        
+        Returns:
+            EvaluationResult: MSE, R², filas evaluadas y mediciones de cada
+                etapa, o None si el modelo no ha sido entrenado
+        
+        Raises:
+            ValueError: Si el CSV no tiene la columna objetivo
+        """
+        if self.model is None:
+            print('El modelo no ha sido entrenado.')
+            return None
+        self._require_target(path)
+        metrics = RegressionMetrics()
+        measurements = []
+        named = hasattr(self.model, 'feature_names_in_')
+        for X, y in self._measured_chunks(path, chunksize, measurements):
+            with measure_stage('predict', len(X), collected=measurements):
+                if named:
+                    # Modelos ajustados con DataFrame esperan los nombres de columna
+                    X = pd.DataFrame(X, columns=self.preprocessor.feature_names_, copy=False)
+                y_pred = self.model.predict(X)
+            with measure_stage('metrics', len(y), collected=measurements):
+                metrics.update(y, y_pred)
+        stages = combine_stages(measurements)
+        self._notify(stages)
+        print(f'MSE: {metrics.mse:.2f}')
+        print(f'R2 Score: {metrics.r2:.2f}')
+        return EvaluationResult(mse=metrics.mse, r2=metrics.r2, n_rows=metrics.n, stages=stages)
+
+    def _measured_chunks(self, path, chunksize, measurements):
+        """Lee y preprocesa el CSV por bloques, midiendo cada bloque como etapa 'preprocess'."""
+        batches = iter_preprocessed(iter_csv_chunks(path, chunksize), self.preprocessor)
+        while True:
+            batch = None
+            with measure_stage('preprocess', lambda: 0 if batch is None else len(batch[0]),
+                               collected=measurements):
+                batch = next(batches, None)
+            if batch is None:
+                return
+            yield batch
+
+    def _notify(self, stages):
+        """Envía a los hooks las mediciones ya sumadas de un recorrido por bloques."""
+        for metrics in stages:
+            for hook in self.hooks:
+                hook(metrics)
@@ -0,0 +1,230 @@
+import numpy as np
+import pandas as pd
+
+
+def _vocabulary_to_json(vocabulary):
+    """Convierte un vocabulario en valores JSON y el nombre de su dtype."""
+    index = pd.Index(vocabulary)
+    if index.dtype.kind in 'biuf':
+        return index.tolist(), str(index.dtype)
+    return [str(category) for category in vocabulary], str(index.dtype)
+
+
+def _vocabulary_from_json(values, dtype):
+    """Reconstruye un vocabulario guardado con su dtype original."""
+    return pd.Index(values, dtype=object).astype(dtype).tolist()
+
+
+class HousingPreprocessor:
+    """
+    Preprocesador de datos de viviendas con esquema congelado.
+
+    Aprende una sola vez (``fit``) el orden de las columnas numéricas y el
+    vocabulario de cada columna categórica, y luego codifica cualquier lote
+    nuevo (``transform``) directamente en una matriz NumPy de tipo float con
+    el mismo orden de columnas, sin importar qué categorías aparezcan en el
+    lote. Reproduce la salida de ``pd.get_dummies(df, drop_first=True)``:
+    la primera categoría (en orden alfabético) de cada columna se descarta.
+
+    Attributes:
+        target (str): Nombre de la columna objetivo (se excluye de X)
+        area_column (str): Columna de área a partir de la cual se deriva 'area_miles'
+        numeric_columns_ (list): Columnas numéricas aprendidas en ``fit``
+        categories_ (dict): Vocabulario ordenado de cada columna categórica
+        feature_names_ (list): Orden final de las columnas de X
+    """
+
+    def __init__(self, target='price', area_column='area'):
+        """
+        Inicializa el preprocesador sin ajustar.
+
+        Args:
+            target (str): Nombre de la columna objetivo
+            area_column (str): Nombre de la columna de área en metros cuadrados
+        """
+        self.target = target
+        self.area_column = area_column
+        self.numeric_columns_ = None
+        self.categories_ = None
+        self.feature_names_ = None
+
+    @property
+    def is_fitted(self):
+        """bool: True si el preprocesador ya aprendió el esquema."""
+        return self.feature_names_ is not None
+
+    def fit(self, df):
+        """
+        Aprende el esquema (columnas numéricas y vocabularios categóricos).
+
+        Args:
+            df (pandas.DataFrame): DataFrame de referencia (por ejemplo Housing.csv)
+
+        Returns:
+            HousingPreprocessor: La propia instancia, ya ajustada
+
+        Raises:
+            KeyError: Si el DataFrame no contiene la columna de área
+        """
+        if self.area_column not in df.columns:
+            raise KeyError(self.area_column)
+
+        numeric_columns = []
+        categories = {}
+        for column in df.columns:
+            if column == self.target:
+                continue
+            dtype = df[column].dtype
+            if pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+                numeric_columns.append(column)
+            else:
+                categories[column] = sorted(df[column].dropna().unique())
+
+        self.numeric_columns_ = numeric_columns
+        self.categories_ = categories
+        self._update_feature_names()
+        return self
+
+    def partial_fit(self, df):
+        """
+        Amplía los vocabularios categóricos con las categorías de un bloque.
+
+        Permite aprender el esquema recorriendo un archivo por bloques: el
+        primer bloque se pasa a ``fit`` y los siguientes a ``partial_fit``.
+        Solo se leen las columnas categóricas del bloque.
+
+        Args:
+            df (pandas.DataFrame): Bloque con (al menos) las columnas categóricas
+
+        Returns:
+            HousingPreprocessor: La propia instancia
+
+        Raises:
+            RuntimeError: Si el preprocesador no ha sido ajustado con fit
+        """
+        if not self.is_fitted:
+            raise RuntimeError('El preprocesador no ha sido ajustado. Llame a fit() primero.')
+        for column, vocabulary in self.categories_.items():
+            new_values = set(df[column].dropna().unique()).difference(vocabulary)
+            if new_values:
+                self.categories_[column] = sorted(set(vocabulary).union(new_values))
+        self._update_feature_names()
+        return self
+
+    def get_schema(self):
+        """
+        Devuelve el esquema aprendido en un formato serializable a JSON.
+
+        Returns:
+            dict: Objetivo, columna de área, columnas numéricas, vocabularios
+                con el dtype de cada uno y orden final de las columnas
+
+        Raises:
+            RuntimeError: Si el preprocesador no ha sido ajustado
+        """
+        if not self.is_fitted:
+            raise RuntimeError('El preprocesador no ha sido ajustado. Llame a fit() primero.')
+        categories, category_dtypes = {}, {}
+        for column, vocabulary in self.categories_.items():
+            categories[column], category_dtypes[column] = _vocabulary_to_json(vocabulary)
+        return {
+            'target': self.target,
+            'area_column': self.area_column,
+            'numeric_columns': list(self.numeric_columns_),
+            'categories': categories,
+            'category_dtypes': category_dtypes,
+            'feature_names': list(self.feature_names_),
+        }
+
+    @classmethod
+    def from_schema(cls, schema):
+        """
+        Reconstruye un preprocesador ajustado a partir de un esquema guardado.
+
+        Args:
+            schema (dict): Esquema devuelto por get_schema()
+
+        Returns:
+            HousingPreprocessor: Preprocesador listo para transform()
+
+        Raises:
+            ValueError: Si el orden de columnas guardado no corresponde al esquema
+        """
+        preprocessor = cls(target=schema['target'], area_column=schema['area_column'])
+        preprocessor.numeric_columns_ = list(schema['numeric_columns'])
+        preprocessor.categories_ = {
+            column: _vocabulary_from_json(vocabulary, schema['category_dtypes'][column])
+            for column, vocabulary in schema['categories'].items()
+        }
+        preprocessor._update_feature_names()
+        if preprocessor.feature_names_ != schema['feature_names']:
+            raise ValueError('El orden de columnas guardado no coincide con el esquema.')
+        return preprocessor
+
+    def _update_feature_names(self):
+        """Recalcula el orden final de columnas a partir del esquema aprendido."""
+        self.feature_names_ = self.numeric_columns_ + ['area_miles'] + [
+            f'{column}_{category}'
+            for column, vocabulary in self.categories_.items()
+            for category in vocabulary[1:]
+        ]
+
+    def transform(self, df, out=None):
+        """
+        Codifica un lote en una matriz float64 con el orden de columnas aprendido.
+
+        Las categorías desconocidas o nulas se codifican como la categoría de
+        referencia (todas las columnas dummy en cero).
+
+        Args:
+            df (pandas.DataFrame): Lote con las mismas columnas usadas en ``fit``
+                (la columna objetivo es opcional)
+            out (numpy.ndarray, optional): Matriz preasignada de forma
+                (len(df), len(feature_names_)) donde escribir el resultado
+
+        Returns:
+            numpy.ndarray: Matriz de características de forma (n_filas, n_columnas)
+
+        Raises:
+            RuntimeError: Si el preprocesador no ha sido ajustado
+            KeyError: Si el lote no contiene alguna de las columnas requeridas
+            ValueError: Si ``out`` no tiene la forma esperada
+        """
+        if not self.is_fitted:
+            raise RuntimeError('El preprocesador no ha sido ajustado. Llame a fit() primero.')
+
+        shape = (len(df), len(self.feature_names_))
+        if out is None:
+            # Orden Fortran: cada columna es contigua en memoria
+            out = np.empty(shape, dtype=np.float64, order='F')
+        elif out.shape != shape:
+            raise ValueError(f'La matriz de salida debe tener forma {shape}, no {out.shape}')
+
+        position = 0
+        for column in self.numeric_columns_:
+            out[:, position] = df[column].to_numpy()
+            position += 1
+
+        area_position = self.numeric_columns_.index(self.area_column)
+        np.divide(out[:, area_position], 1000.0, out=out[:, position])
+        position += 1
+
+        for column, vocabulary in self.categories_.items():
+            codes = pd.Index(vocabulary).get_indexer(df[column])
+            for code in range(1, len(vocabulary)):
+                np.equal(codes, code, out=out[:, position])
+                position += 1
+
+        return out
+
+    def fit_transform(self, df):
+        """
+        Combina fit y transform en una sola operación.
+
+        Args:
+            df (pandas.DataFrame): DataFrame de referencia
+
+        Returns:
+            numpy.ndarray: Matriz de características de df
+        """
+        return self.fit(df).transform(df)
@@ -0,0 +1,335 @@
+import argparse
+import io
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from pipeline import DataPipeline
+
+
+class LatencyStats:
+    """
+    Registro de latencias y rendimiento del servicio de predicción.
+
+    Guarda las últimas ``window`` latencias para calcular percentiles y
+    contadores globales de solicitudes, filas y lotes. Es seguro usarlo
+    desde varios hilos.
+
+    Attributes:
+        requests (int): Solicitudes atendidas
+        rows (int): Filas predichas
+        batches (int): Llamadas a predict realizadas
+    """
+
+    def __init__(self, window=10_000):
+        """
+        Inicializa los contadores.
+
+        Args:
+            window (int): Número de latencias recientes que se conservan
+        """
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self._latencies = deque(maxlen=window)
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record_request(self, latency, rows):
+        """
+        Registra una solicitud atendida.
+
+        Args:
+            latency (float): Latencia de la solicitud en segundos
+            rows (int): Número de filas predichas en la solicitud
+        """
+        with self._lock:
+            self.requests += 1
+            self.rows += rows
+            self._latencies.append(latency)
+
+    def record_batch(self):
+        """Registra una llamada vectorizada a predict."""
+        with self._lock:
+            self.batches += 1
+
+    def snapshot(self):
+        """
+        Devuelve las métricas actuales.
+
+        Returns:
+            dict: Solicitudes, filas, lotes, filas por segundo y latencias p50/p99 en ms
+        """
+        with self._lock:
+            latencies = np.array(self._latencies)
+            requests, rows, batches = self.requests, self.rows, self.batches
+        elapsed = time.perf_counter() - self._started
+        p50, p99 = (np.percentile(latencies, [50, 99]) * 1000) if latencies.size else (None, None)
+        return {
+            'requests': requests,
+            'rows': rows,
+            'batches': batches,
+            'rows_per_second': rows / elapsed if elapsed > 0 else 0.0,
+            'latency_p50_ms': None if p50 is None else float(p50),
+            'latency_p99_ms': None if p99 is None else float(p99),
+        }
+
+
+class MicroBatcher:
+    """
+    Agrupa predicciones individuales concurrentes en una sola llamada vectorizada.
+
+    Un hilo de fondo toma la primera solicitud pendiente y espera como máximo
+    ``max_latency_ms`` (o hasta reunir ``max_batch_size`` filas) antes de
+    construir un único DataFrame y llamar una vez a ``DataPipeline.predict``.
+
+    Attributes:
+        pipeline (DataPipeline): Pipeline ajustado usado para predecir
+        max_batch_size (int): Máximo de filas por lote
+        max_latency (float): Espera máxima en segundos para completar un lote
+    """
+
+    def __init__(self, pipeline, stats, max_batch_size=64, max_latency_ms=2.0):
+        """
+        Inicia el hilo de agrupamiento.
+
+        Args:
+            pipeline (DataPipeline): Pipeline ajustado
+            stats (LatencyStats): Registro donde contar los lotes
+            max_batch_size (int): Máximo de filas por lote
+            max_latency_ms (float): Ventana de espera en milisegundos
+        """
+        self.pipeline = pipeline
+        self.stats = stats
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def running(self):
+        """bool: True si el hilo de agrupamiento sigue aceptando solicitudes."""
+        return not self._closed and self._thread.is_alive()
+
+    def submit(self, record):
+        """
+        Encola una vivienda para predecir.
+
+        Args:
+            record (dict): Columnas originales de una vivienda
+
+        Returns:
+            concurrent.futures.Future: Futuro con el precio predicho; si se
+                cancela antes de formar el lote, la vivienda no se predice
+        """
+        future = Future()
+        self._queue.put((record, future))
+        return future
+
+    def close(self):
+        """Detiene el hilo de agrupamiento."""
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._predict(batch)
+                    return
+                batch.append(item)
+            self._predict(batch)
+
+    def _predict(self, batch):
+        # Las solicitudes que vencieron (futuro cancelado) ya recibieron su respuesta
+        batch = [(record, future) for record, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        records = [record for record, _ in batch]
+        try:
+            predictions = self.pipeline.predict(pd.DataFrame.from_records(records))
+        except Exception:
+            # Un registro inválido no debe hacer fallar al resto del lote
+            for record, future in batch:
+                try:
+                    future.set_result(float(self.pipeline.predict(pd.DataFrame.from_records([record]))[0]))
+                except Exception as error:
+                    future.set_exception(error)
+            return
+        self.stats.record_batch()
+        for (_, future), prediction in zip(batch, predictions):
+            future.set_result(float(prediction))
+
+
+def _parse_payload(body, content_type):
+    """
+    Interpreta y valida el cuerpo de una solicitud a /predict.
+
+    Args:
+        body (bytes): Cuerpo de la solicitud
+        content_type (str): Encabezado Content-Type
+
+    Returns:
+        dict | pandas.DataFrame: Un registro (una vivienda) o un lote
+
+    Raises:
+        ValueError: Si el cuerpo no es un CSV válido, un objeto JSON con
+            valores escalares o una lista no vacía de esos objetos
+    """
+    if 'csv' in content_type:
+        return pd.read_csv(io.BytesIO(body))
+    payload = json.loads(body)
+    records = [payload] if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records:
+        raise ValueError('se esperaba un objeto JSON o una lista no vacía de objetos')
+    for position, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f'el elemento {position} no es un objeto JSON')
+        for column, value in record.items():
+            if isinstance(value, (dict, list)):
+                raise ValueError(f"el valor de '{column}' en el elemento {position} no es escalar")
+    return payload if isinstance(payload, dict) else pd.DataFrame.from_records(records)
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    Manejador HTTP del servicio de predicción.
+
+    Rutas:
+        POST /predict: un objeto JSON (una vivienda, agrupada con otras
+            solicitudes concurrentes), una lista JSON o un CSV (lote).
+            Responde 400 si la solicitud es inválida, 503 si el agrupador
+            está detenido, 504 si la predicción no termina dentro de
+            ``request_timeout`` y 500 ante cualquier otro error
+        GET /metrics: rendimiento y latencias p50/p99
+        GET /health: estado del servicio
+    """
+
+    def do_GET(self):
+        """Atiende /metrics y /health."""
+        if self.path == '/metrics':
+            self._send_json(200, self.server.stats.snapshot())
+        elif self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': f'Ruta no encontrada: {self.path}'})
+
+    def do_POST(self):
+        """Atiende /predict con una vivienda o un lote JSON/CSV."""
+        if self.path != '/predict':
+            self._send_json(404, {'error': f'Ruta no encontrada: {self.path}'})
+            return
+        start = time.perf_counter()
+        try:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            payload = _parse_payload(body, self.headers.get('Content-Type', ''))
+            if isinstance(payload, dict):
+                if not self.server.batcher.running:
+                    self._send_json(503, {'error': 'El servicio de predicción no está disponible'})
+                    return
+                future = self.server.batcher.submit(payload)
+                try:
+                    response = {'prediction': future.result(timeout=self.server.request_timeout)}
+                except FutureTimeoutError:
+                    future.cancel()
+                    self._send_json(504, {'error': 'La predicción no terminó a tiempo'})
+                    return
+                rows = 1
+            else:
+                predictions = self.server.pipeline.predict(payload)
+                self.server.stats.record_batch()
+                response = {'predictions': predictions.tolist()}
+                rows = len(payload)
+        except (KeyError, ValueError, TypeError) as error:
+            self._send_json(400, {'error': f'Solicitud inválida: {error}'})
+            return
+        except Exception as error:
+            # Cualquier otro fallo del modelo o del agrupador se responde en vez de cortar la conexión
+            self._send_json(500, {'error': f'Error interno: {type(error).__name__}: {error}'})
+            return
+        self.server.stats.record_request(time.perf_counter() - start, rows)
+        self._send_json(200, response)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Silencia el registro por solicitud (las métricas están en /metrics)."""
+
+
+def make_server(pipeline, host='127.0.0.1', port=8000, max_batch_size=64, max_latency_ms=2.0,
+                request_timeout=30.0):
+    """
+    Crea el servidor HTTP de predicción para un pipeline ajustado.
+
+    Args:
+        pipeline (DataPipeline): Pipeline con preprocesador y modelo cargados
+        host (str): Dirección de escucha
+        port (int): Puerto (0 para elegir uno libre)
+        max_batch_size (int): Máximo de filas por micro-lote
+        max_latency_ms (float): Ventana de espera de cada micro-lote
+        request_timeout (float): Segundos que una solicitud individual espera
+            su predicción antes de responder 504
+
+    Returns:
+        ThreadingHTTPServer: Servidor listo para serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), ScoringRequestHandler)
+    server.daemon_threads = True
+    server.pipeline = pipeline
+    server.request_timeout = request_timeout
+    server.stats = LatencyStats()
+    server.batcher = MicroBatcher(pipeline, server.stats, max_batch_size, max_latency_ms)
+    return server
+
+
+def main():
+    """Punto de entrada: carga un artefacto guardado con DataPipeline.save y lo sirve."""
+    parser = argparse.ArgumentParser(description='Servicio HTTP de predicción de precios de viviendas')
+    parser.add_argument('artifact', help='Directorio del artefacto creado con DataPipeline.save()')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-latency-ms', type=float, default=2.0)
+    parser.add_argument('--request-timeout', type=float, default=30.0)
+    args = parser.parse_args()
+
+    server = make_server(DataPipeline.load(args.artifact), args.host, args.port,
+                         args.max_batch_size, args.max_latency_ms, args.request_timeout)
+    print(f'Servidor de predicción escuchando en http://{args.host}:{server.server_address[1]}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.batcher.close()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
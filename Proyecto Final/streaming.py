@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_csv_chunks(path, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """
+    Lee un CSV por bloques de tamaño acotado.
+
+    Solo un bloque vive en memoria a la vez, de modo que el uso máximo de
+    memoria depende de ``chunksize`` y no del tamaño del archivo.
+
+    Args:
+        path (str): Ruta del archivo CSV
+        chunksize (int): Número máximo de filas por bloque
+        usecols (list, optional): Columnas a leer (por defecto todas)
+
+    Returns:
+        generator: Generador de pandas.DataFrame con a lo sumo chunksize filas
+    """
+    with pd.read_csv(path, chunksize=chunksize, usecols=usecols) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+def iter_preprocessed(chunks, preprocessor):
+    """
+    Aplica un preprocesador ya ajustado a cada bloque de un flujo.
+
+    La matriz de salida se reutiliza entre bloques, así que cada (X, y)
+    entregado solo es válido hasta pedir el siguiente bloque.
+
+    Args:
+        chunks (iterable): Bloques de pandas.DataFrame
+        preprocessor (HousingPreprocessor): Preprocesador ajustado
+
+    Returns:
+        generator: Generador de tuplas (X, y) con X numpy.ndarray y y
+            numpy.ndarray (o None si el bloque no tiene columna objetivo)
+    """
+    buffer = None
+    for chunk in chunks:
+        n_rows = len(chunk)
+        if buffer is None or buffer.shape[0] < n_rows:
+            buffer = np.empty((n_rows, len(preprocessor.feature_names_)), dtype=np.float64, order='F')
+        X = preprocessor.transform(chunk, out=buffer[:n_rows])
+        target = preprocessor.target
+        y = chunk[target].to_numpy(dtype=np.float64) if target in chunk.columns else None
+        yield X, y
+
+
+def fit_preprocessor_from_csv(preprocessor, path, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Ajusta un preprocesador recorriendo un CSV por bloques.
+
+    El primer bloque determina qué columnas son numéricas y cuáles
+    categóricas; el resto del archivo se lee solo para las columnas
+    categóricas, acumulando la unión de sus vocabularios.
+
+    Args:
+        preprocessor (HousingPreprocessor): Preprocesador a ajustar
+        path (str): Ruta del archivo CSV
+        chunksize (int): Número máximo de filas por bloque
+
+    Returns:
+        HousingPreprocessor: El preprocesador ajustado
+    """
+    chunks = iter_csv_chunks(path, chunksize)
+    preprocessor.fit(next(chunks))
+    chunks.close()
+
+    categorical_columns = list(preprocessor.categories_)
+    if categorical_columns:
+        for chunk in iter_csv_chunks(path, chunksize, usecols=categorical_columns):
+            preprocessor.partial_fit(chunk)
+    return preprocessor
+
+
+class RegressionMetrics:
+    """
+    Acumulador incremental de MSE y R².
+
+    Mantiene el número de filas, la media y la suma de cuadrados centrada del
+    objetivo (combinadas con la fórmula paralela de Chan) y la suma de errores
+    al cuadrado, de modo que el resultado coincide con ``mean_squared_error`` y
+    ``r2_score`` calculados sobre todos los datos en memoria.
+
+    Attributes:
+        n (int): Filas acumuladas
+        mean_y (float): Media del objetivo
+        m2_y (float): Suma de cuadrados centrada del objetivo
+        sse (float): Suma de errores al cuadrado
+    """
+
+    def __init__(self):
+        """
+        Inicializa un acumulador vacío.
+        """
+        self.n = 0
+        self.mean_y = 0.0
+        self.m2_y = 0.0
+        self.sse = 0.0
+
+    def update(self, y_true, y_pred):
+        """
+        Agrega un bloque de valores reales y predichos.
+
+        Args:
+            y_true (array-like): Valores reales del bloque
+            y_pred (array-like): Predicciones del bloque
+
+        Returns:
+            RegressionMetrics: La propia instancia
+        """
+        y_true = np.asarray(y_true, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64)
+        if y_true.size == 0:
+            return self
+        other = RegressionMetrics()
+        other.n = y_true.size
+        other.mean_y = float(y_true.mean())
+        other.m2_y = float(np.square(y_true - other.mean_y).sum())
+        other.sse = float(np.square(y_true - y_pred).sum())
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Combina los resultados parciales de otro acumulador.
+
+        Args:
+            other (RegressionMetrics): Acumulador de otro bloque o proceso
+
+        Returns:
+            RegressionMetrics: La propia instancia
+        """
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean_y - self.mean_y
+        self.m2_y += other.m2_y + delta * delta * self.n * other.n / n
+        self.mean_y += delta * other.n / n
+        self.sse += other.sse
+        self.n = n
+        return self
+
+    @property
+    def mse(self):
+        """float: Error cuadrático medio acumulado."""
+        return self.sse / self.n if self.n else float('nan')
+
+    @property
+    def r2(self):
+        """float: Coeficiente de determinación acumulado."""
+        if self.n == 0 or self.m2_y == 0:
+            return float('nan')
+        return 1.0 - self.sse / self.m2_y
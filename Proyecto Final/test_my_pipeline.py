@@ -1,37 +1,29 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import numpy as np
 import pandas as pd
 from pipeline import DataPipeline
+from instrumentation import EvaluationResult, TrainResult, measure_stage
+from preprocessing import HousingPreprocessor
+from house_stats import QuantileSketch, StreamingStats, get_house_values
+from sklearn.linear_model import LinearRegression, Ridge, SGDRegressor
+from sklearn.model_selection import KFold, cross_val_score
+from sklearn.metrics import mean_squared_error, r2_score
+from scoring_server import make_server
+from streaming import fit_preprocessor_from_csv, iter_csv_chunks
 
-def get_house_values(df):
-    """
-    Función que devuelve estadísticas de los valores de las casas
-    
-    Args:
-        df: DataFrame con los datos de las casas
-        
-    Returns:
-        dict: Diccionario con estadísticas de los valores de las casas
-    """
-    if 'price' not in df.columns:
-        raise ValueError("El DataFrame debe contener una columna 'price'")
-    
-    values_stats = {
-        'max_value': df['price'].max(),
-        'min_value': df['price'].min(),
-        'mean_value': df['price'].mean(),
-        'median_value': df['price'].median(),
-        'std_value': df['price'].std(),
-        'total_houses': len(df),
-        'max_value_house_index': df['price'].idxmax(),
-        'min_value_house_index': df['price'].idxmin()
-    }
-    
-    return values_stats
-
+HOUSING_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Housing.csv')
 
 def test_most_valued_house_real_data():
     # Use the first 40 rows from the real Housing.csv
-    df = pd.read_csv('/content/UCG_IAC508/Proyecto Final/Housing.csv').head(40)
+    df = pd.read_csv(HOUSING_CSV).head(40)
     pipeline = DataPipeline()
     X, y = pipeline.preprocess(df)
     idx_max = y.idxmax()
@@ -44,10 +36,398 @@ def test_most_valued_house_real_data():
     assert y[idx_max] == 13300000
     assert abs(area_miles - 7.42) < 1e-2
 
+
+def test_preprocess_matches_get_dummies():
+    """El preprocesador vectorizado reproduce la salida original con get_dummies"""
+    df = pd.read_csv(HOUSING_CSV)
+    expected = df.copy()
+    expected['area_miles'] = expected['area'] / 1000
+    expected = pd.get_dummies(expected, drop_first=True).drop('price', axis=1)
+
+    X, y = DataPipeline().preprocess(df)
+
+    assert list(X.columns) == list(expected.columns)
+    np.testing.assert_allclose(X.to_numpy(), expected.to_numpy(dtype=float))
+    assert y.equals(df['price'])
+
+
+def test_preprocess_schema_is_frozen_between_batches():
+    """Un lote con menos categorías conserva las columnas aprendidas en el ajuste"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X_full, _ = pipeline.preprocess(df)
+
+    batch = df[df['furnishingstatus'] == 'unfurnished'].head(5).drop(columns='price')
+    X_batch, y_batch = pipeline.preprocess(batch)
+
+    assert y_batch is None
+    assert list(X_batch.columns) == list(X_full.columns)
+    assert (X_batch['furnishingstatus_unfurnished'] == 1).all()
+    assert (X_batch['furnishingstatus_semi-furnished'] == 0).all()
+
+
+def test_preprocessor_requires_fit():
+    """transform sin fit previo debe fallar de forma explícita"""
+    df = pd.read_csv(HOUSING_CSV).head(3)
+    with pytest.raises(RuntimeError):
+        HousingPreprocessor().transform(df)
+
+def test_fit_preprocessor_from_csv_matches_full_fit(tmp_path):
+    """El esquema aprendido por bloques es el mismo que con el archivo completo"""
+    df = pd.read_csv(HOUSING_CSV).sort_values('furnishingstatus')
+    path = tmp_path / 'housing_sorted.csv'
+    df.to_csv(path, index=False)
+
+    streamed = fit_preprocessor_from_csv(HousingPreprocessor(), path, chunksize=50)
+    full = HousingPreprocessor().fit(df)
+
+    assert streamed.feature_names_ == full.feature_names_
+
+
+def test_evaluate_streaming_matches_in_memory_metrics(capsys):
+    """Las métricas incrementales coinciden con las calculadas en memoria"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.model = LinearRegression().fit(X, y)
+
+    events = []
+    pipeline.add_hook(events.append)
+    metrics = pipeline.evaluate_streaming(HOUSING_CSV, chunksize=64)
+    y_pred = pipeline.model.predict(X)
+
+    assert isinstance(metrics, EvaluationResult)
+    assert metrics.n_rows == len(df)
+    assert metrics.mse == pytest.approx(mean_squared_error(y, y_pred))
+    assert metrics.r2 == pytest.approx(r2_score(y, y_pred))
+    assert [stage.stage for stage in metrics.stages] == ['preprocess', 'predict', 'metrics']
+    assert all(stage.rows == len(df) for stage in metrics.stages)
+    assert events == metrics.stages
+
+
+def test_train_streaming_uses_partial_fit_per_chunk(capsys):
+    """El entrenamiento por bloques llama a partial_fit una vez por bloque"""
+    class RecordingModel:
+        def __init__(self):
+            self.rows = []
+
+        def partial_fit(self, X, y):
+            self.rows.append(X.shape[0])
+            return self
+
+    model = RecordingModel()
+    pipeline = DataPipeline()
+    result = pipeline.train_streaming(HOUSING_CSV, model, chunksize=100, epochs=2)
+
+    assert pipeline.model is model
+    assert model.rows == [100] * 5 + [45] + [100] * 5 + [45]
+    assert isinstance(result, TrainResult) and result.n_train == 545 and result.n_test == 0
+    assert [(stage.stage, stage.rows) for stage in result.stages] == [
+        ('schema', 545), ('preprocess', 1090), ('fit', 1090)]
+    assert all(stage.peak_memory_bytes is None and stage.process_peak_rss_bytes > 0 for stage in result.stages)
+    with pytest.raises(TypeError):
+        pipeline.train_streaming(HOUSING_CSV, object())
+
+
+def test_streaming_requires_target_column(tmp_path, capsys):
+    """Un CSV sin columna objetivo se rechaza antes de entrenar o evaluar por bloques"""
+    path = tmp_path / 'sin_precio.csv'
+    pd.read_csv(HOUSING_CSV).drop(columns='price').to_csv(path, index=False)
+    pipeline = DataPipeline()
+
+    with pytest.raises(ValueError, match='price'):
+        pipeline.train_streaming(str(path), SGDRegressor())
+    pipeline.model = LinearRegression()
+    with pytest.raises(ValueError, match='price'):
+        pipeline.evaluate_streaming(str(path))
+
+
+def test_cross_validate_parallel_matches_sklearn():
+    """La validación cruzada en paralelo coincide con cross_val_score de sklearn"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+
+    table = pipeline.cross_validate(X, y, [LinearRegression(), Ridge()],
+                                    param_grid={'Ridge': {'alpha': [0.1, 10.0]}},
+                                    n_splits=3, n_jobs=2)
+
+    assert len(table) == 3
+    assert set(table['model']) == {'LinearRegression', 'Ridge'}
+    assert table['mean_r2'].is_monotonic_decreasing
+    expected = cross_val_score(LinearRegression(), X.to_numpy(), y.to_numpy(), scoring='r2',
+                               cv=KFold(3, shuffle=True, random_state=42))
+    linear = table[table['model'] == 'LinearRegression'].iloc[0]
+    assert linear['mean_r2'] == pytest.approx(expected.mean())
+
+
+def test_cross_validate_keeps_repeated_estimator_classes():
+    """Estimadores de la misma clase se evalúan como candidatos distintos"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+
+    table = pipeline.cross_validate(X, y, [Ridge(alpha=1.0), Ridge(alpha=1000.0), ('lineal', LinearRegression())],
+                                    n_splits=3, n_jobs=2)
+
+    assert set(table['model']) == {'Ridge_1', 'Ridge_2', 'lineal'}
+    for name, model in [('Ridge_1', Ridge(alpha=1.0)), ('Ridge_2', Ridge(alpha=1000.0))]:
+        expected = cross_val_score(model, X.to_numpy(), y.to_numpy(), scoring='r2',
+                                   cv=KFold(3, shuffle=True, random_state=42))
+        assert table.loc[table['model'] == name, 'mean_r2'].iloc[0] == pytest.approx(expected.mean())
+
+
+def test_cross_validate_class_grid_applies_to_numbered_estimators():
+    """Una rejilla con el nombre de la clase se aplica a Ridge_1 y Ridge_2, y una clave desconocida falla"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+
+    table = pipeline.cross_validate(X, y, [Ridge(), Ridge(fit_intercept=False), LinearRegression()],
+                                    param_grid={'Ridge': {'alpha': [0.1, 10.0]}}, n_splits=3, n_jobs=1)
+
+    assert sorted(table['model']) == ['LinearRegression', 'Ridge_1', 'Ridge_1', 'Ridge_2', 'Ridge_2']
+    assert sorted(params['alpha'] for params in table.loc[table['model'] == 'Ridge_2', 'params']) == [0.1, 10.0]
+    with pytest.raises(KeyError, match='Lasso'):
+        pipeline.cross_validate(X, y, [Ridge()], param_grid={'Lasso': {'alpha': [1.0]}}, n_splits=3)
+
+
+def test_save_and_load_pipeline(tmp_path, capsys):
+    """Un pipeline guardado se carga sin reentrenar y predice igual"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    schema_hash = pipeline.save(tmp_path / 'artifact')
+
+    loaded = DataPipeline.load(tmp_path / 'artifact', expected_schema_hash=schema_hash)
+    X_loaded, _ = loaded.preprocess(df.head(10))
+
+    assert list(X_loaded.columns) == list(X.columns)
+    np.testing.assert_allclose(loaded.model.predict(X_loaded), pipeline.model.predict(X.head(10)))
+    with pytest.raises(ValueError):
+        DataPipeline.load(tmp_path / 'artifact', expected_schema_hash='0' * 64)
+
+
+def test_load_rejects_tampered_artifact(tmp_path, capsys):
+    """Un manifiesto cuyo esquema no coincide con su hash se rechaza"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    pipeline.save(tmp_path)
+
+    manifest_path = tmp_path / 'manifest.json'
+    manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    manifest['schema']['categories']['mainroad'].append('maybe')
+    manifest_path.write_text(json.dumps(manifest), encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        DataPipeline.load(tmp_path)
+
+
+def test_load_rejects_replaced_model(tmp_path, capsys):
+    """Un model.joblib que no coincide con el hash del manifiesto se rechaza"""
+    import joblib
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    pipeline.save(tmp_path)
+    joblib.dump(Ridge().fit(X, y), tmp_path / 'model.joblib')
+
+    with pytest.raises(ValueError, match='hash'):
+        DataPipeline.load(tmp_path)
+
+
+def test_saved_schema_keeps_non_string_categories(tmp_path, capsys):
+    """Las categorías no textuales conservan su tipo al guardar y cargar el artefacto"""
+    df = pd.read_csv(HOUSING_CSV)
+    df['stories'] = pd.Categorical(df['stories'])
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    pipeline.save(tmp_path)
+
+    loaded = DataPipeline.load(tmp_path)
+    X_loaded, _ = loaded.preprocess(df)
+
+    assert loaded.preprocessor.categories_['stories'] == [1, 2, 3, 4]
+    assert 'stories_4' in X_loaded.columns
+    np.testing.assert_allclose(X_loaded.to_numpy(), X.to_numpy())
+
+
+def test_scoring_server_single_and_batch_predictions(capsys):
+    """El servidor agrupa solicitudes individuales y acepta lotes JSON/CSV"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    expected = pipeline.predict(df.head(20))
+
+    server = make_server(pipeline, port=0, max_batch_size=8, max_latency_ms=20)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    def post(body, content_type='application/json'):
+        request = urllib.request.Request(f'{url}/predict', data=body, headers={'Content-Type': content_type})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    try:
+        records = df.head(20).drop(columns='price').to_dict('records')
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            singles = list(executor.map(lambda record: post(json.dumps(record).encode())['prediction'], records))
+        from_json = post(json.dumps(records).encode())['predictions']
+        from_csv = post(df.head(20).to_csv(index=False).encode(), 'text/csv')['predictions']
+        with urllib.request.urlopen(f'{url}/metrics') as response:
+            metrics = json.loads(response.read())
+    finally:
+        server.shutdown()
+        server.batcher.close()
+        server.server_close()
+
+    np.testing.assert_allclose(singles, expected)
+    np.testing.assert_allclose(from_json, expected)
+    np.testing.assert_allclose(from_csv, expected)
+    assert metrics['requests'] == 22
+    assert metrics['rows'] == 60
+    assert metrics['batches'] < 22
+    assert metrics['latency_p99_ms'] >= metrics['latency_p50_ms'] > 0
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'{"area": ', 'Expecting value'),
+    (b'5', 'lista no vacía'),
+    (b'null', 'lista no vacía'),
+    (b'[]', 'lista no vacía'),
+    (b'[1, 2]', 'elemento 0 no es un objeto'),
+    (b'[{"area": 1}, ["a"]]', 'elemento 1 no es un objeto'),
+    (b'[{"area": {"m2": 1}}]', "'area' en el elemento 0 no es escalar"),
+    (b'{"area": [1, 2]}', "'area' en el elemento 0 no es escalar"),
+])
+def test_scoring_server_rejects_malformed_payloads(body, message, capsys):
+    """Un cuerpo JSON con forma inválida se responde con 400 y no con un error interno"""
+    df = pd.read_csv(HOUSING_CSV)
+    pipeline = DataPipeline()
+    X, y = pipeline.preprocess(df)
+    pipeline.train(X, y, LinearRegression())
+    server = make_server(pipeline, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    request = urllib.request.Request(f'http://127.0.0.1:{server.server_address[1]}/predict', data=body,
+                                     headers={'Content-Type': 'application/json'})
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request, timeout=5)
+    finally:
+        server.shutdown()
+        server.batcher.close()
+        server.server_close()
+
+    assert error.value.code == 400
+    assert message in json.loads(error.value.read())['error']
+
+
+class _FailingPipeline:
+    """Pipeline de prueba cuya predicción falla o tarda más que el límite del servidor"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+
+    def predict(self, df):
+        if self.delay:
+            threading.Event().wait(self.delay)
+            return np.zeros(len(df))
+        raise RuntimeError('modelo no disponible')
+
+
+@pytest.mark.parametrize('pipeline, body, status', [
+    (_FailingPipeline(), b'[{"area": 1}]', 500),
+    (_FailingPipeline(), b'{"area": 1}', 500),
+    (_FailingPipeline(delay=1.0), b'{"area": 1}', 504),
+])
+def test_scoring_server_reports_internal_errors_and_timeouts(pipeline, body, status):
+    """Un fallo inesperado del modelo responde 500 y una predicción lenta responde 504 en vez de colgar"""
+    server = make_server(pipeline, port=0, request_timeout=0.1)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/predict'
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(urllib.request.Request(url, data=body), timeout=5)
+        server.batcher.close()
+        server.batcher._thread.join(timeout=5)
+        with pytest.raises(urllib.error.HTTPError) as closed:
+            urllib.request.urlopen(urllib.request.Request(url, data=b'{"area": 1}'), timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert error.value.code == status
+    assert json.loads(error.value.read())['error']
+    assert closed.value.code == 503
+
+
+def test_train_and_evaluate_return_results_and_notify_hooks(capsys):
+    """train/evaluate devuelven resultados estructurados y emiten cada etapa a los hooks"""
+    df = pd.read_csv(HOUSING_CSV)
+    events = []
+    pipeline = DataPipeline(hooks=[events.append])
+    X, y = pipeline.preprocess(df)
+    trained = pipeline.train(X, y, LinearRegression())
+    evaluated = pipeline.evaluate(X, y)
+
+    assert isinstance(trained, TrainResult)
+    assert (trained.n_train, trained.n_test) == (436, 109)
+    assert [stage.stage for stage in trained.stages] == ['split', 'fit', 'predict']
+    assert isinstance(evaluated, EvaluationResult)
+    assert evaluated.n_rows == len(df)
+    assert evaluated.r2 == pytest.approx(r2_score(y, pipeline.model.predict(X)))
+    assert [event.stage for event in events] == ['preprocess', 'split', 'fit', 'predict', 'predict', 'metrics']
+    assert all(event.wall_time >= 0 and event.rows_per_second > 0 for event in events)
+    assert 'MSE' in capsys.readouterr().out
+
+
+def test_nested_stages_report_peak_above_their_start():
+    """El pico de cada etapa se mide desde su inicio y una etapa anidada no borra el de la externa"""
+    import tracemalloc
+    collected = []
+    tracemalloc.start()
+    try:
+        retained = np.ones(2_000_000)
+        with measure_stage('outer', 1, collected=collected):
+            temporary = np.ones(1_000_000)
+            del temporary
+            with measure_stage('inner', 1, collected=collected):
+                small = np.ones(100_000)
+                del small
+    finally:
+        tracemalloc.stop()
+    inner, outer = collected
+
+    assert 800_000 <= inner.peak_memory_bytes < 1_000_000
+    assert 8_000_000 <= outer.peak_memory_bytes < 9_000_000
+
+
+def test_process_peak_rss_units_follow_the_platform(monkeypatch):
+    """ru_maxrss se interpreta en bytes en macOS y en KiB en Linux"""
+    import instrumentation
+    if instrumentation.resource is None:
+        pytest.skip('resource no está disponible en esta plataforma')
+
+    class Usage:
+        ru_maxrss = 2048
+
+    monkeypatch.setattr(instrumentation.resource, 'getrusage', lambda who: Usage())
+    monkeypatch.setattr(instrumentation.sys, 'platform', 'darwin')
+    assert instrumentation._process_peak_rss() == 2048
+    monkeypatch.setattr(instrumentation.sys, 'platform', 'linux')
+    assert instrumentation._process_peak_rss() == 2048 * 1024
+
+
 def test_get_house_values():
     """Test para la función get_house_values usando el dataset completo de Housing.csv"""
     # Cargar el dataset completo de Housing.csv
-    df = pd.read_csv('/content/UCG_IAC508/Proyecto Final/Housing.csv')
+    df = pd.read_csv(HOUSING_CSV)
     
     # Obtener estadísticas de valores
     values = get_house_values(df)
@@ -80,6 +460,66 @@ def test_get_house_values():
     assert 'min_value_house_index' in values 
 
     
+def test_get_house_values_from_chunks_matches_full_frame():
+    """Las estadísticas por bloques coinciden con las del DataFrame completo"""
+    df = pd.read_csv(HOUSING_CSV)
+    full = get_house_values(df)
+    streamed = get_house_values(iter_csv_chunks(HOUSING_CSV, chunksize=100))
+
+    assert streamed['total_houses'] == full['total_houses']
+    assert streamed['max_value_house_index'] == df['price'].idxmax()
+    assert streamed['min_value_house_index'] == df['price'].idxmin()
+    assert streamed['median_value'] == df['price'].median()
+    assert streamed['mean_value'] == pytest.approx(df['price'].mean())
+    assert streamed['std_value'] == pytest.approx(df['price'].std())
+
+
+def test_get_house_values_median_is_exact_for_large_frame():
+    """Con un DataFrame en memoria la mediana es exacta aunque supere la capacidad del sketch"""
+    prices = np.random.default_rng(1).lognormal(15, 0.5, size=100_000)
+    prices[::97] = np.nan
+    df = pd.DataFrame({'price': prices})
+
+    values = get_house_values(df, epsilon=0.01)
+
+    assert values['median_value'] == df['price'].median()
+    assert values['mean_value'] == pytest.approx(df['price'].mean())
+    assert values['max_value_house_index'] == df['price'].idxmax()
+    assert values['total_houses'] == len(df)
+
+
+def test_streaming_stats_merge_partial_results():
+    """Combinar acumuladores parciales equivale a un solo recorrido"""
+    prices = pd.read_csv(HOUSING_CSV)['price']
+    parts = [StreamingStats().update(prices.iloc[start:start + 150]) for start in range(0, len(prices), 150)]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.count == len(prices)
+    assert merged.mean == pytest.approx(prices.mean())
+    assert merged.std == pytest.approx(prices.std())
+    assert merged.max_index == prices.idxmax()
+    assert merged.min_index == prices.idxmin()
+    assert merged.median == prices.median()
+
+
+def test_quantile_sketch_respects_error_bound():
+    """El sketch mantiene el error de rango de la mediana dentro de epsilon"""
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    epsilon = 0.01
+    sketch = QuantileSketch(epsilon, seed=0)
+    for block in np.array_split(values, 20):
+        sketch.update(block)
+
+    ordered = np.sort(values)
+    for q in (0.01, 0.25, 0.5, 0.75, 0.99):
+        rank = np.searchsorted(ordered, sketch.quantile(q)) / values.size
+        assert abs(rank - q) <= epsilon
+    assert sketch.n == values.size
+    assert sketch.size < 3 * sketch.k
+
+
 def test_docstrings_presence():
     """Test para verificar que todos los métodos de DataPipeline tienen docstrings"""
     pipeline = DataPipeline()
@@ -155,3 +595,10 @@ def test_docstrings_completeness():
         else:
             # Para __init__, solo verificar que tiene documentación suficiente
             assert len(doc) > 50, f"El método {method_name} debe tener documentación más detallada"
+
+def test_pipeline_import_is_lazy():
+    # Importar el pipeline no debe cargar sklearn: se importa al entrenar o evaluar
+    code = 'import sys, pipeline; print("sklearn" in sys.modules)'
+    completed = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(HOUSING_CSV),
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == 'False'
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+from typed_csv import read_typed_csv
+
+
+AI4I_URL = "https://archive.ics.uci.edu/ml/machine-learning-databases/00601/ai4i2020.csv"
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Copias locales de los datasets remotos incluidas en el repositorio
+LOCAL_MIRRORS = {
+    AI4I_URL: os.path.join(_HERE, '..', 'Tarea 1 Desafio', 'ai4i2020.csv'),
+}
+
+DEFAULT_CACHE_DIR = os.environ.get('DATASET_CACHE_DIR', os.path.join(_HERE, '.dataset_cache'))
+
+
+def _file_hash(path, cache_dir):
+    """
+    Devuelve el SHA-256 del contenido de un archivo.
+
+    El hash se memoriza en ``index.json`` usando ruta, tamaño y fecha de
+    modificación como clave, para no releer el archivo en cada arranque.
+    El índice se reescribe en un archivo temporal que luego reemplaza al
+    anterior con os.replace, de modo que otros procesos nunca leen un JSON
+    a medio escribir (si dos escriben a la vez, solo se pierde una entrada,
+    que se vuelve a calcular).
+    """
+    stat = os.stat(path)
+    key = f'{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}'
+    index_path = os.path.join(cache_dir, 'index.json')
+    index = {}
+    if os.path.exists(index_path):
+        with open(index_path, encoding='utf-8') as file:
+            index = json.load(file)
+    if key not in index:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                digest.update(block)
+        index[key] = digest.hexdigest()
+        descriptor, temporary = tempfile.mkstemp(prefix='.index_', suffix='.json', dir=cache_dir)
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+            json.dump(index, file, indent=2)
+        os.replace(temporary, index_path)
+    return index[key]
+
+
+def _resolve_source(source, cache_dir, mirror):
+    """Devuelve una ruta local para la fuente: archivo, espejo local o descarga única."""
+    if os.path.exists(source):
+        return source
+    mirror = mirror or LOCAL_MIRRORS.get(source)
+    if mirror and os.path.exists(mirror):
+        return mirror
+    downloads = os.path.join(cache_dir, 'downloads')
+    os.makedirs(downloads, exist_ok=True)
+    target = os.path.join(downloads, hashlib.sha256(source.encode('utf-8')).hexdigest()[:16] + '.csv')
+    if not os.path.exists(target):
+        temporary = f'{target}.tmp'
+        urllib.request.urlretrieve(source, temporary)
+        os.replace(temporary, target)
+    return target
+
+
+def _write_columnar(csv_path, target_dir, schema, read_csv_kwargs):
+    """Convierte un CSV en un directorio con un .npy por columna y un meta.json."""
+    if schema is not None:
+        df = read_typed_csv(csv_path, schema, **read_csv_kwargs)
+    else:
+        df = pd.read_csv(csv_path, **read_csv_kwargs)
+    staging = tempfile.mkdtemp(prefix='.staging_', dir=os.path.dirname(target_dir))
+    columns = []
+    for position, name in enumerate(df.columns):
+        series = df[name]
+        if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            np.save(os.path.join(staging, f'{position}.npy'), series.to_numpy())
+            columns.append({'name': name, 'kind': 'numeric'})
+        else:
+            categorical = pd.Categorical(series)
+            np.save(os.path.join(staging, f'{position}.npy'), categorical.codes)
+            columns.append({'name': name, 'kind': 'categorical',
+                            'categories': [str(category) for category in categorical.categories]})
+    with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as file:
+        json.dump({'n_rows': len(df), 'columns': columns}, file, ensure_ascii=False)
+    try:
+        os.replace(staging, target_dir)
+    except OSError:
+        # Otro proceso escribió la misma caché en paralelo
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def dataset_hash(source, cache_dir=None, mirror=None):
+    """
+    Devuelve el SHA-256 del contenido de un dataset (local, espejo o descargado).
+
+    Args:
+        source (str): URL o ruta del CSV
+        cache_dir (str, optional): Directorio de la caché
+        mirror (str, optional): Ruta de una copia local de la URL
+
+    Returns:
+        str: Hash hexadecimal del contenido del CSV
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    return _file_hash(_resolve_source(source, cache_dir, mirror), cache_dir)
+
+
+def load_dataset(source, columns=None, cache_dir=None, mirror=None, schema=None, **read_csv_kwargs):
+    """
+    Carga un dataset CSV a través de una caché columnar local.
+
+    La primera vez el CSV (local, del espejo incluido en el repositorio o
+    descargado una sola vez) se convierte en un directorio con un archivo
+    .npy por columna, identificado por el hash del contenido. Las cargas
+    siguientes leen solo las columnas pedidas mediante memmap, sin red ni
+    parseo de texto. Las columnas de texto se guardan como categóricas.
+    Con ``schema`` la conversión usa typed_csv.read_typed_csv, de modo que
+    la caché guarda tipos reducidos (float32, int16, bool) y nombres limpios.
+
+    Args:
+        source (str): URL o ruta del CSV
+        columns (list, optional): Columnas a cargar (por defecto todas)
+        cache_dir (str, optional): Directorio de la caché (por defecto
+            DATASET_CACHE_DIR o '.dataset_cache' junto a este módulo)
+        mirror (str, optional): Ruta de una copia local de la URL
+        schema (dict, optional): Esquema declarado (ej: typed_csv.AI4I_SCHEMA)
+        **read_csv_kwargs: Argumentos para pandas.read_csv en la primera conversión
+
+    Returns:
+        pandas.DataFrame: Datos del CSV
+
+    Raises:
+        KeyError: Si alguna columna pedida no existe
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    os.makedirs(cache_dir, exist_ok=True)
+    csv_path = _resolve_source(source, cache_dir, mirror)
+    key = _file_hash(csv_path, cache_dir)
+    if read_csv_kwargs or schema is not None:
+        options = json.dumps({'schema': schema, **read_csv_kwargs}, sort_keys=True, default=str)
+        key += '-' + hashlib.sha256(options.encode('utf-8')).hexdigest()[:12]
+    dataset_dir = os.path.join(cache_dir, key)
+    if not os.path.exists(dataset_dir):
+        _write_columnar(csv_path, dataset_dir, schema, read_csv_kwargs)
+
+    with open(os.path.join(dataset_dir, 'meta.json'), encoding='utf-8') as file:
+        meta = json.load(file)
+    available = {column['name']: position for position, column in enumerate(meta['columns'])}
+    selected = list(available) if columns is None else list(columns)
+    missing = [name for name in selected if name not in available]
+    if missing:
+        raise KeyError(f'Columnas inexistentes en el dataset: {missing}')
+
+    data = {}
+    for name in selected:
+        position = available[name]
+        info = meta['columns'][position]
+        # mmap 'c': páginas compartidas de solo lectura, copia privada si se escribe
+        values = np.load(os.path.join(dataset_dir, f'{position}.npy'), mmap_mode='c')
+        if info['kind'] == 'categorical':
+            values = pd.Categorical.from_codes(values, categories=info['categories'])
+        data[name] = values
+    return pd.DataFrame(data, copy=False)
@@ -0,0 +1,196 @@
+import numpy as np
+import pandas as pd
+
+
+# Por encima de este número de puntos se dibuja una rejilla de densidad
+DENSITY_THRESHOLD = 50_000
+
+# Celdas por eje de la rejilla: fija el costo de dibujo y el tamaño de la imagen
+DEFAULT_BINS = 300
+
+CATEGORY_COLORS = ['tab:red', 'tab:blue', 'tab:green', 'tab:orange', 'tab:purple']
+
+
+def _extent(values):
+    """Devuelve (mínimo, máximo) ignorando valores no finitos."""
+    low, high = float(np.nanmin(values)), float(np.nanmax(values))
+    return (low, high) if high > low else (low - 0.5, high + 0.5)
+
+
+def _bin_index(values, low, high, bins):
+    """Índice de celda de cada valor en [low, high] dividido en ``bins`` celdas."""
+    index = ((values - low) * (bins / (high - low))).astype(np.intp)
+    # El máximo cae exactamente en el borde derecho: pertenece a la última celda
+    np.clip(index, 0, bins - 1, out=index)
+    return index
+
+
+def density_grid(x, y, bins=DEFAULT_BINS, weights=None, extent=None):
+    """
+    Agrupa puntos en una rejilla 2D de conteos (o sumas de pesos).
+
+    Equivale a numpy.histogram2d con celdas uniformes, pero calcula el
+    índice de celda directamente y acumula con numpy.bincount en una
+    sola pasada. Los puntos con x o y no finitos se descartan.
+
+    Parameters:
+    -----------
+    x, y : array-like
+        Coordenadas de los puntos
+    bins : int or tuple
+        Celdas por eje (o (celdas_x, celdas_y))
+    weights : array-like, optional
+        Peso de cada punto (por defecto 1)
+    extent : tuple, optional
+        (x_min, x_max, y_min, y_max); por defecto el rango de los datos
+
+    Returns:
+    --------
+    tuple
+        (rejilla, extent) con rejilla de forma (celdas_y, celdas_x), lista
+        para ``imshow(origin='lower')``
+    """
+    cell, valid, shape, extent = _cells(x, y, bins, extent)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)
+        weights = weights if valid is None else weights[valid]
+    grid = np.bincount(cell, weights=weights, minlength=shape[0] * shape[1])
+    return grid.reshape(shape), extent
+
+
+def _cells(x, y, bins, extent):
+    """Índice plano de celda de cada punto finito, máscara de válidos, forma y extent."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bins_x, bins_y = (bins, bins) if np.isscalar(bins) else bins
+    if extent is None:
+        extent = _extent(x) + _extent(y)
+    x_min, x_max, y_min, y_max = extent
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    if valid.all():
+        valid = None
+    else:
+        x, y = x[valid], y[valid]
+    cell = _bin_index(y, y_min, y_max, bins_y) * bins_x + _bin_index(x, x_min, x_max, bins_x)
+    return cell, valid, (bins_y, bins_x), extent
+
+
+def _categorical_image(x, y, hue, bins, extent, colors):
+    """Mezcla el color de cada categoría según su proporción en cada celda."""
+    from matplotlib.colors import to_rgb
+
+    categorical = pd.Categorical(hue)
+    colors = colors or CATEGORY_COLORS
+    palette = np.array([to_rgb(colors[code % len(colors)])
+                        for code in range(len(categorical.categories))])
+
+    # Un solo bincount sobre (celda, categoría) da los conteos de todas las categorías
+    cell, valid, shape, extent = _cells(x, y, bins, extent)
+    codes = categorical.codes if valid is None else categorical.codes[valid]
+    n_categories = len(categorical.categories)
+    keep = codes >= 0
+    per_category = np.bincount(cell[keep] * n_categories + codes[keep],
+                               minlength=shape[0] * shape[1] * n_categories)
+    per_category = per_category.reshape(shape + (n_categories,)).astype(np.float64)
+    counts = per_category.sum(axis=-1)
+    rgb = per_category @ palette
+
+    occupied = counts > 0
+    image = np.ones(counts.shape + (4,))
+    image[..., 3] = 0.0
+    image[occupied, :3] = rgb[occupied] / counts[occupied, None]
+    if occupied.any():
+        # La opacidad crece con el logaritmo del conteo
+        log_counts = np.log1p(counts[occupied])
+        image[occupied, 3] = 0.25 + 0.75 * log_counts / log_counts.max()
+    return image, categorical.categories, palette
+
+
+def plot_relationship(ax, x, y, hue=None, mode='auto', threshold=DENSITY_THRESHOLD, bins=DEFAULT_BINS,
+                      cmap=None, colors=None, **scatter_kws):
+    """
+    Dibuja la relación entre dos variables como dispersión o como rejilla de densidad.
+
+    Con pocos puntos se usa ``ax.scatter``. Por encima de ``threshold``
+    (o con mode='density') los puntos se agrupan en una rejilla de
+    ``bins`` x ``bins`` celdas que se dibuja como una sola imagen, de modo
+    que el tiempo de dibujo y el tamaño del archivo no dependen del
+    número de filas. El color de cada celda indica:
+
+    - sin ``hue``: el número de puntos (escala logarítmica)
+    - ``hue`` numérico o bool (ej: machine_failure): el promedio en la celda,
+      es decir la tasa de fallo
+    - ``hue`` categórico (ej: type): la mezcla de colores de las categorías
+
+    Parameters:
+    -----------
+    ax : matplotlib.axes.Axes
+        Ejes donde dibujar
+    x, y : array-like
+        Coordenadas de los puntos
+    hue : array-like, optional
+        Variable para colorear
+    mode : str
+        'auto', 'scatter' o 'density'
+    threshold : int
+        Número de puntos a partir del cual 'auto' usa la rejilla
+    bins : int
+        Celdas por eje de la rejilla
+    cmap : str, optional
+        Mapa de colores para conteos o promedios
+    colors : list, optional
+        Colores de las categorías cuando ``hue`` es categórico
+    **scatter_kws
+        Argumentos para ``ax.scatter`` en modo dispersión
+
+    Returns:
+    --------
+    matplotlib.artist.Artist
+        El PathCollection (dispersión) o AxesImage (densidad) dibujado
+    """
+    if mode not in ('auto', 'scatter', 'density'):
+        raise ValueError("mode debe ser 'auto', 'scatter' o 'density'")
+    is_categorical = hue is not None and (
+        isinstance(getattr(hue, 'dtype', None), pd.CategoricalDtype)
+        or not pd.api.types.is_numeric_dtype(np.asarray(hue).dtype))
+
+    if mode == 'scatter' or (mode == 'auto' and len(x) <= threshold):
+        if not is_categorical:
+            return ax.scatter(x, y, c=hue, cmap=cmap if hue is not None else None, **scatter_kws)
+        categorical = pd.Categorical(hue)
+        colors = colors or CATEGORY_COLORS
+        artist = None
+        x, y = np.asarray(x), np.asarray(y)
+        for code, category in enumerate(categorical.categories):
+            mask = categorical.codes == code
+            artist = ax.scatter(x[mask], y[mask], color=colors[code % len(colors)],
+                                label=str(category), **scatter_kws)
+        return artist
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    extent = _extent(x) + _extent(y)
+    image_kws = dict(origin='lower', extent=extent, aspect='auto', interpolation='nearest')
+
+    if is_categorical:
+        image, categories, palette = _categorical_image(x, y, hue, bins, extent, colors)
+        # Marcadores vacíos con etiqueta: ax.legend() funciona igual que en dispersión
+        for category, color in zip(categories, palette):
+            ax.scatter([], [], color=color, label=str(category))
+        return ax.imshow(image, **image_kws)
+
+    cell, valid, shape, _ = _cells(x, y, bins, extent)
+    counts = np.bincount(cell, minlength=shape[0] * shape[1]).reshape(shape)
+    if hue is None:
+        from matplotlib.colors import LogNorm
+
+        grid = np.where(counts > 0, counts, np.nan)
+        return ax.imshow(grid, cmap=cmap or 'viridis', norm=LogNorm(vmin=1), **image_kws)
+
+    hue = np.asarray(hue, dtype=np.float64)
+    sums = np.bincount(cell, weights=hue if valid is None else hue[valid],
+                       minlength=shape[0] * shape[1]).reshape(shape)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.where(counts > 0, sums / counts, np.nan)
+    return ax.imshow(means, cmap=cmap or 'RdYlBu_r', **image_kws)
@@ -0,0 +1,526 @@
+import queue
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from unit_converter import UnitConverter
+
+
+# Columnas de sensores en el orden que usa el camino vectorizado (arreglos NumPy)
+SENSOR_COLUMNS = ['type', 'air_temperature_k', 'process_temperature_k',
+                  'rotational_speed_rpm', 'torque_nm', 'tool_wear_min']
+# Etiquetas de fallo del dataset ai4i2020
+FAILURE_LABELS = ['machine_failure', 'twf', 'hdf', 'pwf', 'osf', 'rnf']
+# Calidad del producto codificada como número (L < M < H)
+TYPE_CODES = {'L': 0.0, 'M': 1.0, 'H': 2.0}
+
+FEATURE_NAMES = ['type', 'air_temperature_k', 'process_temperature_k', 'angular_speed_rad_s',
+                 'torque_nm', 'tool_wear_min', 'power_w', 'temperature_delta_k', 'wear_torque']
+
+_TYPE, _AIR, _PROCESS, _SPEED, _TORQUE, _WEAR = range(len(SENSOR_COLUMNS))
+
+
+def sensor_matrix(X):
+    """
+    Convierte lecturas de sensores en un bloque float64 con SENSOR_COLUMNS.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame or numpy.ndarray
+        DataFrame con las columnas de SENSOR_COLUMNS (el tipo como 'L', 'M'
+        o 'H') o arreglo (n_filas, 6) en ese orden con el tipo ya codificado
+
+    Returns:
+    --------
+    numpy.ndarray
+        Bloque (n_filas, 6); siempre es una copia que se puede modificar
+
+    Raises:
+    -------
+    ValueError
+        Si faltan columnas o el arreglo no tiene 6 columnas
+    """
+    if isinstance(X, pd.DataFrame):
+        missing = [column for column in SENSOR_COLUMNS if column not in X.columns]
+        if missing:
+            raise ValueError(f'Faltan columnas de sensores: {missing}')
+        block = np.empty((len(X), len(SENSOR_COLUMNS)), dtype=np.float64)
+        block[:, _TYPE] = X['type'].astype(object).map(TYPE_CODES).to_numpy(dtype=np.float64, na_value=np.nan)
+        for position, column in enumerate(SENSOR_COLUMNS[1:], start=1):
+            block[:, position] = X[column].to_numpy(dtype=np.float64)
+        return block
+
+    block = np.array(X, dtype=np.float64, ndmin=2)
+    if block.shape[1] != len(SENSOR_COLUMNS):
+        raise ValueError(f'Se esperaban {len(SENSOR_COLUMNS)} columnas ({", ".join(SENSOR_COLUMNS)})')
+    return block
+
+
+def reading_values(reading):
+    """
+    Valores de una lectura individual en el orden de SENSOR_COLUMNS.
+
+    Parameters:
+    -----------
+    reading : sequence or dict
+        Seis valores en el orden de SENSOR_COLUMNS (el tipo como código o
+        como 'L'/'M'/'H') o un dict con esas claves
+
+    Returns:
+    --------
+    list
+        Valores numéricos (un tipo desconocido se convierte en NaN)
+    """
+    if isinstance(reading, dict):
+        reading = [reading[column] for column in SENSOR_COLUMNS]
+    return [TYPE_CODES.get(value, np.nan) if isinstance(value, str) else value for value in reading]
+
+
+class FailureFeatures:
+    """
+    Características derivadas de los sensores de ai4i2020, vectorizadas.
+
+    La velocidad de rotación se convierte de rpm a rad/s con UnitConverter
+    y se agregan la potencia (torque × velocidad angular, en W), la
+    diferencia de temperatura entre el proceso y el aire (K) y el producto
+    desgaste × torque (min·Nm). Todo se calcula sobre un bloque NumPy, sin
+    construir DataFrames por fila, para poder puntuar micro-lotes.
+
+    Como UnitConverter, sigue el protocolo de transformadores de Scikit-learn
+    sin heredar de BaseEstimator, para que importar este módulo (y
+    sensor_ingestion) no cargue sklearn.
+    """
+
+    def get_params(self, deep=True):
+        """No tiene parámetros (usado por sklearn.base.clone)."""
+        return {}
+
+    def set_params(self, **params):
+        """
+        No acepta parámetros.
+
+        Raises:
+        -------
+        ValueError
+            Si se pasa algún parámetro
+        """
+        if params:
+            raise ValueError(f'Parámetros inválidos para FailureFeatures: {list(params)}')
+        return self
+
+    def set_output(self, *, transform=None):
+        """
+        Configura el contenedor de salida ('default' o 'pandas'), como en Scikit-learn.
+
+        Returns:
+        --------
+        FailureFeatures
+            La propia instancia
+
+        Raises:
+        -------
+        ValueError
+            Si el contenedor no es 'default' ni 'pandas'
+        """
+        if transform is None:
+            return self
+        if transform not in ('default', 'pandas'):
+            raise ValueError(f"transform debe ser 'default' o 'pandas', no {transform!r}")
+        self._sklearn_output_config = {'transform': transform}
+        return self
+
+    def __sklearn_tags__(self):
+        """Etiquetas de transformador para Scikit-learn (solo se llama con sklearn ya cargado)."""
+        from sklearn.utils import InputTags, Tags, TargetTags, TransformerTags
+
+        return Tags(estimator_type=None, target_tags=TargetTags(required=False),
+                    transformer_tags=TransformerTags(), input_tags=InputTags())
+
+    def __repr__(self):
+        return 'FailureFeatures()'
+
+    def fit(self, X, y=None):
+        """
+        No aprende nada: las características son fórmulas fijas.
+
+        Returns:
+        --------
+        FailureFeatures
+            La propia instancia
+        """
+        return self
+
+    def transform(self, X):
+        """
+        Calcula las características de FEATURE_NAMES.
+
+        Parameters:
+        -----------
+        X : pandas.DataFrame or numpy.ndarray
+            Lecturas de sensores (ver sensor_matrix)
+
+        Returns:
+        --------
+        numpy.ndarray
+            Matriz (n_filas, len(FEATURE_NAMES)); un DataFrame con esas
+            columnas si se configuró ``set_output(transform='pandas')``
+        """
+        block = sensor_matrix(X)
+        features = np.empty((len(block), len(FEATURE_NAMES)), dtype=np.float64)
+        features[:, :len(SENSOR_COLUMNS)] = block
+        # rpm -> rad/s directamente sobre la copia (columnas por índice en arreglos NumPy)
+        converter = UnitConverter(conversions={_SPEED: ('rpm', 'rad/s')}, copy=False, output='numpy')
+        converter.transform(features[:, :len(SENSOR_COLUMNS)])
+        np.multiply(features[:, _TORQUE], features[:, _SPEED], out=features[:, 6])
+        np.subtract(features[:, _PROCESS], features[:, _AIR], out=features[:, 7])
+        np.multiply(features[:, _WEAR], features[:, _TORQUE], out=features[:, 8])
+        if getattr(self, '_sklearn_output_config', {}).get('transform') == 'pandas':
+            index = X.index if isinstance(X, pd.DataFrame) else None
+            return pd.DataFrame(features, index=index, columns=FEATURE_NAMES)
+        return features
+
+    def fit_transform(self, X, y=None):
+        """Equivale a ``fit(X).transform(X)``."""
+        return self.fit(X, y).transform(X)
+
+    def get_feature_names_out(self, input_features=None):
+        """Nombres de las características generadas."""
+        return np.array(FEATURE_NAMES, dtype=object)
+
+
+def _default_model():
+    from sklearn.ensemble import HistGradientBoostingClassifier
+
+    return HistGradientBoostingClassifier(random_state=0)
+
+
+class FailurePredictor:
+    """
+    Predicción de fallos de máquina a partir de las lecturas de sensores.
+
+    Calcula las características con FailureFeatures una sola vez por lote y
+    entrena un clasificador por etiqueta de fallo (por defecto solo
+    'machine_failure'; se pueden agregar los modos TWF/HDF/PWF/OSF/RNF).
+    ``predict_proba`` acepta un arreglo NumPy de lecturas y no crea
+    DataFrames, de modo que puede puntuar micro-lotes de un flujo de
+    sensores (ver StreamScorer).
+    """
+
+    def __init__(self, model=None, targets=('machine_failure',), threshold=0.5):
+        """
+        Parameters:
+        -----------
+        model : sklearn classifier, optional
+            Clasificador con predict_proba (por defecto HistGradientBoostingClassifier);
+            se clona una vez por etiqueta
+        targets : sequence of str
+            Etiquetas de FAILURE_LABELS a predecir
+        threshold : float
+            Probabilidad a partir de la cual se predice fallo
+        """
+        unknown = [target for target in targets if target not in FAILURE_LABELS]
+        if unknown:
+            raise ValueError(f'Etiquetas de fallo desconocidas: {unknown}')
+        self.model = model
+        self.targets = list(targets)
+        self.threshold = threshold
+        self.features = FailureFeatures()
+        self.models_ = None
+
+    def fit(self, df):
+        """
+        Entrena un clasificador por etiqueta.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            Datos con SENSOR_COLUMNS y las etiquetas de ``targets`` (nombres limpios)
+
+        Returns:
+        --------
+        FailurePredictor
+            La propia instancia
+
+        Raises:
+        -------
+        ValueError
+            Si alguna etiqueta tiene una sola clase en los datos
+        """
+        from sklearn.base import clone
+
+        features = self.features.fit_transform(df)
+        models = {}
+        for target in self.targets:
+            y = df[target].to_numpy(dtype=bool)
+            if y.all() or not y.any():
+                raise ValueError(f"La etiqueta '{target}' tiene una sola clase en los datos de entrenamiento")
+            models[target] = clone(self.model if self.model is not None else _default_model()).fit(features, y)
+        self.models_ = models
+        return self
+
+    def predict_proba(self, X):
+        """
+        Probabilidad de fallo de cada lectura.
+
+        Parameters:
+        -----------
+        X : pandas.DataFrame or numpy.ndarray
+            Lecturas de sensores (ver sensor_matrix)
+
+        Returns:
+        --------
+        numpy.ndarray
+            Matriz (n_filas, len(targets)) con la probabilidad de cada etiqueta
+
+        Raises:
+        -------
+        RuntimeError
+            Si el modelo no fue entrenado
+        """
+        if self.models_ is None:
+            raise RuntimeError('El modelo no ha sido entrenado. Llame a fit primero.')
+        features = self.features.transform(X)
+        probabilities = np.empty((len(features), len(self.targets)), dtype=np.float64)
+        for position, target in enumerate(self.targets):
+            probabilities[:, position] = self.models_[target].predict_proba(features)[:, 1]
+        return probabilities
+
+    def predict(self, X):
+        """
+        Predice fallo (True/False) por etiqueta con el umbral configurado.
+
+        Returns:
+        --------
+        numpy.ndarray
+            Matriz booleana (n_filas, len(targets))
+        """
+        return self.predict_proba(X) >= self.threshold
+
+    def evaluate(self, df):
+        """
+        Evalúa el modelo sobre datos etiquetados.
+
+        Parameters:
+        -----------
+        df : pandas.DataFrame
+            Datos con SENSOR_COLUMNS y las etiquetas de ``targets``
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Una fila por etiqueta con roc_auc, average_precision, precision,
+            recall y f1 (estos tres con el umbral configurado)
+        """
+        from sklearn.metrics import average_precision_score, f1_score, precision_score, recall_score, roc_auc_score
+
+        probabilities = self.predict_proba(df)
+        rows = {}
+        for position, target in enumerate(self.targets):
+            y = df[target].to_numpy(dtype=bool)
+            score = probabilities[:, position]
+            predicted = score >= self.threshold
+            rows[target] = {
+                'roc_auc': roc_auc_score(y, score) if 0 < y.sum() < len(y) else np.nan,
+                'average_precision': average_precision_score(y, score) if y.any() else np.nan,
+                'precision': precision_score(y, predicted, zero_division=0),
+                'recall': recall_score(y, predicted, zero_division=0),
+                'f1': f1_score(y, predicted, zero_division=0),
+            }
+        return pd.DataFrame.from_dict(rows, orient='index')
+
+
+# Marcadores que el hilo lector de StreamScorer.score_stream pone en la cola
+_END_OF_STREAM = object()
+
+
+class _ReaderError:
+    """Error del iterable de lecturas, que se relanza en el hilo que consume el flujo."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+class StreamScorer:
+    """
+    Puntúa un flujo de lecturas en micro-lotes con latencia acotada.
+
+    Las lecturas se copian a un búfer NumPy preasignado; el lote se puntúa
+    con una sola llamada a ``FailurePredictor.predict_proba`` cuando se
+    llena (``batch_size``) o cuando la lectura más antigua lleva esperando
+    ``max_latency_ms``. El costo fijo de cada llamada al clasificador se
+    reparte entre todas las lecturas del lote.
+
+    Attributes:
+    -----------
+    rows : int
+        Lecturas puntuadas
+    batches : int
+        Llamadas a predict_proba
+    scoring_seconds : float
+        Tiempo total dentro de predict_proba
+    max_wait : float
+        Mayor tiempo (s) entre la llegada de una lectura y su puntuación
+    """
+
+    def __init__(self, predictor, batch_size=256, max_latency_ms=5.0, clock=time.perf_counter):
+        """
+        Parameters:
+        -----------
+        predictor : FailurePredictor
+            Modelo entrenado
+        batch_size : int
+            Máximo de lecturas por lote
+        max_latency_ms : float
+            Espera máxima de una lectura antes de puntuar el lote incompleto
+        clock : callable
+            Reloj en segundos (reemplazable en pruebas)
+        """
+        self.predictor = predictor
+        self.batch_size = batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.clock = clock
+        self._buffer = np.empty((batch_size, len(SENSOR_COLUMNS)), dtype=np.float64)
+        self._size = 0
+        self._oldest = None
+        self.rows = 0
+        self.batches = 0
+        self.scoring_seconds = 0.0
+        self.max_wait = 0.0
+
+    def push(self, reading):
+        """
+        Agrega una lectura al lote.
+
+        Parameters:
+        -----------
+        reading : sequence or dict
+            Seis valores en el orden de SENSOR_COLUMNS (el tipo como código o
+            como 'L'/'M'/'H') o un dict con esas claves
+
+        Returns:
+        --------
+        numpy.ndarray or None
+            Probabilidades del lote si esta lectura lo completó o venció la
+            espera; None si el lote sigue abierto
+        """
+        self._buffer[self._size] = reading_values(reading)
+        if self._size == 0:
+            self._oldest = self.clock()
+        self._size += 1
+        if self._size == self.batch_size or self.clock() - self._oldest >= self.max_latency:
+            return self.flush()
+        return None
+
+    def due(self):
+        """
+        Indica si el lote abierto ya superó la espera máxima.
+
+        Returns:
+        --------
+        bool
+            True si hay lecturas esperando desde hace max_latency_ms o más
+        """
+        return self._size > 0 and self.clock() - self._oldest >= self.max_latency
+
+    def flush(self):
+        """
+        Puntúa las lecturas pendientes.
+
+        Returns:
+        --------
+        numpy.ndarray
+            Matriz (n_lecturas, len(targets)) con las probabilidades (vacía si no había lecturas)
+        """
+        if self._size == 0:
+            return np.empty((0, len(self.predictor.targets)))
+        start = self.clock()
+        probabilities = self.predictor.predict_proba(self._buffer[:self._size])
+        end = self.clock()
+        self.scoring_seconds += end - start
+        self.max_wait = max(self.max_wait, end - self._oldest)
+        self.rows += self._size
+        self.batches += 1
+        self._size = 0
+        self._oldest = None
+        return probabilities
+
+    def score_stream(self, readings):
+        """
+        Puntúa un iterable de lecturas y entrega los resultados por lote.
+
+        El iterable se lee en un hilo aparte que pasa las lecturas por una
+        cola acotada; así, aunque el iterable se bloquee esperando datos (un
+        socket o un sensor en silencio), el lote abierto se puntúa al vencer
+        ``max_latency_ms`` en lugar de esperar a la siguiente lectura. Con
+        ``push`` directamente, en cambio, la espera solo se revisa al llegar
+        una lectura: el llamador debe consultar ``due()`` periódicamente y
+        llamar a ``flush()``.
+
+        Parameters:
+        -----------
+        readings : iterable
+            Lecturas como en push
+
+        Yields:
+        -------
+        numpy.ndarray
+            Probabilidades de cada lote, en el orden de llegada
+        """
+        feed = queue.Queue(maxsize=4 * self.batch_size)
+        stop = threading.Event()
+
+        def read():
+            try:
+                for reading in readings:
+                    if stop.is_set():
+                        return
+                    feed.put(reading)
+            except Exception as error:
+                feed.put(_ReaderError(error))
+            feed.put(_END_OF_STREAM)
+
+        threading.Thread(target=read, daemon=True).start()
+        try:
+            while True:
+                # Sin lote abierto se espera sin límite; con lote abierto, hasta su vencimiento
+                timeout = None if self._size == 0 else max(0.0, self._oldest + self.max_latency - self.clock())
+                try:
+                    reading = feed.get(timeout=timeout)
+                except queue.Empty:
+                    yield self.flush()
+                    continue
+                if reading is _END_OF_STREAM:
+                    break
+                if isinstance(reading, _ReaderError):
+                    raise reading.error
+                probabilities = self.push(reading)
+                if probabilities is not None:
+                    yield probabilities
+            probabilities = self.flush()
+            if len(probabilities):
+                yield probabilities
+        finally:
+            # Si el consumidor abandona el generador, el hilo lector termina en su próxima lectura
+            stop.set()
+            while not feed.empty():
+                feed.get_nowait()
+
+    def stats(self):
+        """
+        Métricas de rendimiento del flujo.
+
+        Returns:
+        --------
+        dict
+            rows, batches, mean_batch_size, us_per_row (tiempo de
+            puntuación amortizado) y max_wait_ms
+        """
+        return {
+            'rows': self.rows,
+            'batches': self.batches,
+            'mean_batch_size': self.rows / self.batches if self.batches else 0.0,
+            'us_per_row': self.scoring_seconds / self.rows * 1e6 if self.rows else 0.0,
+            'max_wait_ms': self.max_wait * 1000,
+        }
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+
+
+TOTAL_KEY = 'Total'
+
+
+class GroupedBivariateStats:
+    """
+    Acumulador de correlación y regresión lineal por grupo en una sola pasada.
+
+    Para cada grupo (tipo de producto, modo de fallo o cualquier columna
+    categórica) mantiene las estadísticas suficientes de la regresión
+    y = pendiente * x + intercepto: el número de filas, las medias de x e y,
+    y las sumas de cuadrados y de productos centradas. Cada bloque se reduce
+    con numpy.bincount para todos los grupos a la vez, y los bloques (o los
+    resultados de otros procesos) se combinan con la fórmula paralela de
+    Chan, de modo que el resultado coincide con scipy.stats.linregress
+    aplicado a cada grupo completo.
+    """
+
+    def __init__(self):
+        """
+        Inicializa un acumulador vacío.
+        """
+        self.keys = []
+        self._positions = {}
+        self.n = np.zeros(0)
+        self.mean_x = np.zeros(0)
+        self.mean_y = np.zeros(0)
+        self.m2_x = np.zeros(0)
+        self.m2_y = np.zeros(0)
+        self.c_xy = np.zeros(0)
+
+    def _rows_for(self, keys):
+        """Devuelve la fila de cada clave, agregando filas vacías para claves nuevas."""
+        new_keys = [key for key in keys if key not in self._positions]
+        if new_keys:
+            for key in new_keys:
+                self._positions[key] = len(self.keys)
+                self.keys.append(key)
+            padding = np.zeros(len(new_keys))
+            for name in ('n', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy'):
+                setattr(self, name, np.concatenate([getattr(self, name), padding]))
+        return np.array([self._positions[key] for key in keys], dtype=np.intp)
+
+    def update(self, x, y, groups=None):
+        """
+        Agrega un bloque de pares (x, y).
+
+        Parameters:
+        -----------
+        x, y : array-like
+            Valores del bloque (ej: rotational_speed_rpm y torque_nm)
+        groups : array-like, optional
+            Grupo de cada fila; sin grupos todas las filas van a TOTAL_KEY.
+            Las filas con grupo nulo o con x/y no finitos se descartan.
+
+        Returns:
+        --------
+        GroupedBivariateStats
+            La propia instancia
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if groups is None:
+            codes, uniques = np.zeros(len(x), dtype=np.intp), [TOTAL_KEY]
+        elif isinstance(getattr(groups, 'dtype', None), pd.CategoricalDtype):
+            # Los códigos de una columna categórica ya son los índices de grupo
+            categorical = pd.Categorical(groups)
+            codes, uniques = categorical.codes.astype(np.intp), list(categorical.categories)
+        else:
+            codes, uniques = pd.factorize(np.asarray(groups), sort=True)
+            uniques = list(uniques)
+
+        valid = (codes >= 0) & np.isfinite(x) & np.isfinite(y)
+        if not valid.all():
+            codes, x, y = codes[valid], x[valid], y[valid]
+        if len(codes) == 0:
+            return self
+
+        size = len(uniques)
+        n = np.bincount(codes, minlength=size).astype(np.float64)
+        present = n > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean_x = np.bincount(codes, weights=x, minlength=size) / n
+            mean_y = np.bincount(codes, weights=y, minlength=size) / n
+        # Desviaciones respecto a la media del grupo: sin cancelación numérica
+        dx = x - mean_x[codes]
+        dy = y - mean_y[codes]
+
+        other = GroupedBivariateStats()
+        other.keys = [key for key, keep in zip(uniques, present) if keep]
+        other._positions = {key: position for position, key in enumerate(other.keys)}
+        other.n = n[present]
+        other.mean_x = mean_x[present]
+        other.mean_y = mean_y[present]
+        other.m2_x = np.bincount(codes, weights=dx * dx, minlength=size)[present]
+        other.m2_y = np.bincount(codes, weights=dy * dy, minlength=size)[present]
+        other.c_xy = np.bincount(codes, weights=dx * dy, minlength=size)[present]
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Combina los resultados parciales de otro acumulador.
+
+        Parameters:
+        -----------
+        other : GroupedBivariateStats
+            Acumulador de otro bloque o proceso
+
+        Returns:
+        --------
+        GroupedBivariateStats
+            La propia instancia
+        """
+        if not other.keys:
+            return self
+        rows = self._rows_for(other.keys)
+        n_a, n_b = self.n[rows], other.n
+        n = n_a + n_b
+        delta_x = other.mean_x - self.mean_x[rows]
+        delta_y = other.mean_y - self.mean_y[rows]
+        weight = n_a * n_b / n
+
+        self.m2_x[rows] += other.m2_x + delta_x * delta_x * weight
+        self.m2_y[rows] += other.m2_y + delta_y * delta_y * weight
+        self.c_xy[rows] += other.c_xy + delta_x * delta_y * weight
+        self.mean_x[rows] += delta_x * n_b / n
+        self.mean_y[rows] += delta_y * n_b / n
+        self.n[rows] = n
+        return self
+
+    def total(self):
+        """
+        Combina todos los grupos en un solo acumulador.
+
+        Returns:
+        --------
+        GroupedBivariateStats
+            Acumulador con una única clave TOTAL_KEY
+        """
+        result = GroupedBivariateStats()
+        if not self.keys:
+            return result
+        n = self.n.sum()
+        mean_x = (self.n * self.mean_x).sum() / n
+        mean_y = (self.n * self.mean_y).sum() / n
+        result._rows_for([TOTAL_KEY])
+        result.n[0] = n
+        result.mean_x[0] = mean_x
+        result.mean_y[0] = mean_y
+        result.m2_x[0] = (self.m2_x + self.n * (self.mean_x - mean_x) ** 2).sum()
+        result.m2_y[0] = (self.m2_y + self.n * (self.mean_y - mean_y) ** 2).sum()
+        result.c_xy[0] = (self.c_xy + self.n * (self.mean_x - mean_x) * (self.mean_y - mean_y)).sum()
+        return result
+
+    def summary(self, include_total=False):
+        """
+        Calcula correlación y regresión lineal de todos los grupos a la vez.
+
+        Parameters:
+        -----------
+        include_total : bool
+            Si es True agrega una fila TOTAL_KEY con todos los datos
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Una fila por grupo con n, r (Pearson), r2, slope, intercept,
+            p_value (prueba t bilateral de pendiente cero), stderr (error
+            estándar de la pendiente) e intercept_stderr
+        """
+        # scipy.stats tarda casi un segundo en importarse: solo se carga para los p-valores
+        from scipy import stats
+
+        source = self
+        if include_total and self.keys and self.keys != [TOTAL_KEY]:
+            source = GroupedBivariateStats().merge(self).merge(self.total())
+
+        n = source.n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            r = source.c_xy / np.sqrt(source.m2_x * source.m2_y)
+            r = np.clip(r, -1.0, 1.0)
+            slope = source.c_xy / source.m2_x
+            intercept = source.mean_y - slope * source.mean_x
+            dof = n - 2
+            t = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+            p_value = 2 * stats.t.sf(np.abs(t), dof)
+            stderr = np.sqrt((1 - r * r) * source.m2_y / source.m2_x / dof)
+            intercept_stderr = stderr * np.sqrt(source.m2_x / n + source.mean_x ** 2)
+
+        return pd.DataFrame({
+            'n': n.astype(np.int64),
+            'r': r,
+            'r2': r * r,
+            'slope': slope,
+            'intercept': intercept,
+            'p_value': p_value,
+            'stderr': stderr,
+            'intercept_stderr': intercept_stderr,
+        }, index=pd.Index(source.keys, name='group'))
@@ -1,45 +1,82 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from dataset_cache import AI4I_URL, load_dataset
+from typed_csv import AI4I_SCHEMA
+from streaming_histogram import StreamingHistogram
 
-# URL del archivo CSV
-url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00601/ai4i2020.csv"
+# Columnas que necesita el reporte
+COLUMNS = ['process_temperature_k']
 
-# Cargar el archivo CSV en un DataFrame
-df = pd.read_csv(url)
 
-print("Dataset cargado exitosamente desde CSV!")
-print(f"Forma del dataset: {df.shape}")
+def histogram_report(df, column='process_temperature_k', bins=30):
+    """
+    Crea el histograma de la temperatura del proceso y sus estadísticas.
 
-# Configurar el estilo de matplotlib para mejor visualización
-plt.style.use('default')
-sns.set_palette("husl")
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Datos con la columna a graficar
+    column : str
+        Columna a graficar
+    bins : int
+        Número de celdas del histograma
 
-# Crear figura y ejes
-fig, ax = plt.subplots(figsize=(10, 6))
+    Returns:
+    --------
+    tuple
+        ({nombre: matplotlib.figure.Figure}, dict con las estadísticas)
+    """
+    # matplotlib.pyplot tarda en importarse: solo se carga al generar el reporte
+    import matplotlib.pyplot as plt
 
-# Crear histograma de process_temperature_k
-ax.hist(df['process_temperature_k'], bins=30, alpha=0.7, color='skyblue', edgecolor='black')
+    # Configurar el estilo de matplotlib para mejor visualización (el color del
+    # histograma es explícito, así que no hace falta cargar la paleta de seaborn)
+    plt.style.use('default')
 
-# Personalizar el gráfico
-ax.set_xlabel('Temperatura del Proceso (K)', fontsize=12)
-ax.set_ylabel('Frecuencia', fontsize=12)
-ax.set_title('Distribución de Temperatura del Proceso', fontsize=14, fontweight='bold')
-ax.grid(True, alpha=0.3)
+    # Crear figura y ejes
+    fig, ax = plt.subplots(figsize=(10, 6))
 
-# Agregar estadísticas descriptivas como texto
-mean_temp = df['process_temperature_k'].mean()
-std_temp = df['process_temperature_k'].std()
-min_temp = df['process_temperature_k'].min()
-max_temp = df['process_temperature_k'].max()
+    # Acumular conteos y momentos en una sola pasada (admite bloques con update/merge)
+    histogram = StreamingHistogram(bins=bins).update(df[column])
 
-stats_text = f'Media: {mean_temp:.2f} K\nDesv. Est.: {std_temp:.2f} K\nMin: {min_temp:.2f} K\nMax: {max_temp:.2f} K'
-ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
-        verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+    # Crear histograma de process_temperature_k a partir de los conteos acumulados
+    histogram.plot(ax, alpha=0.7, color='skyblue', edgecolor='black')
 
-plt.tight_layout()
-plt.show()
+    # Personalizar el gráfico
+    ax.set_xlabel('Temperatura del Proceso (K)', fontsize=12)
+    ax.set_ylabel('Frecuencia', fontsize=12)
+    ax.set_title('Distribución de Temperatura del Proceso', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
 
-# Mostrar estadísticas descriptivas
-print("\nEstadísticas descriptivas de process_temperature_k:")
-print(df['process_temperature_k'].describe()) 
\ No newline at end of file
+    # Agregar estadísticas descriptivas como texto
+    mean_temp = histogram.mean
+    std_temp = histogram.std
+    min_temp = histogram.min
+    max_temp = histogram.max
+
+    stats_text = f'Media: {mean_temp:.2f} K\nDesv. Est.: {std_temp:.2f} K\nMin: {min_temp:.2f} K\nMax: {max_temp:.2f} K'
+    ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
+            verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+    plt.tight_layout()
+    stats = {'column': column, 'n': histogram.n, 'mean': mean_temp, 'std': std_temp,
+             'min': min_temp, 'max': max_temp}
+    return {'histograma_temperatura': fig}, stats
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # URL del archivo CSV
+    url = AI4I_URL
+
+    # Cargar solo la columna necesaria, ya tipada y con nombre limpio (desde la caché local)
+    df = load_dataset(url, schema=AI4I_SCHEMA, columns=COLUMNS)
+
+    print("Dataset cargado exitosamente desde CSV!")
+    print(f"Forma del dataset: {df.shape}")
+
+    histogram_report(df)
+    plt.show()
+
+    # Mostrar estadísticas descriptivas
+    print("\nEstadísticas descriptivas de process_temperature_k:")
+    print(df['process_temperature_k'].describe())
@@ -0,0 +1,195 @@
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dataset_cache import AI4I_URL, dataset_hash, load_dataset
+from typed_csv import AI4I_SCHEMA
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_OUTPUT_DIR = os.path.join(_HERE, 'reportes')
+
+# Reportes disponibles: nombre -> (módulo, función, parámetros)
+REPORTS = {
+    'histograma_temperatura': ('histograma_temperatura', 'histogram_report', {'bins': 30}),
+    'scatter_plot_fixed': ('scatter_plot_fixed', 'scatter_report', {}),
+    'scatterplot_analysis': ('scatterplot_analysis', 'analysis_report', {}),
+}
+
+
+def _init_worker():
+    """Usa el backend Agg: los trabajadores no abren ventanas."""
+    import matplotlib
+
+    matplotlib.use('Agg')
+
+
+def _local_modules(module_name):
+    """Módulo de reporte y los módulos locales que importa (directa o indirectamente), ordenados."""
+    found, pending = set(), [module_name]
+    while pending:
+        name = pending.pop()
+        path = os.path.join(_HERE, f'{name}.py')
+        if name in found or not os.path.exists(path):
+            continue
+        found.add(name)
+        with open(path, 'rb') as file:
+            tree = ast.parse(file.read())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                pending.append(node.module.split('.')[0])
+    return sorted(found)
+
+
+def _module_hash(module_name):
+    """
+    SHA-256 del código fuente de un módulo de reporte y de los módulos
+    locales que usa (density_plot, streaming_histogram, typed_csv...), de
+    modo que cambiar una función auxiliar también invalida el reporte.
+    """
+    digest = hashlib.sha256()
+    for name in _local_modules(module_name):
+        digest.update(name.encode('utf-8') + b'\0')
+        with open(os.path.join(_HERE, f'{name}.py'), 'rb') as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
+
+
+def _input_hash(name, data_hash, formats, dpi):
+    """Identifica una ejecución: datos, código y parámetros del reporte."""
+    module_name, function_name, params = REPORTS[name]
+    key = {'report': name, 'data': data_hash, 'code': _module_hash(module_name),
+           'function': function_name, 'params': params, 'formats': list(formats), 'dpi': dpi}
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _is_up_to_date(sidecar_path, input_hash):
+    """True si el reporte ya fue generado con las mismas entradas y sus archivos existen."""
+    if not os.path.exists(sidecar_path):
+        return False
+    with open(sidecar_path, encoding='utf-8') as file:
+        sidecar = json.load(file)
+    return sidecar.get('input_hash') == input_hash and all(
+        os.path.exists(os.path.join(os.path.dirname(sidecar_path), path)) for path in sidecar['files'])
+
+
+def _render_report(task):
+    """Genera un reporte (figuras + JSON de estadísticas); se ejecuta en un trabajador."""
+    name, source, cache_dir, output_dir, formats, dpi, input_hash = task
+    import matplotlib.pyplot as plt
+
+    module_name, function_name, params = REPORTS[name]
+    module = importlib.import_module(module_name)
+    start = time.perf_counter()
+    # La caché ya existe: cada trabajador abre las columnas como memmap sin parsear el CSV
+    df = load_dataset(source, columns=module.COLUMNS, cache_dir=cache_dir, schema=AI4I_SCHEMA)
+    figures, stats = getattr(module, function_name)(df, **params)
+
+    files = []
+    for figure_name, figure in figures.items():
+        for extension in formats:
+            filename = f'{figure_name}.{extension}'
+            figure.savefig(os.path.join(output_dir, filename), dpi=dpi, bbox_inches='tight')
+            files.append(filename)
+        plt.close(figure)
+
+    sidecar = {
+        'report': name,
+        'input_hash': input_hash,
+        'params': params,
+        'files': files,
+        'stats': stats,
+        'elapsed_seconds': time.perf_counter() - start,
+    }
+    sidecar_path = os.path.join(output_dir, f'{name}.json')
+    temporary = f'{sidecar_path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        json.dump(sidecar, file, indent=2, ensure_ascii=False, default=float)
+    os.replace(temporary, sidecar_path)
+    return {'report': name, 'status': 'generado', 'files': files,
+            'elapsed_seconds': sidecar['elapsed_seconds']}
+
+
+def run_reports(names=None, source=AI4I_URL, output_dir=None, formats=('png', 'svg'), dpi=150,
+                n_jobs=None, force=False, cache_dir=None):
+    """
+    Genera en paralelo los reportes de análisis sin interfaz gráfica.
+
+    El dataset se convierte una sola vez a la caché columnar; cada reporte
+    se dibuja en un proceso trabajador con el backend Agg, que abre solo
+    sus columnas como memmap. Por cada reporte se escriben sus figuras
+    (PNG/SVG) y un JSON con las estadísticas. Los reportes cuyo hash de
+    datos, código y parámetros no cambió desde la última ejecución se omiten.
+
+    Args:
+        names (list, optional): Reportes a generar (por defecto todos los de REPORTS)
+        source (str): URL o ruta del CSV
+        output_dir (str, optional): Directorio de salida (por defecto 'reportes')
+        formats (tuple): Formatos de imagen a escribir
+        dpi (int): Resolución de las imágenes rasterizadas
+        n_jobs (int, optional): Número de procesos (por defecto todos los núcleos)
+        force (bool): Si es True se regeneran también los reportes sin cambios
+        cache_dir (str, optional): Directorio de la caché de datasets
+
+    Returns:
+        list: Un dict por reporte con 'report', 'status' ('generado' u
+            'omitido') y 'files'
+
+    Raises:
+        KeyError: Si algún reporte pedido no existe
+    """
+    names = list(REPORTS) if names is None else list(names)
+    unknown = [name for name in names if name not in REPORTS]
+    if unknown:
+        raise KeyError(f'Reportes inexistentes: {unknown}')
+    output_dir = output_dir or DEFAULT_OUTPUT_DIR
+    os.makedirs(output_dir, exist_ok=True)
+
+    data_hash = dataset_hash(source, cache_dir=cache_dir)
+    results, tasks = [], []
+    for name in names:
+        input_hash = _input_hash(name, data_hash, formats, dpi)
+        sidecar_path = os.path.join(output_dir, f'{name}.json')
+        if not force and _is_up_to_date(sidecar_path, input_hash):
+            with open(sidecar_path, encoding='utf-8') as file:
+                results.append({'report': name, 'status': 'omitido', 'files': json.load(file)['files']})
+            continue
+        tasks.append((name, source, cache_dir, output_dir, tuple(formats), dpi, input_hash))
+
+    if tasks:
+        # Una sola conversión del CSV antes de lanzar los trabajadores
+        load_dataset(source, columns=[], cache_dir=cache_dir, schema=AI4I_SCHEMA)
+        with ProcessPoolExecutor(max_workers=n_jobs or min(len(tasks), os.cpu_count() or 1),
+                                 initializer=_init_worker) as executor:
+            results.extend(executor.map(_render_report, tasks))
+    return results
+
+
+def main():
+    """Punto de entrada: genera los reportes pedidos en la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Generador de reportes del dataset ai4i2020')
+    parser.add_argument('reports', nargs='*', help=f'Reportes a generar (por defecto: {", ".join(REPORTS)})')
+    parser.add_argument('--source', default=AI4I_URL, help='URL o ruta del CSV')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--formats', nargs='+', default=['png', 'svg'])
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--jobs', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help='Regenerar aunque no haya cambios')
+    args = parser.parse_args()
+
+    results = run_reports(args.reports or None, args.source, args.output_dir, args.formats,
+                          args.dpi, args.jobs, args.force)
+    for result in results:
+        print(f"{result['report']}: {result['status']} ({', '.join(result['files'])})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,82 +1,106 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
-
-# URL del archivo CSV
-url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00601/ai4i2020.csv"
-
-# Cargar el archivo CSV en un DataFrame
-df = pd.read_csv(url)
-
-print("Dataset cargado exitosamente desde CSV!")
-print(f"Forma del dataset: {df.shape}")
-
-# Limpiar nombres de columnas
-def clean_column_name(column_name):
-    import re
-    clean_name = column_name.lower()
-    clean_name = re.sub(r'[^a-zA-Z0-9\s]', ' ', clean_name)
-    clean_name = re.sub(r'\s+', '_', clean_name)
-    clean_name = clean_name.strip('_')
-    return clean_name
-
-# Aplicar la función para renombrar todas las columnas
-df.columns = [clean_column_name(col) for col in df.columns]
-
-print("\nColumnas disponibles:")
-print(df.columns.tolist())
-
-# Extraer las series específicas para evitar problemas de tipo
-rotational_speed = df['rotational_speed_rpm'].astype(float)
-torque = df['torque_nm'].astype(float)
-
-# Crear el scatter plot
-plt.figure(figsize=(12, 8))
-
-# Crear scatter plot con seaborn
-sns.scatterplot(data=df, x='rotational_speed_rpm', y='torque_nm', 
-                alpha=0.6, s=30, color='steelblue')
-
-# Personalizar el gráfico
-plt.xlabel('Velocidad de Rotación (rpm)', fontsize=12)
-plt.ylabel('Torque (Nm)', fontsize=12)
-plt.title('Relación entre Velocidad de Rotación y Torque', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-
-# Calcular correlación usando numpy para evitar problemas de tipo
-correlation_matrix = np.corrcoef(rotational_speed, torque)
-correlation = correlation_matrix[0, 1]
-r_squared = correlation ** 2
-
-# Agregar línea de tendencia
-z = np.polyfit(rotational_speed, torque, 1)
-p = np.poly1d(z)
-plt.plot(rotational_speed, p(rotational_speed), 
-         "r--", alpha=0.8, linewidth=2, label=f'Tendencia (r² = {r_squared:.3f})')
-
-# Agregar estadísticas de correlación
-stats_text = f'Correlación: {correlation:.3f}\nR²: {r_squared:.3f}'
-plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, fontsize=10,
-         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-
-plt.legend()
-plt.tight_layout()
-
-# Guardar y mostrar el gráfico
-plt.savefig('scatter_plot_rotational_speed_torque_fixed.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-# Mostrar estadísticas descriptivas
-print("\nEstadísticas descriptivas:")
-print("=" * 50)
-print("Velocidad de Rotación (rpm):")
-print(rotational_speed.describe())
-print("\nTorque (Nm):")
-print(torque.describe())
-print(f"\nCorrelación entre variables: {correlation:.3f}")
-print(f"Coeficiente de determinación (R²): {r_squared:.3f}")
-
-# Verificar que no hay valores nulos
-print(f"\nValores nulos en velocidad de rotación: {rotational_speed.isnull().sum()}")
-print(f"Valores nulos en torque: {torque.isnull().sum()}") 
\ No newline at end of file
+from dataset_cache import AI4I_URL, load_dataset
+from typed_csv import AI4I_SCHEMA
+from density_plot import plot_relationship
+from grouped_stats import GroupedBivariateStats
+
+# Columnas que necesita el reporte
+COLUMNS = ['rotational_speed_rpm', 'torque_nm']
+
+
+def scatter_report(df):
+    """
+    Crea el diagrama de dispersión velocidad de rotación vs torque con su tendencia.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Datos con las columnas rotational_speed_rpm y torque_nm
+
+    Returns:
+    --------
+    tuple
+        ({nombre: matplotlib.figure.Figure}, dict con las estadísticas)
+    """
+    # matplotlib tarda en importarse: solo se carga al generar el reporte
+    import matplotlib.pyplot as plt
+    from matplotlib.image import AxesImage
+
+    # Extraer las series específicas para evitar problemas de tipo
+    rotational_speed = df['rotational_speed_rpm'].astype(float)
+    torque = df['torque_nm'].astype(float)
+
+    # Crear el scatter plot
+    fig = plt.figure(figsize=(12, 8))
+
+    # Crear scatter plot (con muchos puntos se dibuja una rejilla de densidad)
+    artist = plot_relationship(plt.gca(), df['rotational_speed_rpm'], df['torque_nm'],
+                               alpha=0.6, s=30, color='steelblue')
+    if isinstance(artist, AxesImage):
+        plt.colorbar(artist, label='Número de puntos')
+
+    # Personalizar el gráfico
+    plt.xlabel('Velocidad de Rotación (rpm)', fontsize=12)
+    plt.ylabel('Torque (Nm)', fontsize=12)
+    plt.title('Relación entre Velocidad de Rotación y Torque', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+
+    # Calcular correlación y recta de tendencia en una sola pasada
+    regression = GroupedBivariateStats().update(rotational_speed, torque).summary().iloc[0]
+    correlation = regression['r']
+    r_squared = regression['r2']
+
+    # Agregar línea de tendencia (basta con sus dos extremos)
+    x_line = np.array([rotational_speed.min(), rotational_speed.max()])
+    plt.plot(x_line, regression['intercept'] + regression['slope'] * x_line,
+             "r--", alpha=0.8, linewidth=2, label=f'Tendencia (r² = {r_squared:.3f})')
+
+    # Agregar estadísticas de correlación
+    stats_text = f'Correlación: {correlation:.3f}\nR²: {r_squared:.3f}'
+    plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, fontsize=10,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+    plt.legend()
+    plt.tight_layout()
+
+    stats = {'n': int(regression['n']), 'correlation': correlation, 'r_squared': r_squared,
+             'slope': regression['slope'], 'intercept': regression['intercept'],
+             'null_rotational_speed': int(rotational_speed.isnull().sum()),
+             'null_torque': int(torque.isnull().sum())}
+    return {'scatter_plot_rotational_speed_torque_fixed': fig}, stats
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # URL del archivo CSV
+    url = AI4I_URL
+
+    # Cargar solo las columnas necesarias, ya tipadas y con nombres limpios (desde la caché local)
+    df = load_dataset(url, schema=AI4I_SCHEMA, columns=COLUMNS)
+
+    print("Dataset cargado exitosamente desde CSV!")
+    print(f"Forma del dataset: {df.shape}")
+
+    print("\nColumnas disponibles:")
+    print(df.columns.tolist())
+
+    figures, stats = scatter_report(df)
+
+    # Guardar y mostrar el gráfico
+    plt.savefig('scatter_plot_rotational_speed_torque_fixed.png', dpi=300, bbox_inches='tight')
+    plt.show()
+
+    # Mostrar estadísticas descriptivas
+    print("\nEstadísticas descriptivas:")
+    print("=" * 50)
+    print("Velocidad de Rotación (rpm):")
+    print(df['rotational_speed_rpm'].astype(float).describe())
+    print("\nTorque (Nm):")
+    print(df['torque_nm'].astype(float).describe())
+    print(f"\nCorrelación entre variables: {stats['correlation']:.3f}")
+    print(f"Coeficiente de determinación (R²): {stats['r_squared']:.3f}")
+
+    # Verificar que no hay valores nulos
+    print(f"\nValores nulos en velocidad de rotación: {stats['null_rotational_speed']}")
+    print(f"Valores nulos en torque: {stats['null_torque']}")
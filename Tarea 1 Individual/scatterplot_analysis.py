@@ -1,115 +1,181 @@
 # DIAGRAMA DE DISPERSIÓN: Relación entre Velocidad Rotacional y Torque
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import pandas as pd
-from scipy import stats
-
-# Cargar el dataset (asumiendo que ya está cargado como 'df')
-# Si no está cargado, descomenta las siguientes líneas:
-# url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00601/ai4i2020.csv"
-# df = pd.read_csv(url)
-
-# Configurar el estilo para mejor visualización
-plt.style.use('default')
-sns.set_palette("viridis")
-
-# Crear figura y ejes
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-
-# === GRÁFICO 1: Scatterplot básico ===
-scatter = ax1.scatter(df['rotational_speed_rpm'], df['torque_nm'], 
-                     alpha=0.6, c=df['machine_failure'], 
-                     cmap='RdYlBu_r', s=20)
-
-# Personalizar el primer gráfico
-ax1.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
-ax1.set_ylabel('Torque (Nm)', fontsize=12)
-ax1.set_title('Relación entre Velocidad Rotacional y Torque\n(Coloreado por Fallo de Máquina)', fontsize=14, fontweight='bold')
-ax1.grid(True, alpha=0.3)
-
-# Agregar leyenda para los colores
-legend1 = ax1.legend(*scatter.legend_elements(),
-                    title="Fallo de Máquina",
-                    loc="upper right")
-ax1.add_artist(legend1)
-
-# === GRÁFICO 2: Scatterplot con línea de regresión ===
-# Crear scatterplot con seaborn para línea de regresión
-sns.regplot(data=df, x='rotational_speed_rpm', y='torque_nm', 
-           ax=ax2, scatter_kws={'alpha':0.6, 's':20}, 
-           line_kws={'color':'red', 'linewidth':2})
-
-# Personalizar el segundo gráfico
-ax2.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
-ax2.set_ylabel('Torque (Nm)', fontsize=12)
-ax2.set_title('Relación entre Velocidad Rotacional y Torque\n(Con Línea de Regresión)', fontsize=14, fontweight='bold')
-ax2.grid(True, alpha=0.3)
-
-# Calcular correlación y estadísticas
-correlation = df['rotational_speed_rpm'].corr(df['torque_nm'])
-slope, intercept, r_value, p_value, std_err = stats.linregress(df['rotational_speed_rpm'], df['torque_nm'])
-
-# Agregar estadísticas como texto en el segundo gráfico
-stats_text = f'Correlación: {correlation:.3f}\nR²: {r_value**2:.3f}\nP-valor: {p_value:.2e}\nPendiente: {slope:.4f}'
-ax2.text(0.02, 0.98, stats_text, transform=ax2.transAxes, fontsize=10,
-         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-
-plt.tight_layout()
-plt.show()
-
-# === ANÁLISIS ADICIONAL ===
-print("=== ANÁLISIS DE CORRELACIÓN ENTRE VELOCIDAD ROTACIONAL Y TORQUE ===")
-print(f"\nCorrelación de Pearson: {correlation:.4f}")
-print(f"Coeficiente de determinación (R²): {r_value**2:.4f}")
-print(f"P-valor: {p_value:.2e}")
-print(f"Pendiente de la línea de regresión: {slope:.4f}")
-print(f"Intercepto: {intercept:.2f}")
-
-# Interpretación de la correlación
-if abs(correlation) < 0.1:
-    strength = "muy débil"
-elif abs(correlation) < 0.3:
-    strength = "débil"
-elif abs(correlation) < 0.5:
-    strength = "moderada"
-elif abs(correlation) < 0.7:
-    strength = "fuerte"
-else:
-    strength = "muy fuerte"
-
-direction = "positiva" if correlation > 0 else "negativa"
-print(f"\nInterpretación: La correlación es {strength} y {direction}.")
-
-# Estadísticas descriptivas de ambas variables
-print("\n=== ESTADÍSTICAS DESCRIPTIVAS ===")
-print("\nVelocidad Rotacional (rpm):")
-print(df['rotational_speed_rpm'].describe())
-print("\nTorque (Nm):")
-print(df['torque_nm'].describe())
-
-# === ANÁLISIS POR TIPO DE PRODUCTO ===
-print("\n=== ANÁLISIS POR TIPO DE PRODUCTO ===")
-print("\nCorrelaciones por tipo de producto:")
-for product_type in df['type'].unique():
-    subset = df[df['type'] == product_type]
-    corr = subset['rotational_speed_rpm'].corr(subset['torque_nm'])
-    print(f"Tipo {product_type}: {corr:.4f}")
-
-# === GRÁFICO ADICIONAL: Scatterplot por tipo de producto ===
-fig, ax = plt.subplots(figsize=(12, 8))
-
-colors = ['red', 'blue', 'green']
-for i, product_type in enumerate(df['type'].unique()):
-    subset = df[df['type'] == product_type]
-    ax.scatter(subset['rotational_speed_rpm'], subset['torque_nm'], 
-              alpha=0.6, s=20, label=f'Tipo {product_type}', color=colors[i])
-
-ax.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
-ax.set_ylabel('Torque (Nm)', fontsize=12)
-ax.set_title('Relación entre Velocidad Rotacional y Torque por Tipo de Producto', fontsize=14, fontweight='bold')
-ax.legend()
-ax.grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.show() 
\ No newline at end of file
+from dataset_cache import AI4I_URL, load_dataset
+from typed_csv import AI4I_SCHEMA
+from density_plot import DENSITY_THRESHOLD, plot_relationship
+from grouped_stats import TOTAL_KEY, GroupedBivariateStats
+
+# Columnas que necesita el reporte
+COLUMNS = ['rotational_speed_rpm', 'torque_nm', 'machine_failure', 'type']
+
+
+def analysis_report(df):
+    """
+    Crea los gráficos de velocidad rotacional vs torque (por fallo y por tipo) y sus estadísticas.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Datos con las columnas de COLUMNS
+
+    Returns:
+    --------
+    tuple
+        ({nombre: matplotlib.figure.Figure}, dict con las estadísticas)
+    """
+    # matplotlib y seaborn (que importa scipy.stats) tardan más de un segundo en
+    # cargarse: solo se importan al generar el reporte
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    from matplotlib.collections import PathCollection
+
+    # Configurar el estilo para mejor visualización
+    plt.style.use('default')
+    sns.set_palette("viridis")
+
+    # Crear figura y ejes
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+
+    # === GRÁFICO 1: Scatterplot básico ===
+    # Con muchos puntos se dibuja una rejilla de densidad coloreada por la tasa de fallo
+    scatter = plot_relationship(ax1, df['rotational_speed_rpm'], df['torque_nm'],
+                                hue=df['machine_failure'], cmap='RdYlBu_r', alpha=0.6, s=20)
+
+    # Personalizar el primer gráfico
+    ax1.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
+    ax1.set_ylabel('Torque (Nm)', fontsize=12)
+    ax1.set_title('Relación entre Velocidad Rotacional y Torque\n(Coloreado por Fallo de Máquina)', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+
+    # Agregar leyenda para los colores
+    if isinstance(scatter, PathCollection):
+        legend1 = ax1.legend(*scatter.legend_elements(),
+                            title="Fallo de Máquina",
+                            loc="upper right")
+        ax1.add_artist(legend1)
+    else:
+        fig.colorbar(scatter, ax=ax1, label='Tasa de Fallo de Máquina')
+
+    # Calcular correlación y regresión global y por tipo de producto en una sola pasada
+    regression = GroupedBivariateStats().update(df['rotational_speed_rpm'], df['torque_nm'], df['type'])
+    regression_by_type = regression.summary(include_total=True)
+    correlation, slope, intercept, p_value, std_err = regression_by_type.loc[
+        TOTAL_KEY, ['r', 'slope', 'intercept', 'p_value', 'stderr']]
+
+    # === GRÁFICO 2: Scatterplot con línea de regresión ===
+    if len(df) <= DENSITY_THRESHOLD:
+        # Crear scatterplot con seaborn para línea de regresión
+        sns.regplot(data=df, x='rotational_speed_rpm', y='torque_nm',
+                   ax=ax2, scatter_kws={'alpha':0.6, 's':20},
+                   line_kws={'color':'red', 'linewidth':2})
+    else:
+        # regplot dibuja cada punto y remuestrea el intervalo de confianza: se usa
+        # la rejilla de densidad y la recta de la regresión
+        plot_relationship(ax2, df['rotational_speed_rpm'], df['torque_nm'])
+        x_line = np.array([df['rotational_speed_rpm'].min(), df['rotational_speed_rpm'].max()])
+        ax2.plot(x_line, intercept + slope * x_line, color='red', linewidth=2)
+
+    # Personalizar el segundo gráfico
+    ax2.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
+    ax2.set_ylabel('Torque (Nm)', fontsize=12)
+    ax2.set_title('Relación entre Velocidad Rotacional y Torque\n(Con Línea de Regresión)', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+
+    # Agregar estadísticas como texto en el segundo gráfico
+    stats_text = f'Correlación: {correlation:.3f}\nR²: {correlation**2:.3f}\nP-valor: {p_value:.2e}\nPendiente: {slope:.4f}'
+    ax2.text(0.02, 0.98, stats_text, transform=ax2.transAxes, fontsize=10,
+             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+
+    plt.tight_layout()
+
+    # === GRÁFICO ADICIONAL: Scatterplot por tipo de producto ===
+    fig_by_type, ax = plt.subplots(figsize=(12, 8))
+
+    colors = ['red', 'blue', 'green']
+    product_types = pd.Categorical(df['type']).rename_categories(lambda product_type: f'Tipo {product_type}')
+    plot_relationship(ax, df['rotational_speed_rpm'], df['torque_nm'], hue=product_types,
+                      colors=colors, alpha=0.6, s=20)
+
+    ax.set_xlabel('Velocidad Rotacional (rpm)', fontsize=12)
+    ax.set_ylabel('Torque (Nm)', fontsize=12)
+    ax.set_title('Relación entre Velocidad Rotacional y Torque por Tipo de Producto', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+
+    stats = {
+        'n': int(len(df)),
+        'correlation': correlation,
+        'r_squared': correlation ** 2,
+        'p_value': p_value,
+        'slope': slope,
+        'intercept': intercept,
+        'stderr': std_err,
+        'correlation_by_type': {str(product_type): corr
+                                for product_type, corr in regression_by_type['r'].drop(TOTAL_KEY).items()},
+    }
+    return {'scatterplot_analysis': fig, 'scatterplot_por_tipo': fig_by_type}, stats
+
+
+def correlation_strength(correlation):
+    """
+    Describe con palabras la fuerza de una correlación.
+
+    Parameters:
+    -----------
+    correlation : float
+        Coeficiente de correlación de Pearson
+
+    Returns:
+    --------
+    str
+        'muy débil', 'débil', 'moderada', 'fuerte' o 'muy fuerte'
+    """
+    if abs(correlation) < 0.1:
+        return "muy débil"
+    elif abs(correlation) < 0.3:
+        return "débil"
+    elif abs(correlation) < 0.5:
+        return "moderada"
+    elif abs(correlation) < 0.7:
+        return "fuerte"
+    return "muy fuerte"
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Cargar solo las columnas necesarias, ya tipadas y con nombres limpios (desde la caché local)
+    df = load_dataset(AI4I_URL, schema=AI4I_SCHEMA, columns=COLUMNS)
+
+    figures, stats = analysis_report(df)
+    plt.show()
+
+    # === ANÁLISIS ADICIONAL ===
+    correlation = stats['correlation']
+    print("=== ANÁLISIS DE CORRELACIÓN ENTRE VELOCIDAD ROTACIONAL Y TORQUE ===")
+    print(f"\nCorrelación de Pearson: {correlation:.4f}")
+    print(f"Coeficiente de determinación (R²): {stats['r_squared']:.4f}")
+    print(f"P-valor: {stats['p_value']:.2e}")
+    print(f"Pendiente de la línea de regresión: {stats['slope']:.4f}")
+    print(f"Intercepto: {stats['intercept']:.2f}")
+
+    # Interpretación de la correlación
+    strength = correlation_strength(correlation)
+    direction = "positiva" if correlation > 0 else "negativa"
+    print(f"\nInterpretación: La correlación es {strength} y {direction}.")
+
+    # Estadísticas descriptivas de ambas variables
+    print("\n=== ESTADÍSTICAS DESCRIPTIVAS ===")
+    print("\nVelocidad Rotacional (rpm):")
+    print(df['rotational_speed_rpm'].describe())
+    print("\nTorque (Nm):")
+    print(df['torque_nm'].describe())
+
+    # === ANÁLISIS POR TIPO DE PRODUCTO ===
+    print("\n=== ANÁLISIS POR TIPO DE PRODUCTO ===")
+    print("\nCorrelaciones por tipo de producto:")
+    for product_type, corr in stats['correlation_by_type'].items():
+        print(f"Tipo {product_type}: {corr:.4f}")
@@ -0,0 +1,392 @@
+import asyncio
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from failure_scoring import SENSOR_COLUMNS, TYPE_CODES, reading_values
+from typed_csv import clean_column_name
+from unit_converter import UnitConverter
+
+
+# Categorías del tipo de producto en el orden de sus códigos (para agrupar estadísticas)
+TYPE_CATEGORIES = pd.Index(sorted(TYPE_CODES, key=TYPE_CODES.get))
+
+
+def _parse_fields(fields, positions):
+    """Convierte los campos de texto de una línea CSV en los valores de SENSOR_COLUMNS."""
+    values = [float(fields[position]) for position in positions[1:]]
+    return [TYPE_CODES.get(fields[positions[0]].strip(), np.nan)] + values
+
+
+async def generator_source(readings, interval=0.0):
+    """
+    Fuente simulada: entrega las lecturas de un iterable.
+
+    Parameters:
+    -----------
+    readings : iterable
+        Lecturas (secuencias en el orden de SENSOR_COLUMNS o dicts)
+    interval : float
+        Segundos de espera entre lecturas (0 para entregarlas sin pausa)
+
+    Yields:
+    -------
+    sequence or dict
+        Cada lectura
+    """
+    for reading in readings:
+        if interval:
+            await asyncio.sleep(interval)
+        yield reading
+
+
+async def tail_csv(path, poll_interval=0.05, idle_timeout=None, from_start=True):
+    """
+    Sigue un archivo CSV que otro proceso va escribiendo (como ``tail -f``).
+
+    El encabezado se lee una vez y se normaliza con clean_column_name, de
+    modo que sirve tanto el CSV original de ai4i2020 ('Torque [Nm]') como uno
+    con nombres limpios. Las líneas incompletas se retienen hasta que llega
+    su salto de línea.
+
+    Parameters:
+    -----------
+    path : str
+        Ruta del archivo CSV (con encabezado)
+    poll_interval : float
+        Segundos entre consultas cuando no hay líneas nuevas
+    idle_timeout : float, optional
+        Termina tras estos segundos sin datos nuevos (por defecto sigue indefinidamente)
+    from_start : bool
+        Si es False, ignora las filas ya escritas y solo entrega las nuevas
+
+    Yields:
+    -------
+    list
+        Valores de cada fila en el orden de SENSOR_COLUMNS
+
+    Raises:
+    -------
+    ValueError
+        Si el encabezado no tiene las columnas de sensores
+    """
+    loop = asyncio.get_running_loop()
+    with open(path, newline='') as handle:
+        header = [clean_column_name(column) for column in handle.readline().strip().split(',')]
+        missing = [column for column in SENSOR_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f'Faltan columnas de sensores en {path}: {missing}')
+        positions = [header.index(column) for column in SENSOR_COLUMNS]
+        if not from_start:
+            handle.seek(0, os.SEEK_END)
+
+        pending = ''
+        last_data = loop.time()
+        while True:
+            line = handle.readline()
+            if line:
+                pending += line
+                if not pending.endswith('\n'):
+                    continue
+                line, pending = pending.strip(), ''
+                if line:
+                    yield _parse_fields(line.split(','), positions)
+                last_data = loop.time()
+                continue
+            if idle_timeout is not None and loop.time() - last_data >= idle_timeout:
+                # La última fila de un archivo terminado puede no tener salto de línea
+                if pending.strip():
+                    yield _parse_fields(pending.strip().split(','), positions)
+                return
+            await asyncio.sleep(poll_interval)
+
+
+async def socket_source(host, port):
+    """
+    Lee lecturas de un socket TCP: una línea CSV por lectura, sin
+    encabezado y en el orden de SENSOR_COLUMNS, hasta que el emisor cierra
+    la conexión.
+
+    Parameters:
+    -----------
+    host : str
+        Dirección del emisor
+    port : int
+        Puerto del emisor
+
+    Yields:
+    -------
+    list
+        Valores de cada lectura en el orden de SENSOR_COLUMNS
+    """
+    positions = list(range(len(SENSOR_COLUMNS)))
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while line := await reader.readline():
+            line = line.decode().strip()
+            if line:
+                yield _parse_fields(line.split(','), positions)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+class SensorIngestion:
+    """
+    Ingesta asíncrona de lecturas de sensores en micro-lotes NumPy.
+
+    Un productor lee la fuente (generator_source, tail_csv, socket_source o
+    cualquier iterable asíncrono) y copia cada lectura a un bloque
+    preasignado de ``batch_size`` filas. El bloque se envía a una cola
+    acotada cuando se llena o cuando su lectura más antigua lleva
+    ``max_latency_ms`` esperando; un consumidor lo procesa entero en un
+    hilo aparte (sin detener el bucle de eventos):
+    probabilidades de fallo (``predictor``), conversión de unidades en el
+    propio bloque y actualización de los acumuladores (StreamingHistogram
+    por columna y GroupedBivariateStats por par de columnas, agrupado por
+    tipo de producto).
+
+    Si el consumidor se atrasa, la cola se llena y el productor deja de
+    leer la fuente hasta que haya espacio (contrapresión): la memoria queda
+    acotada a ``queue_size`` bloques. ``stats()`` informa la profundidad de
+    la cola, el tiempo de espera por contrapresión y la latencia desde la
+    llegada de cada lectura hasta el fin de su procesamiento.
+
+    Attributes:
+    -----------
+    rows : int
+        Lecturas procesadas
+    batches : int
+        Bloques procesados
+    alerts : numpy.ndarray
+        Lecturas con probabilidad >= predictor.threshold, por etiqueta
+    """
+
+    def __init__(self, batch_size=256, max_latency_ms=50.0, queue_size=8, conversions=None,
+                 histograms=None, grouped_stats=None, predictor=None, on_batch=None, clock=time.perf_counter):
+        """
+        Parameters:
+        -----------
+        batch_size : int
+            Filas por bloque
+        max_latency_ms : float
+            Espera máxima de una lectura antes de enviar un bloque incompleto
+        queue_size : int
+            Bloques que pueden esperar en la cola antes de frenar al productor
+        conversions : dict, optional
+            {columna: (unidad_origen, unidad_destino)} con columnas de
+            SENSOR_COLUMNS; los acumuladores reciben los valores convertidos
+            (la columna conserva su nombre)
+        histograms : dict, optional
+            {columna: StreamingHistogram}
+        grouped_stats : dict, optional
+            {(columna_x, columna_y): GroupedBivariateStats}, agrupado por tipo
+        predictor : FailurePredictor, optional
+            Modelo entrenado; puntúa cada bloque con las unidades originales
+        on_batch : callable, optional
+            Función (bloque, probabilidades) llamada después de procesar cada
+            bloque, en el hilo del consumidor (probabilidades es None sin predictor)
+        clock : callable
+            Reloj en segundos para medir latencias
+        """
+        self.batch_size = batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.queue_size = queue_size
+        # Conversión en el propio bloque: columnas por índice, sin copias
+        self.converter = UnitConverter(
+            conversions={SENSOR_COLUMNS.index(column): units for column, units in conversions.items()},
+            copy=False, output='numpy') if conversions else None
+        self.histograms = dict(histograms or {})
+        self.grouped_stats = dict(grouped_stats or {})
+        # Posiciones de las columnas en el bloque, resueltas una sola vez
+        self._histogram_positions = [(SENSOR_COLUMNS.index(column), histogram)
+                                     for column, histogram in self.histograms.items()]
+        self._pair_positions = [(SENSOR_COLUMNS.index(x), SENSOR_COLUMNS.index(y), accumulator)
+                                for (x, y), accumulator in self.grouped_stats.items()]
+        self.predictor = predictor
+        self.on_batch = on_batch
+        self.clock = clock
+        self._buffer = None
+        self._size = 0
+        self._oldest = None
+        self._queue = None
+        self._lock = None
+        self._closed = None
+        self.rows = 0
+        self.batches = 0
+        self.alerts = np.zeros(len(predictor.targets) if predictor is not None else 0, dtype=np.int64)
+        self.max_queue_depth = 0
+        self.backpressure_seconds = 0.0
+        self.total_latency = 0.0
+        self.max_latency_seen = 0.0
+
+    def _append(self, reading):
+        """Copia una lectura al bloque abierto (crea uno nuevo si hace falta)."""
+        if self._size == 0:
+            self._buffer = np.empty((self.batch_size, len(SENSOR_COLUMNS)), dtype=np.float64)
+            self._oldest = self.clock()
+        self._buffer[self._size] = reading_values(reading)
+        self._size += 1
+
+    def _due(self):
+        return self._size > 0 and self.clock() - self._oldest >= self.max_latency
+
+    async def _dispatch(self, consumer, force=False):
+        """
+        Envía el bloque abierto a la cola si está lleno, vencido o ``force``.
+        """
+        async with self._lock:
+            # Se revisa dentro del candado: otro envío pudo tomar el bloque mientras se esperaba
+            if self._size == 0 or not (force or self._size == self.batch_size or self._due()):
+                return
+            item = (self._buffer[:self._size], self._oldest)
+            self._buffer, self._size, self._oldest = None, 0, None
+            await self._put(item, consumer)
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        # Cede el turno para que el consumidor avance mientras se llena el siguiente bloque
+        await asyncio.sleep(0)
+
+    async def _put(self, item, consumer):
+        """
+        Pone un elemento en la cola; con la cola llena espera a que el
+        consumidor libere espacio. Si el consumidor terminó con un error (y
+        ya no vaciará la cola), lo propaga en lugar de esperar.
+        """
+        if consumer.done():
+            consumer.result()
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return
+        start = self.clock()
+        put = asyncio.ensure_future(self._queue.put(item))
+        await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+        self.backpressure_seconds += self.clock() - start
+        if not put.done():
+            put.cancel()
+            consumer.result()
+
+    async def _flush_due(self, consumer):
+        """Envía los bloques incompletos que superan la espera máxima aunque la fuente esté en silencio."""
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), self.max_latency / 2)
+            except asyncio.TimeoutError:
+                await self._dispatch(consumer)
+
+    async def _consume(self):
+        while (item := await self._queue.get()) is not None:
+            block, oldest = item
+            # El cálculo NumPy/sklearn corre en un hilo: el bucle sigue leyendo la fuente mientras tanto
+            await asyncio.to_thread(self.process, block)
+            latency = self.clock() - oldest
+            self.total_latency += latency
+            self.max_latency_seen = max(self.max_latency_seen, latency)
+
+    def process(self, block):
+        """
+        Procesa un bloque: puntúa, convierte unidades y actualiza los acumuladores.
+
+        Parameters:
+        -----------
+        block : numpy.ndarray
+            Bloque (n_filas, len(SENSOR_COLUMNS)); las conversiones se escriben en él
+        """
+        probabilities = None
+        if self.predictor is not None:
+            # El modelo se entrenó con las unidades originales: se puntúa antes de convertir
+            probabilities = self.predictor.predict_proba(block)
+            self.alerts += (probabilities >= self.predictor.threshold).sum(axis=0)
+        if self.converter is not None:
+            self.converter.transform(block)
+        for position, histogram in self._histogram_positions:
+            histogram.update(block[:, position])
+        if self._pair_positions:
+            types = block[:, 0]
+            codes = np.where(np.isnan(types), -1, types).astype(np.int8)
+            groups = pd.Categorical.from_codes(codes, categories=TYPE_CATEGORIES)
+            for x, y, accumulator in self._pair_positions:
+                accumulator.update(block[:, x], block[:, y], groups)
+        self.rows += len(block)
+        self.batches += 1
+        if self.on_batch is not None:
+            self.on_batch(block, probabilities)
+
+    async def run(self, source):
+        """
+        Ingiere una fuente hasta agotarla.
+
+        Parameters:
+        -----------
+        source : async iterable
+            Fuente de lecturas (ver generator_source, tail_csv, socket_source)
+
+        Returns:
+        --------
+        SensorIngestion
+            La propia instancia, con los acumuladores actualizados
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._lock = asyncio.Lock()
+        self._closed = asyncio.Event()
+        consumer = asyncio.create_task(self._consume())
+        timer = asyncio.create_task(self._flush_due(consumer))
+        try:
+            async for reading in source:
+                self._append(reading)
+                if self._size == self.batch_size:
+                    await self._dispatch(consumer)
+            self._closed.set()
+            await timer
+            await self._dispatch(consumer, force=True)
+            await self._put(None, consumer)
+            await consumer
+        finally:
+            self._closed.set()
+            for task in (timer, consumer):
+                if not task.done():
+                    task.cancel()
+        return self
+
+    def stats(self):
+        """
+        Métricas de la ingesta.
+
+        Returns:
+        --------
+        dict
+            rows, batches, queue_depth (bloques esperando ahora),
+            max_queue_depth, backpressure_ms (tiempo que el productor esperó
+            por la cola llena), mean_latency_ms y max_latency_ms (desde la
+            llegada de la lectura más antigua de cada bloque hasta el fin de
+            su procesamiento)
+        """
+        return {
+            'rows': self.rows,
+            'batches': self.batches,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue_depth': self.max_queue_depth,
+            'backpressure_ms': self.backpressure_seconds * 1000,
+            'mean_latency_ms': self.total_latency / self.batches * 1000 if self.batches else 0.0,
+            'max_latency_ms': self.max_latency_seen * 1000,
+        }
+
+
+if __name__ == '__main__':
+    from dataset_cache import AI4I_URL, LOCAL_MIRRORS
+    from grouped_stats import GroupedBivariateStats
+    from streaming_histogram import StreamingHistogram
+
+    # Sigue el CSV de ai4i2020 como si un proceso lo estuviera escribiendo
+    ingestion = SensorIngestion(
+        conversions={'air_temperature_k': ('K', 'C'), 'process_temperature_k': ('K', 'C')},
+        histograms={'process_temperature_k': StreamingHistogram(bins=30)},
+        grouped_stats={('rotational_speed_rpm', 'torque_nm'): GroupedBivariateStats()},
+    )
+    asyncio.run(ingestion.run(tail_csv(LOCAL_MIRRORS[AI4I_URL], idle_timeout=0.2)))
+
+    histogram = ingestion.histograms['process_temperature_k']
+    print(f'Temperatura del proceso: media {histogram.mean:.2f} °C, desv. est. {histogram.std:.2f} °C')
+    print(ingestion.grouped_stats[('rotational_speed_rpm', 'torque_nm')].summary(include_total=True)[['n', 'r', 'slope']])
+    print(ingestion.stats())
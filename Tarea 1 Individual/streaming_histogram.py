@@ -0,0 +1,255 @@
+import numpy as np
+
+
+# Número máximo aproximado de celdas finas en el modo adaptativo
+DEFAULT_RESOLUTION = 4096
+
+
+class StreamingHistogram:
+    """
+    Histograma acumulado por bloques junto con sus momentos (n, media, varianza, mín, máx).
+
+    Cada bloque se recorre una sola vez: se suman los conteos por celda y se
+    combinan los momentos con la fórmula paralela de Chan, de modo que el
+    histograma de meses de datos se construye sin tenerlos en memoria. Dos
+    acumuladores (de distintos bloques o procesos) se combinan con ``merge``.
+
+    Hay dos modos:
+
+    - Rango fijo (``range`` dado): ``bins`` celdas iguales en ese rango, con
+      conteos exactos; los valores fuera del rango se cuentan aparte.
+    - Adaptativo (sin ``range``): celdas finas de ancho potencia de dos
+      alineadas en cero que se duplican cuando los datos superan
+      ``resolution`` celdas. Al dibujar se reagrupan en ``bins`` celdas
+      iguales entre el mínimo y el máximo, o en celdas de igual frecuencia
+      (cuantiles) con ``mode='quantile'``.
+    """
+
+    def __init__(self, bins=30, range=None, resolution=DEFAULT_RESOLUTION):
+        """
+        Inicializa un histograma vacío.
+
+        Parameters:
+        -----------
+        bins : int
+            Número de celdas del histograma final
+        range : tuple, optional
+            (mínimo, máximo) de las celdas en el modo de rango fijo
+        resolution : int
+            Celdas finas aproximadas del modo adaptativo
+        """
+        self.bins = bins
+        self.range = range
+        self.resolution = resolution
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.underflow = 0
+        self.overflow = 0
+        if range is not None:
+            self.edges_ = np.linspace(range[0], range[1], bins + 1)
+            self.counts_ = np.zeros(bins, dtype=np.int64)
+        else:
+            self.width_ = None
+            self.start_ = 0
+            self.counts_ = np.zeros(0, dtype=np.int64)
+
+    def update(self, values):
+        """
+        Agrega un bloque de valores (los no finitos se descartan).
+
+        Parameters:
+        -----------
+        values : array-like
+            Valores del bloque (ej: un bloque de process_temperature_k)
+
+        Returns:
+        --------
+        StreamingHistogram
+            La propia instancia
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+
+        other = StreamingHistogram(self.bins, self.range, self.resolution)
+        other.n = values.size
+        other.mean = float(values.mean())
+        other.m2 = float(np.square(values - other.mean).sum())
+        other.min = float(values.min())
+        other.max = float(values.max())
+
+        if self.range is not None:
+            low, high = self.range
+            inside = (values >= low) & (values <= high)
+            other.underflow = int((values < low).sum())
+            other.overflow = int((values > high).sum())
+            index = ((values[inside] - low) * (self.bins / (high - low))).astype(np.intp)
+            # El borde derecho pertenece a la última celda, como en numpy.histogram
+            np.minimum(index, self.bins - 1, out=index)
+            other.counts_ = np.bincount(index, minlength=self.bins)
+        else:
+            width = max(self.width_ or 0.0, _initial_width(other.min, other.max, self.resolution))
+            index = np.floor(values / width).astype(np.int64)
+            other.width_ = width
+            other.start_ = int(index.min())
+            other.counts_ = np.bincount(index - other.start_)
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Combina los resultados parciales de otro histograma.
+
+        Parameters:
+        -----------
+        other : StreamingHistogram
+            Histograma de otro bloque o proceso, con el mismo modo
+
+        Returns:
+        --------
+        StreamingHistogram
+            La propia instancia
+
+        Raises:
+        -------
+        ValueError
+            Si los histogramas tienen rangos o modos distintos
+        """
+        if (self.range is None) != (other.range is None) or (
+                self.range is not None and not np.array_equal(self.edges_, other.edges_)):
+            raise ValueError('Solo se pueden combinar histogramas con las mismas celdas')
+        if other.n == 0:
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+
+        if self.range is not None:
+            self.counts_ = self.counts_ + other.counts_
+            return self
+
+        if self.width_ is None:
+            self.width_, self.start_, self.counts_ = other.width_, other.start_, other.counts_.copy()
+        else:
+            # Ambos anchos son potencias de dos: se lleva el más fino al más grueso,
+            # duplicando el ancho mientras la unión no quepa en 2 * resolution celdas
+            width = max(self.width_, other.width_)
+            low = min(self.start_ * self.width_, other.start_ * other.width_)
+            high = max((self.start_ + len(self.counts_)) * self.width_,
+                       (other.start_ + len(other.counts_)) * other.width_)
+            while (high - low) / width > 2 * self.resolution:
+                width *= 2
+            start, counts = _coarsen(self.start_, self.counts_, self.width_, width)
+            other_start, other_counts = _coarsen(other.start_, other.counts_, other.width_, width)
+            new_start = min(start, other_start)
+            stop = max(start + len(counts), other_start + len(other_counts))
+            combined = np.zeros(stop - new_start, dtype=np.int64)
+            combined[start - new_start:start - new_start + len(counts)] += counts
+            combined[other_start - new_start:other_start - new_start + len(other_counts)] += other_counts
+            self.width_, self.start_, self.counts_ = width, new_start, combined
+        return self
+
+    @property
+    def std(self):
+        """float: Desviación estándar muestral (ddof=1, como pandas)."""
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else float('nan')
+
+    def histogram(self, bins=None, mode='fixed'):
+        """
+        Devuelve los conteos y bordes del histograma acumulado.
+
+        Parameters:
+        -----------
+        bins : int, optional
+            Número de celdas (por defecto el indicado al crear el histograma)
+        mode : str
+            'fixed' para celdas de igual ancho o 'quantile' para celdas con
+            aproximadamente el mismo número de valores (solo modo adaptativo)
+
+        Returns:
+        --------
+        tuple
+            (conteos, bordes) como numpy.ndarray, igual que numpy.histogram
+        """
+        if mode not in ('fixed', 'quantile'):
+            raise ValueError("mode debe ser 'fixed' o 'quantile'")
+        if self.range is not None:
+            if mode == 'quantile' or (bins is not None and bins != self.bins):
+                raise ValueError('Un histograma de rango fijo solo tiene sus propias celdas')
+            return self.counts_.copy(), self.edges_.copy()
+
+        bins = bins or self.bins
+        if self.n == 0 or self.min == self.max:
+            # Sin datos o un único valor: mismo criterio que numpy.histogram
+            center = self.min if self.n else 0.5
+            counts = np.zeros(bins)
+            counts[bins // 2] = self.n
+            return counts, np.linspace(center - 0.5, center + 0.5, bins + 1)
+        # Distribución acumulada sobre las celdas finas, recortada al mínimo y máximo reales
+        fine_edges = (self.start_ + np.arange(len(self.counts_) + 1)) * self.width_
+        fine_edges[0], fine_edges[-1] = self.min, self.max
+        cumulative = np.concatenate([[0], np.cumsum(self.counts_)]).astype(np.float64)
+        if mode == 'fixed':
+            edges = np.linspace(self.min, self.max, bins + 1)
+            counts = np.diff(np.interp(edges, fine_edges, cumulative))
+        else:
+            levels = np.linspace(0.0, self.n, bins + 1)
+            edges = np.interp(levels, cumulative, fine_edges)
+            counts = np.diff(levels)
+        return counts, edges
+
+    def plot(self, ax, bins=None, mode='fixed', **hist_kws):
+        """
+        Dibuja el histograma a partir de los conteos acumulados.
+
+        Parameters:
+        -----------
+        ax : matplotlib.axes.Axes
+            Ejes donde dibujar
+        bins : int, optional
+            Número de celdas
+        mode : str
+            'fixed' o 'quantile' (ver ``histogram``)
+        **hist_kws
+            Argumentos de estilo para ``ax.hist`` (color, alpha, edgecolor...)
+
+        Returns:
+        --------
+        tuple
+            Lo mismo que ``ax.hist``
+        """
+        counts, edges = self.histogram(bins, mode)
+        if mode == 'quantile':
+            # Con celdas de distinto ancho la altura representa densidad
+            counts = counts / np.diff(edges)
+        return ax.hist(edges[:-1], bins=edges, weights=counts, **hist_kws)
+
+
+def _initial_width(low, high, resolution):
+    """Ancho potencia de dos que cubre [low, high] con a lo sumo ``resolution`` celdas."""
+    span = max(high - low, abs(high) * 1e-9, 1e-12)
+    return float(2.0 ** np.ceil(np.log2(span / resolution)))
+
+
+def _coarsen(start, counts, width, target_width):
+    """Reagrupa celdas alineadas en cero de ancho ``width`` a ``target_width``."""
+    while width < target_width:
+        if start % 2:
+            counts = np.concatenate([[0], counts])
+            start -= 1
+        if len(counts) % 2:
+            counts = np.concatenate([counts, [0]])
+        counts = counts.reshape(-1, 2).sum(axis=1)
+        start //= 2
+        width *= 2
+    return start, counts
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+from dataset_cache import AI4I_URL, LOCAL_MIRRORS, load_dataset
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def test_load_dataset_matches_read_csv(tmp_path):
+    """
+    La caché columnar devuelve los mismos datos que pandas.read_csv sobre el espejo local
+    """
+    expected = pd.read_csv(LOCAL_MIRRORS[AI4I_URL])
+    df = load_dataset(AI4I_URL, cache_dir=str(tmp_path))
+
+    assert list(df.columns) == list(expected.columns)
+    assert isinstance(df['Type'].dtype, pd.CategoricalDtype)
+    assert (df['Type'].astype(str) == expected['Type']).all()
+    np.testing.assert_array_equal(df['Torque [Nm]'], expected['Torque [Nm]'])
+
+    projected = load_dataset(AI4I_URL, columns=['Torque [Nm]', 'Type'], cache_dir=str(tmp_path))
+    assert list(projected.columns) == ['Torque [Nm]', 'Type']
+    assert _is_memory_mapped(projected['Torque [Nm]'].to_numpy())
+
+
+def test_cache_is_keyed_by_content_hash(tmp_path):
+    """
+    Un cambio en el contenido del CSV genera una nueva entrada de caché
+    """
+    csv_path = tmp_path / 'sensores.csv'
+    cache_dir = tmp_path / 'cache'
+    pd.DataFrame({'a': [1.0, 2.0], 'b': ['x', 'y']}).to_csv(csv_path, index=False)
+    first = load_dataset(str(csv_path), cache_dir=str(cache_dir))
+
+    pd.DataFrame({'a': [3.0, 4.0, 5.0], 'b': ['x', 'y', None]}).to_csv(csv_path, index=False)
+    os.utime(csv_path, ns=(0, 0))
+    second = load_dataset(str(csv_path), cache_dir=str(cache_dir))
+
+    assert first['a'].tolist() == [1.0, 2.0]
+    assert second['a'].tolist() == [3.0, 4.0, 5.0]
+    assert second['b'].isna().tolist() == [False, False, True]
+    entries = [name for name in os.listdir(cache_dir) if name != 'index.json']
+    assert len(entries) == 2
+
+
+def test_hash_index_is_replaced_atomically(tmp_path):
+    """
+    Varios hilos que calculan hashes a la vez nunca leen un index.json a medio escribir
+    """
+    import hashlib
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+
+    from dataset_cache import _file_hash
+
+    paths = []
+    for number in range(40):
+        path = tmp_path / f'datos_{number}.csv'
+        path.write_text(f'a,b\n{number},{number * 2}\n' * 500)
+        paths.append(str(path))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        hashes = list(executor.map(lambda path: _file_hash(path, str(tmp_path)), paths))
+
+    for path, digest in zip(paths, hashes):
+        with open(path, 'rb') as file:
+            assert digest == hashlib.sha256(file.read()).hexdigest()
+    with open(tmp_path / 'index.json', encoding='utf-8') as file:
+        assert isinstance(json.load(file), dict)
+    assert not [name for name in os.listdir(tmp_path) if name.startswith('.index_')]
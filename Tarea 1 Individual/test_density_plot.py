@@ -0,0 +1,51 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import PathCollection
+from matplotlib.image import AxesImage
+from density_plot import density_grid, plot_relationship
+
+
+def test_density_grid_matches_histogram2d():
+    """
+    La rejilla de densidad coincide con numpy.histogram2d y descarta valores no finitos
+    """
+    rng = np.random.default_rng(0)
+    x = rng.random(5000)
+    y = rng.random(5000)
+    weights = rng.random(5000)
+
+    grid, extent = density_grid(x, y, bins=(20, 10), weights=weights, extent=(0, 1, 0, 1))
+    expected, _, _ = np.histogram2d(x, y, bins=(20, 10), range=[[0, 1], [0, 1]], weights=weights)
+    assert extent == (0, 1, 0, 1)
+    np.testing.assert_allclose(grid, expected.T)
+
+    counts, _ = density_grid(np.append(x, np.nan), np.append(y, 0.5), bins=10)
+    assert counts.sum() == 5000
+
+
+def test_plot_relationship_switches_to_density_above_threshold():
+    """
+    Por encima del umbral se dibuja una imagen cuyo color es la tasa de fallo por celda
+    """
+    x = np.array([0.0, 0.0, 1.0, 1.0])
+    y = np.array([0.0, 0.0, 1.0, 1.0])
+    failure = np.array([True, False, True, True])
+    fig, (ax_scatter, ax_density, ax_type) = plt.subplots(1, 3)
+
+    assert isinstance(plot_relationship(ax_scatter, x, y, hue=failure, threshold=10), PathCollection)
+
+    image = plot_relationship(ax_density, x, y, hue=failure, threshold=3, bins=2)
+    assert isinstance(image, AxesImage)
+    rates = image.get_array()
+    assert rates[0, 0] == 0.5 and rates[1, 1] == 1.0
+    assert np.ma.is_masked(rates[0, 1])
+
+    image = plot_relationship(ax_type, x, y, hue=pd.Categorical(['L', 'M', 'L', 'L']), mode='density', bins=2)
+    assert image.get_array().shape == (2, 2, 4)
+    assert [text.get_text() for text in ax_type.legend().get_texts()] == ['L', 'M']
+    plt.close(fig)
@@ -0,0 +1,130 @@
+import time
+
+import numpy as np
+import pytest
+from dataset_cache import AI4I_URL, LOCAL_MIRRORS, load_dataset
+from failure_scoring import FEATURE_NAMES, SENSOR_COLUMNS, FailureFeatures, FailurePredictor, StreamScorer
+from typed_csv import AI4I_SCHEMA
+
+
+@pytest.fixture(scope='module')
+def ai4i():
+    df = load_dataset(LOCAL_MIRRORS[AI4I_URL], schema=AI4I_SCHEMA)
+    rng = np.random.default_rng(0)
+    test = rng.random(len(df)) < 0.3
+    return df[~test].reset_index(drop=True), df[test].reset_index(drop=True)
+
+
+def test_features_match_pandas_formulas(ai4i):
+    """
+    Las características vectorizadas coinciden con las fórmulas calculadas en pandas
+    """
+    df = ai4i[0].head(500)
+    features = FailureFeatures().transform(df)
+    omega = df['rotational_speed_rpm'].astype(float) * 2 * np.pi / 60
+    torque = df['torque_nm'].astype(float)
+
+    assert features.shape == (len(df), len(FEATURE_NAMES))
+    np.testing.assert_allclose(features[:, 0], df['type'].map({'L': 0, 'M': 1, 'H': 2}).astype(float))
+    np.testing.assert_allclose(features[:, 3], omega)
+    np.testing.assert_allclose(features[:, 6], torque * omega)
+    np.testing.assert_allclose(features[:, 7], df['process_temperature_k'].astype(float)
+                               - df['air_temperature_k'].astype(float))
+    np.testing.assert_allclose(features[:, 8], df['tool_wear_min'].astype(float) * torque)
+    # El arreglo NumPy con el tipo codificado da el mismo resultado y no se modifica
+    block = features[:, :len(SENSOR_COLUMNS)].copy()
+    block[:, 3] = df['rotational_speed_rpm']
+    original = block.copy()
+    np.testing.assert_allclose(FailureFeatures().transform(block), features)
+    np.testing.assert_array_equal(block, original)
+
+
+def test_stream_scoring_matches_batch_predict_proba(ai4i):
+    """
+    Puntuar el flujo en micro-lotes da las mismas probabilidades que un único predict_proba
+    """
+    train, test = ai4i
+    predictor = FailurePredictor(targets=['machine_failure', 'hdf']).fit(train)
+    metrics = predictor.evaluate(test)
+    assert metrics.loc['machine_failure', 'roc_auc'] > 0.95
+    assert metrics.loc['hdf', 'roc_auc'] > 0.95
+
+    readings = test[SENSOR_COLUMNS].head(1000)
+    expected = predictor.predict_proba(readings)
+    records = readings.astype({'type': object}).to_dict('records')
+    scorer = StreamScorer(predictor, batch_size=128, max_latency_ms=1e6)
+    batches = list(scorer.score_stream(records))
+
+    assert [len(batch) for batch in batches] == [128] * 7 + [104]
+    np.testing.assert_allclose(np.concatenate(batches), expected)
+    stats = scorer.stats()
+    assert stats['rows'] == 1000 and stats['batches'] == 8
+
+
+def test_stream_scorer_flushes_after_max_latency(ai4i):
+    """
+    Un lote incompleto se puntúa cuando la lectura más antigua supera la espera máxima
+    """
+    now = [0.0]
+    predictor = FailurePredictor().fit(ai4i[0])
+    scorer = StreamScorer(predictor, batch_size=64, max_latency_ms=5, clock=lambda: now[0])
+    reading = ['M', 300.0, 310.0, 1500, 40.0, 100]
+
+    assert scorer.push(reading) is None
+    assert not scorer.due()
+    now[0] = 0.006
+    assert scorer.due()
+    probabilities = scorer.push(reading)
+    assert probabilities.shape == (2, 1)
+    assert scorer.flush().shape == (0, 1)
+
+
+def test_score_stream_flushes_a_quiet_blocking_feed(ai4i):
+    """
+    Con un iterable que se bloquea, el lote incompleto se puntúa al vencer la espera máxima
+    """
+    predictor = FailurePredictor().fit(ai4i[0])
+    reading = ['M', 300.0, 310.0, 1500, 40.0, 100]
+
+    def feed():
+        yield from [reading] * 3
+        time.sleep(0.5)
+        yield reading
+
+    def failing_feed():
+        yield reading
+        raise OSError('sensor desconectado')
+
+    scorer = StreamScorer(predictor, batch_size=64, max_latency_ms=20)
+    start = time.perf_counter()
+    arrivals = []
+    for probabilities in scorer.score_stream(feed()):
+        arrivals.append((len(probabilities), time.perf_counter() - start))
+
+    assert [size for size, _ in arrivals] == [3, 1]
+    assert arrivals[0][1] < 0.3
+    with pytest.raises(OSError, match='sensor desconectado'):
+        list(StreamScorer(predictor, batch_size=64).score_stream(failing_feed()))
+
+
+def test_import_does_not_load_sklearn_and_features_work_in_pipeline(ai4i):
+    """
+    Importar failure_scoring y sensor_ingestion no carga sklearn, y FailureFeatures funciona en un Pipeline
+    """
+    import os
+    import subprocess
+    import sys
+    from sklearn.base import clone
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    code = 'import sys, failure_scoring, sensor_ingestion; print("sklearn" in sys.modules)'
+    completed = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == 'False'
+
+    df = ai4i[0].head(200)
+    pipeline = Pipeline([('features', clone(FailureFeatures())), ('scale', StandardScaler())])
+    result = pipeline.set_output(transform='pandas').fit_transform(df[SENSOR_COLUMNS])
+    assert list(result.columns) == FEATURE_NAMES
+    np.testing.assert_allclose(result['power_w'].mean(), 0.0, atol=1e-9)
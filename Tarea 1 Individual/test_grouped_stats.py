@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from grouped_stats import TOTAL_KEY, GroupedBivariateStats
+
+
+def _sample(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    types = pd.Categorical(rng.choice(['H', 'L', 'M'], n))
+    x = rng.normal(1500, 180, n)
+    y = 115 - 0.05 * x + rng.normal(0, 5, n) + (types.codes == 0) * 3
+    return x, y, types
+
+
+def test_grouped_stats_match_linregress_per_group():
+    """
+    Las estadísticas por grupo y la fila total coinciden con scipy.stats.linregress
+    """
+    x, y, types = _sample()
+    summary = GroupedBivariateStats().update(x, y, types).summary(include_total=True)
+
+    assert list(summary.index) == ['H', 'L', 'M', TOTAL_KEY]
+    for group in ['H', 'L', 'M', TOTAL_KEY]:
+        mask = np.ones(len(x), dtype=bool) if group == TOTAL_KEY else np.asarray(types == group)
+        expected = stats.linregress(x[mask], y[mask])
+        row = summary.loc[group]
+        assert row['n'] == mask.sum()
+        np.testing.assert_allclose(
+            row[['r', 'slope', 'intercept', 'p_value', 'stderr', 'intercept_stderr']].to_numpy(dtype=float),
+            [expected.rvalue, expected.slope, expected.intercept, expected.pvalue,
+             expected.stderr, expected.intercept_stderr],
+            rtol=1e-9, atol=1e-300)
+
+
+def test_grouped_stats_merge_across_chunks():
+    """
+    Combinar bloques (con grupos distintos en cada uno) da el mismo resultado que una sola pasada
+    """
+    x, y, types = _sample(seed=1)
+    groups = np.asarray(types)
+    full = GroupedBivariateStats().update(x, y, groups).summary()
+
+    merged = GroupedBivariateStats()
+    for start in range(0, len(x), 700):
+        part = GroupedBivariateStats().update(x[start:start + 700], y[start:start + 700],
+                                              groups[start:start + 700])
+        merged.merge(part)
+    merged.update(x[:0], y[:0], groups[:0])
+
+    pd.testing.assert_frame_equal(merged.summary().sort_index(), full, rtol=1e-9)
@@ -0,0 +1,48 @@
+import json
+import os
+
+from report_runner import run_reports
+
+
+def test_run_reports_writes_outputs_and_skips_unchanged(tmp_path):
+    """
+    Los reportes se generan sin interfaz gráfica con su JSON de estadísticas y se omiten si nada cambió
+    """
+    options = dict(names=['histograma_temperatura', 'scatter_plot_fixed'], output_dir=str(tmp_path / 'reportes'),
+                   formats=('png', 'svg'), dpi=50, n_jobs=2, cache_dir=str(tmp_path / 'cache'))
+    first = run_reports(**options)
+
+    assert [result['status'] for result in first] == ['generado', 'generado']
+    for result in first:
+        for filename in result['files']:
+            assert os.path.getsize(tmp_path / 'reportes' / filename) > 0
+    with open(tmp_path / 'reportes' / 'histograma_temperatura.json', encoding='utf-8') as file:
+        sidecar = json.load(file)
+    assert sidecar['stats']['n'] == 10000
+    assert sidecar['params'] == {'bins': 30}
+
+    second = run_reports(**options)
+    assert [result['status'] for result in second] == ['omitido', 'omitido']
+
+    options['dpi'] = 60
+    third = run_reports(**options)
+    assert [result['status'] for result in third] == ['generado', 'generado']
+
+
+def test_code_hash_covers_local_helper_modules(tmp_path, monkeypatch):
+    """
+    Cambiar un módulo auxiliar que usa el reporte (no solo el del reporte) cambia su hash de código
+    """
+    import shutil
+
+    import report_runner
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ['scatter_plot_fixed', 'density_plot', 'grouped_stats', 'dataset_cache', 'typed_csv']:
+        shutil.copy(os.path.join(here, f'{name}.py'), tmp_path)
+    monkeypatch.setattr(report_runner, '_HERE', str(tmp_path))
+    before = report_runner._module_hash('scatter_plot_fixed')
+
+    with open(tmp_path / 'grouped_stats.py', 'a', encoding='utf-8') as file:
+        file.write('\n# cambio\n')
+    assert report_runner._module_hash('scatter_plot_fixed') != before
@@ -0,0 +1,151 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from dataset_cache import AI4I_URL, LOCAL_MIRRORS, load_dataset
+from failure_scoring import SENSOR_COLUMNS, sensor_matrix
+from grouped_stats import GroupedBivariateStats
+from sensor_ingestion import SensorIngestion, generator_source, socket_source, tail_csv
+from streaming_histogram import StreamingHistogram
+from typed_csv import AI4I_SCHEMA
+
+
+def _csv_line(row):
+    return ','.join(['LMH'[int(row[0])]] + [repr(value) for value in row[1:].tolist()])
+
+
+@pytest.fixture(scope='module')
+def readings():
+    df = load_dataset(LOCAL_MIRRORS[AI4I_URL], schema=AI4I_SCHEMA)
+    return sensor_matrix(df[SENSOR_COLUMNS].head(3000))
+
+
+def test_ingestion_matches_full_batch_statistics(readings):
+    """
+    Convertir y acumular por micro-lotes da los mismos resultados que procesar todo el bloque
+    """
+    blocks = []
+    ingestion = SensorIngestion(
+        batch_size=256,
+        conversions={'process_temperature_k': ('K', 'C'), 'rotational_speed_rpm': ('rpm', 'rad/s')},
+        histograms={'process_temperature_k': StreamingHistogram(range=(30, 45))},
+        grouped_stats={('rotational_speed_rpm', 'torque_nm'): GroupedBivariateStats()},
+        on_batch=lambda block, probabilities: blocks.append(block.copy()),
+    )
+    asyncio.run(ingestion.run(generator_source(readings.tolist())))
+
+    expected = readings.copy()
+    expected[:, 2] -= 273.15
+    expected[:, 3] *= 2 * np.pi / 60
+    assert [len(block) for block in blocks] == [256] * 11 + [184]
+    np.testing.assert_allclose(np.concatenate(blocks), expected)
+
+    histogram = ingestion.histograms['process_temperature_k']
+    counts, _ = np.histogram(expected[:, 2], bins=30, range=(30, 45))
+    np.testing.assert_array_equal(histogram.counts_, counts)
+    assert histogram.mean == pytest.approx(expected[:, 2].mean())
+
+    direct = GroupedBivariateStats().update(expected[:, 3], expected[:, 4], np.array(['L', 'M', 'H'])[
+        expected[:, 0].astype(int)]).summary(include_total=True)
+    summary = ingestion.grouped_stats[('rotational_speed_rpm', 'torque_nm')].summary(include_total=True)
+    np.testing.assert_allclose(summary.loc[direct.index, ['n', 'r', 'slope']].to_numpy(dtype=float),
+                               direct[['n', 'r', 'slope']].to_numpy(dtype=float))
+    assert ingestion.stats()['rows'] == len(readings)
+
+
+def test_slow_consumer_applies_backpressure(readings):
+    """
+    Con un consumidor lento la cola no supera su tamaño y el productor espera
+    """
+    ingestion = SensorIngestion(batch_size=100, queue_size=2,
+                                on_batch=lambda block, probabilities: time.sleep(0.01))
+    asyncio.run(ingestion.run(generator_source(readings[:2000].tolist())))
+    stats = ingestion.stats()
+
+    assert stats['rows'] == 2000 and stats['batches'] == 20
+    assert stats['max_queue_depth'] == 2
+    assert stats['backpressure_ms'] > 0
+    assert stats['queue_depth'] == 0
+
+
+@pytest.mark.parametrize('n_readings', [50, 85, 90, 95])
+def test_consumer_error_is_raised_without_hanging(readings, n_readings):
+    """
+    Un error del consumidor se propaga aunque la cola quede llena al enviar el último bloque
+    """
+    def fail(block, probabilities):
+        raise RuntimeError('fallo del consumidor')
+
+    ingestion = SensorIngestion(batch_size=10, queue_size=8, on_batch=fail)
+
+    async def main():
+        await asyncio.wait_for(ingestion.run(generator_source(readings[:n_readings].tolist())), timeout=5)
+
+    with pytest.raises(RuntimeError, match='fallo del consumidor'):
+        asyncio.run(main())
+
+
+def test_partial_batches_flush_after_max_latency(readings):
+    """
+    Con una fuente lenta los bloques incompletos se envían al vencer la espera máxima
+    """
+    ingestion = SensorIngestion(batch_size=1000, max_latency_ms=20)
+    asyncio.run(ingestion.run(generator_source(readings[:30].tolist(), interval=0.005)))
+    stats = ingestion.stats()
+
+    assert stats['rows'] == 30
+    assert stats['batches'] > 1
+    assert stats['max_latency_ms'] < 200
+
+
+def test_tail_csv_follows_a_growing_file(tmp_path, readings):
+    """
+    tail_csv entrega las filas que se agregan al archivo, incluidas las escritas en varias partes
+    """
+    path = tmp_path / 'sensores.csv'
+    path.write_text('Type,Air temperature [K],Process temperature [K],Rotational speed [rpm],'
+                    'Torque [Nm],Tool wear [min]\n')
+    lines = [_csv_line(row) for row in readings[:50]]
+
+    async def writer():
+        with open(path, 'a') as handle:
+            for line in lines[:-1]:
+                handle.write(line + '\n')
+                handle.flush()
+                await asyncio.sleep(0.001)
+            # Última fila escrita en dos partes y sin salto de línea final
+            handle.write(lines[-1][:5])
+            handle.flush()
+            await asyncio.sleep(0.02)
+            handle.write(lines[-1][5:])
+
+    async def main():
+        blocks = []
+        ingestion = SensorIngestion(batch_size=16, max_latency_ms=10,
+                                    on_batch=lambda block, probabilities: blocks.append(block.copy()))
+        task = asyncio.create_task(writer())
+        await ingestion.run(tail_csv(str(path), poll_interval=0.002, idle_timeout=0.1))
+        await task
+        return np.concatenate(blocks)
+
+    np.testing.assert_allclose(asyncio.run(main()), readings[:50])
+
+
+def test_socket_source_reads_lines_until_close(readings):
+    """
+    socket_source entrega una lectura por línea hasta que el emisor cierra la conexión
+    """
+    async def send(reader, writer):
+        for row in readings[:40]:
+            writer.write((_csv_line(row) + '\n').encode())
+        await writer.drain()
+        writer.close()
+
+    async def main():
+        server = await asyncio.start_server(send, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return [reading async for reading in socket_source('127.0.0.1', port)]
+
+    np.testing.assert_allclose(np.array(asyncio.run(main())), readings[:40])
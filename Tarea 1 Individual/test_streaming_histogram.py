@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from streaming_histogram import StreamingHistogram
+
+
+def test_fixed_range_histogram_matches_numpy_across_chunks():
+    """
+    El modo de rango fijo acumula por bloques los mismos conteos y momentos que numpy
+    """
+    rng = np.random.default_rng(0)
+    values = rng.normal(310.0, 1.5, 20_000)
+    histogram = StreamingHistogram(bins=30, range=(305.0, 315.0))
+    for chunk in np.array_split(values, 7):
+        histogram.update(chunk)
+
+    inside = values[(values >= 305.0) & (values <= 315.0)]
+    expected, edges = np.histogram(inside, bins=30, range=(305.0, 315.0))
+    counts, histogram_edges = histogram.histogram()
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_allclose(histogram_edges, edges)
+    assert histogram.underflow + histogram.overflow == len(values) - len(inside)
+    assert histogram.mean == pytest.approx(values.mean())
+    assert histogram.std == pytest.approx(values.std(ddof=1))
+    assert (histogram.min, histogram.max) == (values.min(), values.max())
+
+
+def test_adaptive_histogram_merges_workers_and_supports_quantile_bins():
+    """
+    Histogramas adaptativos de distintos bloques se combinan y aproximan los conteos y cuantiles exactos
+    """
+    rng = np.random.default_rng(1)
+    values = np.concatenate([rng.normal(300.0, 2.0, 50_000), rng.normal(1e4, 5.0, 10)])
+    merged = StreamingHistogram(bins=20)
+    for chunk in np.array_split(values, 4):
+        merged.merge(StreamingHistogram(bins=20).update(chunk))
+
+    assert len(merged.counts_) <= 2 * merged.resolution
+    assert merged.counts_.sum() == len(values)
+    counts, edges = merged.histogram()
+    expected, expected_edges = np.histogram(values, bins=20)
+    np.testing.assert_allclose(edges, expected_edges)
+    np.testing.assert_allclose(counts, expected, atol=len(values) * 0.01)
+
+    counts, edges = merged.histogram(bins=4, mode='quantile')
+    np.testing.assert_allclose(counts, len(values) / 4)
+    np.testing.assert_allclose(edges[1:-1], np.quantile(values, [0.25, 0.5, 0.75]), atol=4 * merged.width_)
+
+    with pytest.raises(ValueError):
+        merged.merge(StreamingHistogram(range=(0.0, 1.0)))
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from dataset_cache import AI4I_URL, LOCAL_MIRRORS, load_dataset
+from typed_csv import AI4I_SCHEMA, HOUSING_SCHEMA, clean_column_name, read_typed_csv
+
+HOUSING_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Proyecto Final', 'Housing.csv')
+
+
+def test_read_typed_csv_ai4i_matches_read_csv():
+    """
+    El lector tipado conserva los valores de pandas.read_csv con tipos reducidos y nombres limpios
+    """
+    path = LOCAL_MIRRORS[AI4I_URL]
+    expected = pd.read_csv(path)
+    df = read_typed_csv(path, AI4I_SCHEMA)
+
+    assert list(df.columns) == [clean_column_name(column) for column in expected.columns]
+    assert df['rotational_speed_rpm'].dtype == np.int16
+    assert df['torque_nm'].dtype == np.float32
+    assert df['machine_failure'].dtype == bool
+    assert isinstance(df['type'].dtype, pd.CategoricalDtype)
+    np.testing.assert_array_equal(df['rotational_speed_rpm'], expected['Rotational speed [rpm]'])
+    np.testing.assert_allclose(df['torque_nm'], expected['Torque [Nm]'], rtol=1e-6)
+    assert df['machine_failure'].sum() == expected['Machine failure'].sum()
+    assert df.memory_usage(deep=True).sum() < expected.memory_usage(deep=True).sum() / 2
+
+
+def test_read_typed_csv_projects_columns_and_parses_flags():
+    """
+    Solo se leen las columnas pedidas (por nombre original o limpio) y yes/no se parsea como bandera
+    """
+    df = read_typed_csv(HOUSING_CSV, HOUSING_SCHEMA, columns=['price', 'mainroad', 'furnishingstatus'],
+                        flag_dtype='uint8')
+    expected = pd.read_csv(HOUSING_CSV)
+
+    assert list(df.columns) == ['price', 'mainroad', 'furnishingstatus']
+    assert df['mainroad'].dtype == np.uint8
+    assert df['mainroad'].tolist() == (expected['mainroad'] == 'yes').astype(int).tolist()
+    assert df['price'].tolist() == expected['price'].tolist()
+
+    with pytest.raises(KeyError):
+        read_typed_csv(HOUSING_CSV, HOUSING_SCHEMA, columns=['precio'])
+
+
+def test_read_typed_csv_keeps_values_that_do_not_fit(tmp_path):
+    """
+    Un entero fuera del rango del tipo declarado se guarda en un tipo más ancho sin perder valores
+    """
+    path = tmp_path / 'sensores.csv'
+    pd.DataFrame({'Rotational speed [rpm]': [1500, 70000]}).to_csv(path, index=False)
+    df = read_typed_csv(str(path), AI4I_SCHEMA)
+    assert df['rotational_speed_rpm'].tolist() == [1500, 70000]
+
+
+def test_load_dataset_with_schema(tmp_path):
+    """
+    La caché guarda los tipos reducidos y los nombres limpios del esquema
+    """
+    df = load_dataset(AI4I_URL, schema=AI4I_SCHEMA, columns=['torque_nm', 'type'], cache_dir=str(tmp_path))
+    assert list(df.columns) == ['torque_nm', 'type']
+    assert df['torque_nm'].dtype == np.float32
+    assert isinstance(df['type'].dtype, pd.CategoricalDtype)
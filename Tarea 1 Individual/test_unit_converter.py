@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 from unit_converter import UnitConverter
+from units import DEFAULT_REGISTRY, UnitRegistry, convert_block
 
 def test_unit_converter():
     """
@@ -74,6 +76,134 @@ def test_with_pipeline():
     print(df_transformed)
     print("\nPipeline aplicado exitosamente!")
 
+def test_multi_column_conversion():
+    """
+    Convierte varias columnas y unidades en una sola pasada sin modificar la entrada
+    """
+    df = pd.DataFrame({
+        'air_temperature_k': [300.0, 310.0],
+        'process_temperature_c': [25.0, 100.0],
+        'rotational_speed_rpm': [60.0, 1500.0],
+        'torque_nm': [1.3558179483314004, 40.0],
+        'tool_wear_min': [0, 10],
+    })
+    original = df.copy()
+
+    converter = UnitConverter(conversions={
+        'air_temperature_k': ('K', '°C'),
+        'process_temperature_c': ('°C', '°F'),
+        'rotational_speed_rpm': ('rpm', 'rad/s'),
+        'torque_nm': ('Nm', 'lbf·ft'),
+    })
+    result = converter.transform(df)
+
+    np.testing.assert_allclose(result['air_temperature_k'], [26.85, 36.85])
+    np.testing.assert_allclose(result['process_temperature_c'], [77.0, 212.0])
+    np.testing.assert_allclose(result['rotational_speed_rpm'], [2 * np.pi, 50 * np.pi])
+    np.testing.assert_allclose(result['torque_nm'][0], 1.0)
+    assert result['tool_wear_min'].tolist() == [0, 10]
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_in_place_conversion():
+    """
+    Con copy=False la conversión se escribe en el propio DataFrame
+    """
+    df = pd.DataFrame({'air_temperature_k': [273.15, 373.15], 'humidity': [45, 50]})
+    result = UnitConverter(column_name='air_temperature_k', copy=False).transform(df)
+
+    assert result is df
+    np.testing.assert_allclose(df['air_temperature_k'], [0.0, 100.0])
+
+
+def test_numpy_output_in_pipeline():
+    """
+    Con output='numpy' el convertidor entrega un ndarray al siguiente paso del Pipeline
+    """
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import FunctionTransformer
+
+    df = pd.DataFrame({'air_temperature_k': [273.15, 283.15], 'feature_1': [1, 2]})
+    pipeline = Pipeline([
+        ('unit_converter', UnitConverter(column_name='air_temperature_k', output='numpy')),
+        ('identity', FunctionTransformer()),
+    ])
+    result = pipeline.fit_transform(df)
+
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_allclose(result, [[0.0, 1.0], [10.0, 2.0]], atol=1e-9)
+    np.testing.assert_allclose(df['air_temperature_k'], [273.15, 283.15])
+
+
+def test_import_does_not_load_sklearn_and_clone_works():
+    """
+    Importar el convertidor no carga sklearn, y sklearn puede clonarlo y cambiar sus parámetros
+    """
+    import os
+    import subprocess
+    import sys
+    from sklearn.base import clone
+
+    code = 'import sys, unit_converter; print("sklearn" in sys.modules)'
+    completed = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, check=True)
+    assert completed.stdout.strip() == 'False'
+
+    converter = UnitConverter(conversions={'torque_nm': ('Nm', 'lbf*ft')}, copy=False)
+    cloned = clone(converter)
+    assert cloned is not converter and cloned.get_params() == converter.get_params()
+    assert cloned.set_params(output='numpy').output == 'numpy'
+
+
+def test_pipeline_set_output_returns_pandas():
+    """
+    Pipeline.set_output(transform='pandas') configura el convertidor y entrega un DataFrame con sus columnas
+    """
+    from sklearn.base import clone
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    df = pd.DataFrame({'air_temperature_k': [273.15, 283.15, 293.15], 'feature_1': [1, 2, 3]},
+                      index=[10, 11, 12])
+    pipeline = Pipeline([
+        ('u', UnitConverter(column_name='air_temperature_k', output='numpy')),
+        ('s', StandardScaler()),
+    ]).set_output(transform='pandas')
+    result = pipeline.fit_transform(df)
+
+    assert isinstance(result, pd.DataFrame)
+    assert list(result.columns) == list(df.columns) and list(result.index) == [10, 11, 12]
+    np.testing.assert_allclose(result['air_temperature_k'], [-1.2247449, 0.0, 1.2247449], atol=1e-6)
+    assert list(pipeline.named_steps['u'].get_feature_names_out()) == list(df.columns)
+
+    converter = clone(UnitConverter(column_name='air_temperature_k', output='numpy').set_output(transform='pandas'))
+    assert isinstance(converter.fit_transform(df), pd.DataFrame)
+    assert isinstance(converter.set_output(transform='default').transform(df), np.ndarray)
+
+
+def test_registry_composes_and_caches_conversions():
+    """
+    Las cadenas de conversiones se reducen a un único par (escala, desplazamiento)
+    """
+    scale, offset = DEFAULT_REGISTRY.conversion('°F', 'K')
+    assert abs(212.0 * scale + offset - 373.15) < 1e-9
+    assert DEFAULT_REGISTRY.conversion('°F', 'K') is DEFAULT_REGISTRY.conversion('°F', 'K')
+
+    registry = UnitRegistry().define('min', 's', 60.0).define('h', 'min', 60.0)
+    assert registry.conversion('h', 's') == (3600.0, 0.0)
+    converter = UnitConverter(conversions={'tool_wear_min': ('min', 'h')}, registry=registry)
+    result = converter.transform(pd.DataFrame({'tool_wear_min': [30.0, 120.0]}))
+    np.testing.assert_allclose(result['tool_wear_min'], [0.5, 2.0])
+
+
+def test_convert_block_matches_broadcast():
+    """
+    La conversión por tramos coincide con la expresión NumPy directa
+    """
+    block = np.random.default_rng(0).normal(size=(20_000, 3))
+    scales, offsets = DEFAULT_REGISTRY.compile([('K', 'C'), ('rpm', 'rad/s'), ('Nm', 'lbf*ft')])
+    np.testing.assert_allclose(convert_block(block, scales, offsets), block * scales + offsets)
+
 if __name__ == "__main__":
     # Ejecutar pruebas
     test_unit_converter()
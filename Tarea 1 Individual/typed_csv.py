@@ -0,0 +1,154 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Tipos de columna de un esquema:
+#   'float32'  medidas con pocas cifras significativas (se parsean directo a float32)
+#   'int'      enteros; se reducen al tercer elemento (ej: 'int16') solo si caben
+#   'flag'     0/1 o yes/no, se parsean directo a bool (o uint8)
+#   'category' texto con pocos valores distintos
+#   'str'      texto libre (identificadores)
+AI4I_SCHEMA = {
+    'UDI': ('udi', 'int', 'int32'),
+    'Product ID': ('product_id', 'str', None),
+    'Type': ('type', 'category', None),
+    'Air temperature [K]': ('air_temperature_k', 'float32', None),
+    'Process temperature [K]': ('process_temperature_k', 'float32', None),
+    'Rotational speed [rpm]': ('rotational_speed_rpm', 'int', 'int16'),
+    'Torque [Nm]': ('torque_nm', 'float32', None),
+    'Tool wear [min]': ('tool_wear_min', 'int', 'int16'),
+    'Machine failure': ('machine_failure', 'flag', None),
+    'TWF': ('twf', 'flag', None),
+    'HDF': ('hdf', 'flag', None),
+    'PWF': ('pwf', 'flag', None),
+    'OSF': ('osf', 'flag', None),
+    'RNF': ('rnf', 'flag', None),
+}
+
+HOUSING_SCHEMA = {
+    'price': ('price', 'int', 'int32'),
+    'area': ('area', 'int', 'int16'),
+    'bedrooms': ('bedrooms', 'int', 'int8'),
+    'bathrooms': ('bathrooms', 'int', 'int8'),
+    'stories': ('stories', 'int', 'int8'),
+    'mainroad': ('mainroad', 'flag', None),
+    'guestroom': ('guestroom', 'flag', None),
+    'basement': ('basement', 'flag', None),
+    'hotwaterheating': ('hotwaterheating', 'flag', None),
+    'airconditioning': ('airconditioning', 'flag', None),
+    'parking': ('parking', 'int', 'int8'),
+    'prefarea': ('prefarea', 'flag', None),
+    'furnishingstatus': ('furnishingstatus', 'category', None),
+}
+
+
+def clean_column_name(column_name):
+    """
+    Normaliza un nombre de columna (ej: 'Torque [Nm]' -> 'torque_nm').
+
+    Parameters:
+    -----------
+    column_name : str
+        Nombre original de la columna
+
+    Returns:
+    --------
+    str
+        Nombre en minúsculas, sin símbolos y con guiones bajos
+    """
+    clean_name = _NON_ALPHANUMERIC.sub(' ', column_name.lower())
+    clean_name = _WHITESPACE.sub('_', clean_name)
+    return clean_name.strip('_')
+
+
+def _narrow_integers(values, dtype):
+    """Reduce un arreglo entero al tipo declarado si todos sus valores caben en él."""
+    if not np.issubdtype(values.dtype, np.integer) or len(values) == 0:
+        return values
+    limits = np.iinfo(dtype)
+    if limits.min <= values.min() and values.max() <= limits.max:
+        return values.astype(dtype)
+    # No cabe en el tipo declarado: el menor tipo que conserve todos los valores
+    return values.astype(np.promote_types(np.min_scalar_type(values.min()), np.min_scalar_type(values.max())))
+
+
+def read_typed_csv(path, schema, columns=None, flag_dtype='bool', **read_csv_kwargs):
+    """
+    Lee un CSV con un esquema declarado, solo con las columnas pedidas.
+
+    Cada columna se parsea directamente a su tipo final: medidas en float32,
+    banderas 0/1 o yes/no en bool, texto repetido como categórico y enteros
+    reducidos a int8/int16/int32 cuando no se pierde ningún valor. Los
+    nombres limpios del esquema se aplican al leer, sin expresiones
+    regulares. Las columnas que no están en el esquema se leen con los
+    tipos inferidos por pandas y se renombran con clean_column_name.
+
+    Parameters:
+    -----------
+    path : str
+        Ruta (o URL) del archivo CSV
+    schema : dict
+        Esquema {nombre_original: (nombre_limpio, tipo, tipo_reducido)},
+        por ejemplo AI4I_SCHEMA o HOUSING_SCHEMA
+    columns : list, optional
+        Columnas a leer, por nombre original o limpio (por defecto todas)
+    flag_dtype : str
+        'bool' o 'uint8' para las banderas
+    **read_csv_kwargs
+        Argumentos adicionales para pandas.read_csv
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Datos tipados con nombres limpios, en el orden de ``columns``
+
+    Raises:
+    -------
+    KeyError
+        Si alguna columna pedida no está en el esquema ni en el archivo
+    """
+    clean_names = {raw: spec[0] for raw, spec in schema.items()}
+    raw_names = {clean: raw for raw, clean in clean_names.items()}
+
+    def _clean(raw):
+        return clean_names[raw] if raw in clean_names else clean_column_name(raw)
+
+    wanted = None
+    if columns is not None:
+        # Se aceptan nombres originales o limpios; pandas descarta el resto al parsear
+        wanted = [_clean(raw_names.get(name, name)) for name in columns]
+        wanted_set = set(wanted)
+        read_csv_kwargs['usecols'] = lambda raw: _clean(raw) in wanted_set
+
+    dtypes = {}
+    for raw, (_, kind, _) in schema.items():
+        if kind == 'float32':
+            dtypes[raw] = np.float32
+        elif kind == 'flag':
+            dtypes[raw] = bool
+        elif kind == 'category':
+            dtypes[raw] = 'category'
+    df = pd.read_csv(path, dtype=dtypes, true_values=['yes'], false_values=['no'], **read_csv_kwargs)
+
+    data = {}
+    for raw in df.columns:
+        values = df[raw]
+        if raw in schema:
+            _, kind, narrow = schema[raw]
+            if kind == 'int' and narrow is not None:
+                values = pd.Series(_narrow_integers(values.to_numpy(), narrow), index=values.index)
+            elif kind == 'flag' and values.dtype != flag_dtype:
+                values = values.astype(flag_dtype)
+        data[_clean(raw)] = values
+
+    if wanted is not None:
+        missing = [name for name, clean in zip(columns, wanted) if clean not in data]
+        if missing:
+            raise KeyError(f'Columnas inexistentes en el dataset: {missing}')
+        data = {clean: data[clean] for clean in wanted}
+    return pd.DataFrame(data, copy=False)
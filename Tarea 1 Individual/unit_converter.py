@@ -1,104 +1,271 @@
-import pandas as pd
-from sklearn.base import BaseEstimator, TransformerMixin
+import sys
 
+import numpy as np
 
-class UnitConverter(BaseEstimator, TransformerMixin):
+from units import convert_columns
+
+
+# Parámetros de __init__ (protocolo get_params/set_params de Scikit-learn)
+_PARAMETERS = ('column_name', 'conversions', 'copy', 'output', 'registry')
+
+
+class UnitConverter:
     """
-    Clase para convertir unidades de temperatura de Kelvin a Celsius.
-    Hereda de BaseEstimator y TransformerMixin para ser compatible con pipelines de Scikit-learn.
+    Clase para convertir unidades de una o varias columnas en una sola pasada vectorizada.
+    Es compatible con pipelines de Scikit-learn (fit/transform, get_params/set_params,
+    set_output, get_feature_names_out y etiquetas de transformador) sin heredar de
+    BaseEstimator, de modo que importar este módulo no carga sklearn (cuya
+    importación tarda más de un segundo).
+
+    Por defecto convierte una columna de Kelvin a Celsius. Con ``conversions`` se
+    pueden convertir varias columnas a la vez (K/°C/°F, rpm/rad·s⁻¹, Nm/lbf·ft). Solo
+    se copian las columnas convertidas: el resto del DataFrame no se duplica.
+    Las conversiones se resuelven con un ``UnitRegistry`` (ver units.py).
     """
-    
-    def __init__(self, column_name):
+
+    def __init__(self, column_name=None, conversions=None, copy=True, output='pandas', registry=None):
         """
         Inicializa el convertidor de unidades.
-        
+
         Parameters:
         -----------
-        column_name : str
-            Nombre de la columna a convertir (ej: 'air_temperature_k')
+        column_name : str, optional
+            Nombre de la columna a convertir de Kelvin a Celsius (ej: 'air_temperature_k')
+        conversions : dict, optional
+            Conversiones por columna: {columna: (unidad_origen, unidad_destino)}.
+            Con entradas NumPy las claves son índices de columna.
+        copy : bool
+            Si es False, las columnas convertidas se escriben directamente en la
+            entrada (modo in-place) en lugar de en un nuevo objeto
+        output : str
+            'pandas' devuelve el mismo tipo que la entrada; 'numpy' devuelve un
+            numpy.ndarray (útil dentro de un Pipeline de Scikit-learn)
+        registry : UnitRegistry, optional
+            Registro de unidades a usar (por defecto units.DEFAULT_REGISTRY)
         """
         self.column_name = column_name
-    
+        self.conversions = conversions
+        self.copy = copy
+        self.output = output
+        self.registry = registry
+
+    def get_params(self, deep=True):
+        """
+        Parámetros del convertidor (usado por sklearn.base.clone y GridSearchCV).
+
+        Parameters:
+        -----------
+        deep : bool
+            No se utiliza (el convertidor no contiene otros estimadores)
+
+        Returns:
+        --------
+        dict
+            Nombre del parámetro -> valor
+        """
+        return {name: getattr(self, name) for name in _PARAMETERS}
+
+    def set_params(self, **params):
+        """
+        Cambia parámetros del convertidor.
+
+        Returns:
+        --------
+        UnitConverter
+            La propia instancia
+
+        Raises:
+        -------
+        ValueError
+            Si algún parámetro no existe
+        """
+        unknown = [name for name in params if name not in _PARAMETERS]
+        if unknown:
+            raise ValueError(f'Parámetros inválidos para UnitConverter: {unknown}')
+        for name, value in params.items():
+            setattr(self, name, value)
+        return self
+
+    def __sklearn_tags__(self):
+        """Etiquetas de transformador para Scikit-learn (solo se llama con sklearn ya cargado)."""
+        from sklearn.utils import InputTags, Tags, TargetTags, TransformerTags
+
+        return Tags(estimator_type=None, target_tags=TargetTags(required=False),
+                    transformer_tags=TransformerTags(), input_tags=InputTags())
+
+    def set_output(self, *, transform=None):
+        """
+        Configura el contenedor de salida de transform y fit_transform.
+
+        Usa el mismo atributo que el ``_SetOutputMixin`` de Scikit-learn, así que
+        ``Pipeline.set_output`` y ``clone`` lo propagan igual que en cualquier
+        transformador de sklearn.
+
+        Parameters:
+        -----------
+        transform : {'default', 'pandas', 'polars'}, optional
+            'default' respeta el parámetro ``output``; 'pandas' o 'polars'
+            devuelven siempre un DataFrame de ese tipo. None no cambia nada.
+
+        Returns:
+        --------
+        UnitConverter
+            La propia instancia
+
+        Raises:
+        -------
+        ValueError
+            Si el contenedor no es uno de los anteriores
+        """
+        if transform is None:
+            return self
+        if transform not in ('default', 'pandas', 'polars'):
+            raise ValueError(f"transform debe ser 'default', 'pandas' o 'polars', no {transform!r}")
+        self._sklearn_output_config = {'transform': transform}
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        """
+        Nombres de las columnas de salida (los mismos de la entrada).
+
+        Parameters:
+        -----------
+        input_features : array-like of str, optional
+            Nombres de las columnas de entrada; por defecto los vistos en ``fit``
+
+        Returns:
+        --------
+        numpy.ndarray
+            Arreglo de objetos con un nombre por columna
+        """
+        if input_features is not None:
+            return np.asarray(input_features, dtype=object)
+        if hasattr(self, 'feature_names_in_'):
+            return self.feature_names_in_.copy()
+        return np.asarray([f'x{i}' for i in range(self.n_features_in_)], dtype=object)
+
+    def __repr__(self):
+        changed = [f'{name}={getattr(self, name)!r}' for name, default in
+                   zip(_PARAMETERS, (None, None, True, 'pandas', None)) if getattr(self, name) != default]
+        return f"UnitConverter({', '.join(changed)})"
+
+    def _conversions(self):
+        """Combina column_name y conversions en un único dict {columna: (origen, destino)}."""
+        conversions = dict(self.conversions or {})
+        if self.column_name is not None:
+            conversions.setdefault(self.column_name, ('K', 'C'))
+        if not conversions:
+            raise ValueError("Debe indicar 'column_name' o 'conversions'")
+        return conversions
+
     def fit(self, X, y=None):
         """
-        Método fit requerido por TransformerMixin.
-        No realiza ninguna operación de entrenamiento.
-        
+        Método fit del protocolo de transformadores de Scikit-learn.
+        No entrena nada: solo registra el número y los nombres de las columnas
+        de entrada, que usa ``get_feature_names_out``.
+
         Parameters:
         -----------
         X : pandas.DataFrame
             DataFrame de entrada
         y : None
             No se utiliza
-            
+
         Returns:
         --------
         self : UnitConverter
             Instancia del convertidor
         """
+        self.n_features_in_ = X.shape[1]
+        if hasattr(X, 'columns'):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
         return self
-    
+
+    def _output_container(self):
+        """Contenedor configurado con set_output o, con sklearn ya cargado, el global."""
+        container = getattr(self, '_sklearn_output_config', {}).get('transform')
+        if container is None and 'sklearn' in sys.modules:
+            container = sys.modules['sklearn'].get_config()['transform_output']
+        return container or 'default'
+
+    def _wrap_output(self, result, X):
+        """Envuelve el resultado en el DataFrame pedido con set_output."""
+        container = self._output_container()
+        if container == 'default':
+            return result
+        columns = list(X.columns) if hasattr(X, 'columns') else [f'x{i}' for i in range(X.shape[1])]
+        if container == 'polars':
+            import polars as pl
+
+            if isinstance(result, pl.DataFrame):
+                return result
+            return pl.DataFrame(np.asarray(result), schema=columns, orient='row')
+        import pandas as pd
+
+        if isinstance(result, pd.DataFrame):
+            return result
+        return pd.DataFrame(result, index=getattr(X, 'index', None), columns=columns)
+
     def transform(self, X):
         """
-        Convierte la temperatura de Kelvin a Celsius.
-        
+        Convierte las columnas configuradas (por defecto de Kelvin a Celsius).
+
+        Todas las columnas se convierten juntas con units.convert_columns: se
+        extrae un bloque con solo esas columnas y se aplica
+        ``bloque * escalas + desplazamientos`` recorriéndolo una sola vez.
+
         Parameters:
         -----------
-        X : pandas.DataFrame
-            DataFrame de entrada con la columna de temperatura en Kelvin
-            
+        X : pandas.DataFrame or numpy.ndarray
+            Datos de entrada con las columnas a convertir
+
         Returns:
         --------
-        pandas.DataFrame
-            DataFrame con la columna convertida a Celsius
-        """
-        # Crear una copia del DataFrame para no modificar el original
-        X_transformed = X.copy()
-        
-        # Verificar que la columna existe
-        if self.column_name not in X_transformed.columns:
-            raise ValueError(f"La columna '{self.column_name}' no existe en el DataFrame")
-        
-        # Convertir de Kelvin a Celsius: Celsius = Kelvin - 273.15
-        X_transformed[self.column_name] = X_transformed[self.column_name] - 273.15
-        
-        return X_transformed
-    
+        pandas.DataFrame or numpy.ndarray
+            Datos con las columnas convertidas (la propia entrada si copy=False),
+            en el contenedor configurado con ``set_output`` si lo hay
+        """
+        result = convert_columns(X, self._conversions(), copy=self.copy, output=self.output,
+                                 registry=self.registry)
+        return self._wrap_output(result, X)
+
     def fit_transform(self, X, y=None):
         """
         Combina fit y transform en una sola operación.
-        
+
         Parameters:
         -----------
         X : pandas.DataFrame
             DataFrame de entrada
         y : None
             No se utiliza
-            
+
         Returns:
         --------
         pandas.DataFrame
-            DataFrame con la columna convertida a Celsius
+            DataFrame con las columnas convertidas
         """
         return self.fit(X, y).transform(X)
 
 
 # Ejemplo de uso
 if __name__ == "__main__":
+    import pandas as pd
+
     # Crear datos de ejemplo
     data = {
         'air_temperature_k': [273.15, 283.15, 293.15, 303.15],
         'other_column': [1, 2, 3, 4]
     }
     df = pd.DataFrame(data)
-    
+
     print("DataFrame original:")
     print(df)
     print()
-    
+
     # Crear y usar el convertidor
     converter = UnitConverter(column_name='air_temperature_k')
     df_converted = converter.transform(df)
-    
+
     print("DataFrame después de la conversión (Kelvin a Celsius):")
-    print(df_converted) 
\ No newline at end of file
+    print(df_converted)
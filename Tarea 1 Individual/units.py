@@ -0,0 +1,322 @@
+from collections import deque
+
+import numpy as np
+
+
+# Filas por bloque en convert_block: el bloque cabe en caché y la suma del
+# desplazamiento se aplica mientras los datos siguen en ella
+TILE_ROWS = 8192
+
+
+class UnitRegistry:
+    """
+    Registro de conversiones de unidades definidas como transformaciones afines.
+
+    Cada conversión directa se define una sola vez como ``destino = origen *
+    escala + desplazamiento`` (su inversa se registra automáticamente). Las
+    conversiones indirectas, como °F -> K -> °C, se encuentran recorriendo el
+    grafo de unidades y se reducen a un único par (escala, desplazamiento)
+    que queda en caché.
+    """
+
+    def __init__(self):
+        """
+        Inicializa un registro vacío.
+        """
+        self._edges = {}
+        self._aliases = {}
+        self._cache = {}
+
+    def define(self, from_unit, to_unit, scale, offset=0.0):
+        """
+        Define una conversión directa y su inversa.
+
+        Parameters:
+        -----------
+        from_unit : str
+            Unidad de origen
+        to_unit : str
+            Unidad de destino
+        scale : float
+            Factor multiplicativo (distinto de cero)
+        offset : float
+            Desplazamiento que se suma después de escalar
+
+        Returns:
+        --------
+        UnitRegistry
+            El propio registro, para encadenar definiciones
+        """
+        if scale == 0:
+            raise ValueError('La escala de una conversión no puede ser cero')
+        self._edges.setdefault(from_unit, {})[to_unit] = (scale, offset)
+        self._edges.setdefault(to_unit, {})[from_unit] = (1 / scale, -offset / scale)
+        self._cache.clear()
+        return self
+
+    def alias(self, alias, unit):
+        """
+        Registra un nombre alternativo para una unidad (ej: '°C' para 'C').
+
+        Parameters:
+        -----------
+        alias : str
+            Nombre alternativo
+        unit : str
+            Unidad canónica ya definida
+
+        Returns:
+        --------
+        UnitRegistry
+            El propio registro
+        """
+        self._aliases[alias] = unit
+        self._cache.clear()
+        return self
+
+    def canonical(self, unit):
+        """
+        Devuelve el nombre canónico de una unidad.
+
+        Parameters:
+        -----------
+        unit : str
+            Nombre o alias de la unidad
+
+        Returns:
+        --------
+        str
+            Nombre canónico
+        """
+        return self._aliases.get(unit, unit)
+
+    def conversion(self, from_unit, to_unit):
+        """
+        Devuelve la conversión compuesta entre dos unidades.
+
+        Parameters:
+        -----------
+        from_unit : str
+            Unidad de origen
+        to_unit : str
+            Unidad de destino
+
+        Returns:
+        --------
+        tuple
+            (escala, desplazamiento) tales que destino = origen * escala + desplazamiento
+
+        Raises:
+        -------
+        ValueError
+            Si no existe una cadena de conversiones entre las unidades
+        """
+        key = (from_unit, to_unit)
+        if key not in self._cache:
+            self._cache[key] = self._compose(self.canonical(from_unit), self.canonical(to_unit))
+        return self._cache[key]
+
+    def _compose(self, source, target):
+        if source == target:
+            return 1.0, 0.0
+        # Búsqueda en anchura: la cadena más corta acumula menos error de redondeo
+        previous = {source: None}
+        pending = deque([source])
+        while pending and target not in previous:
+            unit = pending.popleft()
+            for neighbor in self._edges.get(unit, {}):
+                if neighbor not in previous:
+                    previous[neighbor] = unit
+                    pending.append(neighbor)
+        if target not in previous:
+            raise ValueError(f"Conversión no soportada: '{source}' -> '{target}'")
+
+        path = [target]
+        while previous[path[-1]] is not None:
+            path.append(previous[path[-1]])
+        path.reverse()
+
+        scale, offset = 1.0, 0.0
+        for step_from, step_to in zip(path, path[1:]):
+            step_scale, step_offset = self._edges[step_from][step_to]
+            scale, offset = scale * step_scale, offset * step_scale + step_offset
+        return scale, offset
+
+    def compile(self, unit_pairs):
+        """
+        Reduce una lista de conversiones a vectores de escalas y desplazamientos.
+
+        Parameters:
+        -----------
+        unit_pairs : list
+            Pares (unidad_origen, unidad_destino), uno por columna
+
+        Returns:
+        --------
+        tuple
+            (escalas, desplazamientos) como numpy.ndarray de forma (n_columnas,)
+        """
+        pairs = [self.conversion(from_unit, to_unit) for from_unit, to_unit in unit_pairs]
+        scales = np.array([scale for scale, _ in pairs], dtype=np.float64)
+        offsets = np.array([offset for _, offset in pairs], dtype=np.float64)
+        return scales, offsets
+
+    def convert(self, values, from_unit, to_unit):
+        """
+        Convierte un arreglo de valores entre dos unidades.
+
+        Parameters:
+        -----------
+        values : array-like
+            Valores en la unidad de origen
+        from_unit : str
+            Unidad de origen
+        to_unit : str
+            Unidad de destino
+
+        Returns:
+        --------
+        numpy.ndarray
+            Valores en la unidad de destino
+        """
+        scale, offset = self.conversion(from_unit, to_unit)
+        return np.asarray(values, dtype=np.float64) * scale + offset
+
+
+def convert_block(block, scales, offsets, out=None):
+    """
+    Aplica ``block * scales + offsets`` a un bloque de columnas por tramos de filas.
+
+    Cada tramo de TILE_ROWS filas se escala y desplaza mientras sigue en caché,
+    de modo que el bloque completo se recorre una sola vez en memoria.
+
+    Parameters:
+    -----------
+    block : numpy.ndarray
+        Bloque de forma (n_filas, n_columnas)
+    scales : numpy.ndarray
+        Escala por columna
+    offsets : numpy.ndarray
+        Desplazamiento por columna
+    out : numpy.ndarray, optional
+        Destino (puede ser el propio block para convertir in-place)
+
+    Returns:
+    --------
+    numpy.ndarray
+        Bloque convertido
+    """
+    if out is None:
+        out = np.empty(block.shape, dtype=np.float64, order='F' if block.flags.f_contiguous else 'C')
+    for start in range(0, block.shape[0], TILE_ROWS):
+        tile = out[start:start + TILE_ROWS]
+        np.multiply(block[start:start + TILE_ROWS], scales, out=tile)
+        np.add(tile, offsets, out=tile)
+    return out
+
+
+def convert_columns(X, conversions, copy=True, output='pandas', registry=None):
+    """
+    Convierte varias columnas de un DataFrame o arreglo en una sola pasada.
+
+    Es el núcleo de UnitConverter sin depender de Scikit-learn: los scripts
+    y servicios de vida corta pueden convertir unidades sin cargar sklearn.
+    Se extrae un bloque con solo las columnas a convertir y se aplica
+    ``bloque * escalas + desplazamientos`` con convert_block.
+
+    Parameters:
+    -----------
+    X : pandas.DataFrame or numpy.ndarray
+        Datos de entrada con las columnas a convertir
+    conversions : dict
+        Conversiones por columna: {columna: (unidad_origen, unidad_destino)}.
+        Con entradas NumPy las claves son índices de columna.
+    copy : bool
+        Si es False, las columnas convertidas se escriben en la propia entrada
+    output : str
+        'pandas' devuelve el mismo tipo que la entrada; 'numpy' devuelve un
+        numpy.ndarray
+    registry : UnitRegistry, optional
+        Registro de unidades a usar (por defecto DEFAULT_REGISTRY)
+
+    Returns:
+    --------
+    pandas.DataFrame or numpy.ndarray
+        Datos con las columnas convertidas (la propia entrada si copy=False)
+
+    Raises:
+    -------
+    ValueError
+        Si alguna columna no existe en el DataFrame
+    TypeError
+        Si se pide conversión in-place sobre un arreglo que no es de tipo float
+    """
+    registry = registry if registry is not None else DEFAULT_REGISTRY
+    columns = list(conversions)
+    scales, offsets = registry.compile(conversions.values())
+
+    if isinstance(X, np.ndarray):
+        if not copy and not np.issubdtype(X.dtype, np.floating):
+            raise TypeError('La conversión in-place requiere un arreglo de tipo float')
+        X_transformed = X if not copy else X.astype(np.float64, copy=True)
+        block = X_transformed[:, columns].astype(np.float64, copy=False)
+        X_transformed[:, columns] = convert_block(block, scales, offsets, out=block)
+        return X_transformed
+
+    # Verificar que las columnas existen
+    for column in columns:
+        if column not in X.columns:
+            raise ValueError(f"La columna '{column}' no existe en el DataFrame")
+
+    # Bloque con solo las columnas a convertir (orden Fortran: columnas contiguas)
+    block = np.empty((len(X), len(columns)), dtype=np.float64, order='F')
+    for position, column in enumerate(columns):
+        block[:, position] = X[column].to_numpy()
+    convert_block(block, scales, offsets, out=block)
+
+    if output == 'numpy':
+        result = X.to_numpy(dtype=np.float64, copy=True)
+        result[:, [X.columns.get_loc(column) for column in columns]] = block
+        if not copy:
+            for position, column in enumerate(columns):
+                X[column] = block[:, position]
+        return result
+
+    # Copia superficial: las columnas no convertidas se comparten con la entrada
+    X_transformed = X if not copy else X.copy(deep=False)
+    for position, column in enumerate(columns):
+        X_transformed[column] = block[:, position]
+    return X_transformed
+
+
+def default_registry():
+    """
+    Crea el registro con las unidades del dataset ai4i2020.
+
+    Solo se definen las conversiones básicas; el resto (K <-> °F, por ejemplo)
+    se obtiene por composición.
+
+    Returns:
+    --------
+    UnitRegistry
+        Registro con temperatura (K, C, F), velocidad angular (rpm, rad/s) y
+        torque (Nm, lbf*ft)
+    """
+    registry = UnitRegistry()
+    registry.define('K', 'C', 1.0, -273.15)
+    registry.define('C', 'F', 9 / 5, 32.0)
+    registry.define('rpm', 'rad/s', 2 * np.pi / 60)
+    registry.define('lbf*ft', 'Nm', 1.3558179483314004)
+    for alias, unit in {
+        '°C': 'C', 'degC': 'C', 'celsius': 'C',
+        '°F': 'F', 'degF': 'F', 'fahrenheit': 'F',
+        'kelvin': 'K',
+        'rad·s⁻¹': 'rad/s', 'rad/sec': 'rad/s',
+        'N·m': 'Nm', 'N*m': 'Nm',
+        'lbf·ft': 'lbf*ft', 'ft*lbf': 'lbf*ft', 'ft·lbf': 'lbf*ft',
+    }.items():
+        registry.alias(alias, unit)
+    return registry
+
+
+DEFAULT_REGISTRY = default_registry()
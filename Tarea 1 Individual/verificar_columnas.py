@@ -1,10 +1,11 @@
-import pandas as pd
+from dataset_cache import AI4I_URL, load_dataset
+from typed_csv import AI4I_SCHEMA
 
 # URL del archivo CSV
-url = "https://archive.ics.uci.edu/ml/machine-learning-databases/00601/ai4i2020.csv"
+url = AI4I_URL
 
-# Cargar el archivo CSV en un DataFrame
-df = pd.read_csv(url)
+# Cargar el archivo CSV tipado y con nombres limpios (desde la caché local; sin descargas repetidas)
+df = load_dataset(url, schema=AI4I_SCHEMA)
 
 print("Dataset cargado exitosamente desde CSV!")
 print(f"Forma del dataset: {df.shape}")
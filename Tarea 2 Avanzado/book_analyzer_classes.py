@@ -0,0 +1,811 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+
+BOOKS_URL = ('https://raw.githubusercontent.com/aiplanethub/Datasets/refs/heads/master/'
+             'Amazon%20Top%2050%20Bestselling%20Books%202009%20-%202019.csv')
+
+# Columnas con índice hash (valor -> posiciones) y con índice ordenado (consultas por rango)
+HASH_INDEX_COLUMNS = ('Author', 'Genre', 'Year')
+SORTED_INDEX_COLUMNS = ('User Rating', 'Price', 'Reviews')
+
+HIGH_RATING_THRESHOLD = 4.7
+EXPENSIVE_PRICE_THRESHOLD = 20
+POPULAR_REVIEWS_THRESHOLD = 20000
+
+
+def _book_at(groups, books, column):
+    """Nombre del libro con el mayor valor de la columna en cada grupo (None si todos son nulos)."""
+    values = books[column]
+    valid = values.notna().to_numpy()
+    # Solo las filas con valor: idxmax falla en pandas 3 con grupos totalmente nulos.
+    # books tiene un RangeIndex, así que idxmax devuelve posiciones
+    positions = values[valid].groupby(groups.ngroup().to_numpy()[valid]).idxmax()
+    names = np.full(groups.ngroups, None, dtype=object)
+    names[positions.index.to_numpy()] = books['Name'].to_numpy()[positions.to_numpy()]
+    return pd.Series(names, index=groups.size().index, dtype=object)
+
+
+def _distribution(groups, column):
+    """Conteo de cada valor de la columna dentro de cada grupo, como dict."""
+    counts = groups[column].value_counts(sort=False)
+    distribution = {}
+    for (group, value), count in counts.items():
+        distribution.setdefault(group, {})[value] = int(count)
+    return pd.Series(distribution, dtype=object)
+
+
+def _unique_values(groups, books, column, sort=False):
+    """Valores distintos (no nulos) de la columna en cada grupo, como listas.
+
+    groupby(...).unique() arma un arreglo por grupo en Python; aquí se quitan
+    los pares (grupo, valor) repetidos con una tabla hash y se corta el
+    resultado ordenado por grupo en tramos contiguos.
+    """
+    pairs = pd.DataFrame({'group': groups.ngroup().to_numpy(), 'value': books[column].to_numpy()})
+    pairs = pairs.dropna(subset=['value']).drop_duplicates()
+    pairs = pairs.sort_values(['group', 'value'] if sort else 'group', kind='stable')
+    group_codes = pairs['group'].to_numpy()
+    bounds = np.concatenate([[0], np.flatnonzero(np.diff(group_codes)) + 1, [len(group_codes)]]).tolist()
+    values = pairs['value'].tolist()
+    # Los grupos que solo tienen nulos quedan con una lista vacía
+    lists = [[] for _ in range(groups.ngroups)]
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start == stop:
+            continue
+        lists[int(group_codes[start])] = values[start:stop]
+    return pd.Series(lists, index=groups.size().index, dtype=object)
+
+
+def _pair(low, high):
+    """Combina dos Series (mínimo y máximo) en una Series de tuplas."""
+    return pd.Series(list(zip(low.tolist(), high.tolist())), index=low.index, dtype=object)
+
+
+# Métrica -> función (groupby, libros) que la calcula para todos los grupos a la vez
+GROUP_METRICS = {
+    'total_books': lambda groups, books: groups.size(),
+    'average_rating': lambda groups, books: groups['User Rating'].mean(),
+    'average_price': lambda groups, books: groups['Price'].mean(),
+    'total_reviews': lambda groups, books: groups['Reviews'].sum(),
+    'popular_books': lambda groups, books: groups['_popular'].sum(),
+    'highly_rated_books': lambda groups, books: groups['_highly_rated'].sum(),
+    'expensive_books': lambda groups, books: groups['_expensive'].sum(),
+    'price_range': lambda groups, books: _pair(groups['Price'].min(), groups['Price'].max()),
+    'year_range': lambda groups, books: _pair(groups['Year'].min(), groups['Year'].max()),
+    'genre_distribution': lambda groups, books: _distribution(groups, 'Genre'),
+    'genres': lambda groups, books: _unique_values(groups, books, 'Genre', sort=True),
+    'best_rated_book': lambda groups, books: _book_at(groups, books, 'User Rating'),
+    'most_reviewed_book': lambda groups, books: _book_at(groups, books, 'Reviews'),
+    'books': lambda groups, books: _unique_values(groups, books, 'Name'),
+}
+
+# Columnas que lee cada métrica, además de las de FLAG_COLUMNS que summarize usa siempre
+METRIC_COLUMNS = {
+    'total_books': (),
+    'average_rating': ('User Rating',),
+    'average_price': ('Price',),
+    'total_reviews': ('Reviews',),
+    'popular_books': ('Reviews',),
+    'highly_rated_books': ('User Rating',),
+    'expensive_books': ('Price',),
+    'price_range': ('Price',),
+    'year_range': ('Year',),
+    'genre_distribution': ('Genre',),
+    'genres': ('Genre',),
+    'best_rated_book': ('User Rating', 'Name'),
+    'most_reviewed_book': ('Reviews', 'Name'),
+    'books': ('Name',),
+}
+FLAG_COLUMNS = ('Reviews', 'User Rating', 'Price')
+
+
+class BookDataManager:
+    """
+    Gestor de los datos de libros con índices para consultas rápidas.
+
+    Al cargar los datos se construyen dos tipos de índice:
+    - Hash (autor, género y año): cada valor apunta al arreglo con las
+      posiciones de sus filas, de modo que filtrar por autor o género cuesta
+      O(1) más el tamaño del resultado en lugar de recorrer todo el DataFrame.
+    - Ordenado (User Rating, Price y Reviews): los valores ordenados y sus
+      posiciones; un rango como "rating >= 4.8" se resuelve con búsqueda
+      binaria en O(log n) más el tamaño del resultado.
+
+    Con ``append`` se agregan lotes nuevos (por ejemplo un año más de datos)
+    sin recargar el catálogo: solo se limpian las filas nuevas, se extienden
+    los índices y se actualizan los acumulados del catálogo (conteos, sumas,
+    rango de años y libros altamente calificados o caros), así que el
+    análisis general después de un lote cuesta O(tamaño del lote).
+
+    Attributes:
+        df (pandas.DataFrame): Datos con los nombres de columna limpios
+    """
+
+    def __init__(self, source=BOOKS_URL):
+        """
+        Carga los datos, limpia los nombres de columna y construye los índices.
+
+        Args:
+            source (str or pandas.DataFrame): URL o ruta del CSV, o un DataFrame ya cargado
+        """
+        self._chunks = []
+        self._size = 0
+        self._hash_indexes = {}
+        self._sorted_indexes = {}
+        self._pending_sorted = {}
+        self._totals = {'total_books': 0, 'rating_sum': 0.0, 'rating_count': 0, 'price_sum': 0.0,
+                        'price_count': 0, 'total_reviews': 0, 'year_min': None, 'year_max': None,
+                        'highly_rated_books': 0, 'expensive_books': 0, 'popular_books': 0}
+        self.append(source)
+
+    @staticmethod
+    def _clean_columns(df):
+        """Quita espacios sobrantes de los nombres de columna ('User  Rating ' -> 'User Rating')."""
+        return df.rename(columns=lambda column: ' '.join(str(column).split()))
+
+    @property
+    def df(self):
+        """pandas.DataFrame: Datos completos; los lotes agregados se unen al pedirlos."""
+        if len(self._chunks) > 1:
+            self._chunks = [pd.concat(self._chunks, ignore_index=True)]
+        return self._chunks[0]
+
+    def append(self, batch):
+        """
+        Agrega un lote de libros manteniendo índices y acumulados al día.
+
+        Solo se limpian y se indexan las filas nuevas: el costo es
+        proporcional al tamaño del lote. Los índices ordenados integran los
+        lotes pendientes en la siguiente consulta por rango.
+
+        Args:
+            batch (str or pandas.DataFrame): URL o ruta de un CSV, o un DataFrame
+
+        Returns:
+            BookDataManager: La propia instancia
+
+        Raises:
+            ValueError: Si las columnas del lote no coinciden con las del catálogo
+        """
+        batch = batch.copy() if isinstance(batch, pd.DataFrame) else pd.read_csv(batch)
+        batch = self._clean_columns(batch)
+        if self._chunks:
+            columns = list(self._chunks[0].columns)
+            if sorted(batch.columns) != sorted(columns):
+                raise ValueError(f'Las columnas del lote no coinciden con las del catálogo: {list(batch.columns)}')
+            batch = batch[columns]
+        if batch.empty and self._chunks:
+            return self
+
+        offset = self._size
+        self._index_batch(batch, offset)
+        self._update_totals(batch)
+        self._chunks.append(batch)
+        self._size += len(batch)
+        return self
+
+    def _index_batch(self, batch, offset):
+        """Extiende los índices con las filas de un lote que empieza en la posición offset."""
+        for column in HASH_INDEX_COLUMNS:
+            if column not in batch.columns:
+                continue
+            index = self._hash_indexes.setdefault(column, {})
+            # groupby(...).indices agrupa con una tabla hash: valor -> arreglo de posiciones
+            # Cada valor guarda una lista de arreglos; se unen la próxima vez que se consulta
+            for value, positions in batch.groupby(column, sort=False).indices.items():
+                index.setdefault(value, []).append(positions + offset)
+
+        for column in SORTED_INDEX_COLUMNS:
+            if column not in batch.columns:
+                continue
+            if column not in self._sorted_indexes:
+                self._sorted_indexes[column] = (np.empty(0), np.empty(0, dtype=np.intp))
+            values = batch[column].to_numpy(dtype=np.float64)
+            self._pending_sorted.setdefault(column, []).append((values, np.arange(offset, offset + len(values))))
+
+    def _sorted_index(self, column):
+        """Índice ordenado (valores, posiciones) de la columna, integrando los lotes pendientes."""
+        if column not in self._sorted_indexes:
+            raise KeyError(f'La columna {column!r} no tiene índice ordenado')
+        pending = self._pending_sorted.pop(column, None)
+        if pending:
+            sorted_values, order = self._sorted_indexes[column]
+            values = np.concatenate([batch_values for batch_values, _ in pending])
+            positions = np.concatenate([batch_positions for _, batch_positions in pending])
+            batch_order = np.argsort(values, kind='stable')
+            values, positions = values[batch_order], positions[batch_order]
+            # Mezcla de dos secuencias ordenadas: las filas nuevas van después de las iguales
+            insert_at = np.searchsorted(sorted_values, values, side='right')
+            self._sorted_indexes[column] = (np.insert(sorted_values, insert_at, values),
+                                            np.insert(order, insert_at, positions))
+        return self._sorted_indexes[column]
+
+    def _update_totals(self, batch):
+        """Suma un lote a los acumulados del catálogo."""
+        totals = self._totals
+        totals['total_books'] += len(batch)
+        if 'User Rating' in batch.columns:
+            rating = batch['User Rating']
+            totals['rating_sum'] += float(rating.sum())
+            totals['rating_count'] += int(rating.count())
+            totals['highly_rated_books'] += int((rating >= HIGH_RATING_THRESHOLD).sum())
+        if 'Price' in batch.columns:
+            price = batch['Price']
+            totals['price_sum'] += float(price.sum())
+            totals['price_count'] += int(price.count())
+            totals['expensive_books'] += int((price >= EXPENSIVE_PRICE_THRESHOLD).sum())
+        if 'Reviews' in batch.columns:
+            totals['total_reviews'] += int(batch['Reviews'].sum())
+            totals['popular_books'] += int((batch['Reviews'] > POPULAR_REVIEWS_THRESHOLD).sum())
+        if 'Year' in batch.columns and batch['Year'].count():
+            year_min, year_max = int(batch['Year'].min()), int(batch['Year'].max())
+            totals['year_min'] = year_min if totals['year_min'] is None else min(totals['year_min'], year_min)
+            totals['year_max'] = year_max if totals['year_max'] is None else max(totals['year_max'], year_max)
+
+    def catalog_totals(self):
+        """
+        Métricas del catálogo completo a partir de los acumulados, sin recorrer los datos.
+
+        Returns:
+            dict: total_books, average_rating, average_price, total_reviews,
+                genre_distribution, year_range, highly_rated_books,
+                expensive_books y popular_books
+        """
+        totals = self._totals
+        return {
+            'total_books': totals['total_books'],
+            'average_rating': totals['rating_sum'] / totals['rating_count'] if totals['rating_count'] else np.nan,
+            'average_price': totals['price_sum'] / totals['price_count'] if totals['price_count'] else np.nan,
+            'total_reviews': totals['total_reviews'],
+            'genre_distribution': self.count_by('Genre') if 'Genre' in self._hash_indexes else {},
+            'year_range': (totals['year_min'], totals['year_max']),
+            'highly_rated_books': totals['highly_rated_books'],
+            'expensive_books': totals['expensive_books'],
+            'popular_books': totals['popular_books'],
+        }
+
+    def index_kind(self, column):
+        """
+        Indica qué índice tiene una columna.
+
+        Args:
+            column (str): Nombre de la columna
+
+        Returns:
+            str: 'hash', 'sorted' o None si la columna no tiene índice
+        """
+        if column in self._hash_indexes:
+            return 'hash'
+        if column in self._sorted_indexes:
+            return 'sorted'
+        return None
+
+    def positions(self, column, value):
+        """
+        Posiciones de las filas cuyo valor en la columna es igual a value (índice hash).
+
+        Args:
+            column (str): 'Author', 'Genre' o 'Year'
+            value: Valor buscado
+
+        Returns:
+            numpy.ndarray: Posiciones en orden creciente (vacío si el valor no existe)
+
+        Raises:
+            KeyError: Si la columna no tiene índice hash
+        """
+        if column not in self._hash_indexes:
+            raise KeyError(f'La columna {column!r} no tiene índice')
+        parts = self._hash_indexes[column].get(value)
+        if parts is None:
+            return np.empty(0, dtype=np.intp)
+        if len(parts) > 1:
+            parts[:] = [np.concatenate(parts)]
+        return parts[0]
+
+    def _range_bounds(self, column, low=None, high=None):
+        """Tramo [start, stop) del índice ordenado con low <= valor <= high."""
+        sorted_values = self._sorted_index(column)[0]
+        # Los NaN quedan al final del orden y nunca caen dentro del rango
+        start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+        stop = np.searchsorted(sorted_values, np.inf if high is None else high, side='right')
+        return start, max(start, stop)
+
+    def range_positions(self, column, low=None, high=None):
+        """
+        Posiciones de las filas con low <= valor <= high (índice ordenado).
+
+        Args:
+            column (str): 'User Rating', 'Price' o 'Reviews'
+            low (float, optional): Límite inferior incluido (sin límite si es None)
+            high (float, optional): Límite superior incluido (sin límite si es None)
+
+        Returns:
+            numpy.ndarray: Posiciones en orden creciente
+
+        Raises:
+            KeyError: Si la columna no tiene índice ordenado
+        """
+        start, stop = self._range_bounds(column, low, high)
+        return np.sort(self._sorted_index(column)[1][start:stop])
+
+    def get_data(self):
+        """
+        Devuelve el DataFrame completo.
+
+        Returns:
+            pandas.DataFrame: Datos con los nombres de columna limpios
+        """
+        return self.df
+
+    def get_authors(self):
+        """
+        Devuelve los autores presentes en los datos.
+
+        Returns:
+            list: Autores en orden de aparición
+        """
+        return list(self._hash_indexes['Author'])
+
+    def get_genres(self):
+        """
+        Devuelve los géneros presentes en los datos.
+
+        Returns:
+            list: Géneros en orden de aparición
+        """
+        return list(self._hash_indexes['Genre'])
+
+    def count_by(self, column):
+        """
+        Cuenta los libros por valor de una columna con índice hash.
+
+        Args:
+            column (str): 'Author', 'Genre' o 'Year'
+
+        Returns:
+            dict: Valor -> número de libros
+
+        Raises:
+            KeyError: Si la columna no tiene índice
+        """
+        if column not in self._hash_indexes:
+            raise KeyError(f'La columna {column!r} no tiene índice')
+        return {value: sum(len(positions) for positions in parts)
+                for value, parts in self._hash_indexes[column].items()}
+
+    def filter_by_genre(self, genre):
+        """
+        Filtra los libros de un género usando el índice hash.
+
+        Args:
+            genre (str): Género (ej: 'Fiction' o 'Non Fiction')
+
+        Returns:
+            pandas.DataFrame: Libros del género (vacío si no existe)
+        """
+        return self.df.iloc[self.positions('Genre', genre)]
+
+    def filter_by_author(self, author):
+        """
+        Filtra los libros de un autor usando el índice hash.
+
+        Args:
+            author (str): Nombre del autor
+
+        Returns:
+            pandas.DataFrame: Libros del autor (vacío si no existe)
+        """
+        return self.df.iloc[self.positions('Author', author)]
+
+    def filter_by_year(self, year):
+        """
+        Filtra los libros de un año usando el índice hash.
+
+        Args:
+            year (int): Año de la lista de más vendidos
+
+        Returns:
+            pandas.DataFrame: Libros del año (vacío si no existe)
+        """
+        return self.df.iloc[self.positions('Year', year)]
+
+    def filter_by_range(self, column, low=None, high=None):
+        """
+        Filtra los libros con low <= columna <= high usando el índice ordenado.
+
+        Args:
+            column (str): 'User Rating', 'Price' o 'Reviews'
+            low (float, optional): Límite inferior incluido (sin límite si es None)
+            high (float, optional): Límite superior incluido (sin límite si es None)
+
+        Returns:
+            pandas.DataFrame: Libros dentro del rango, en su orden original
+
+        Raises:
+            KeyError: Si la columna no tiene índice ordenado
+        """
+        return self.df.iloc[self.range_positions(column, low, high)]
+
+    def count_in_range(self, column, low=None, high=None):
+        """
+        Cuenta los libros con low <= columna <= high sin construir el resultado.
+
+        Args:
+            column (str): 'User Rating', 'Price' o 'Reviews'
+            low (float, optional): Límite inferior incluido
+            high (float, optional): Límite superior incluido
+
+        Returns:
+            int: Número de libros dentro del rango
+
+        Raises:
+            KeyError: Si la columna no tiene índice ordenado
+        """
+        start, stop = self._range_bounds(column, low, high)
+        return int(stop - start)
+
+    def summarize(self, metrics, by=None, keys=None):
+        """
+        Calcula varias métricas para varios grupos en una sola pasada agrupada.
+
+        Las filas de los grupos pedidos se toman del índice hash y se agrupan
+        una vez; cada métrica de GROUP_METRICS es una reducción vectorizada
+        sobre ese mismo agrupamiento. Las métricas del catálogo completo que
+        se mantienen con ``append`` se leen de los acumulados sin recorrer
+        los datos.
+
+        Args:
+            metrics (iterable): Nombres de métricas de GROUP_METRICS
+            by (str, optional): 'Author', 'Genre' o 'Year'; sin columna se
+                resume el catálogo completo bajo la clave None
+            keys (list, optional): Grupos a calcular (por defecto todos)
+
+        Returns:
+            dict: Grupo -> {métrica: valor}. Los grupos sin libros no aparecen.
+
+        Raises:
+            KeyError: Si alguna métrica no existe o la columna no tiene índice
+        """
+        metrics = list(metrics)
+        unknown = [metric for metric in metrics if metric not in GROUP_METRICS]
+        if unknown:
+            raise KeyError(f'Métricas inexistentes: {unknown}')
+
+        if by is None:
+            totals = self.catalog_totals()
+            if all(metric in totals for metric in metrics):
+                # Métricas del catálogo completo: salen de los acumulados en O(1)
+                return {None: {metric: totals[metric] for metric in metrics}} if totals['total_books'] else {}
+
+        books = self.df
+        if by is not None:
+            if by not in self._hash_indexes:
+                raise KeyError(f'La columna {by!r} no tiene índice')
+            index = self._hash_indexes[by]
+            if keys is not None and len(set(keys)) < len(index):
+                positions = [self.positions(by, key) for key in dict.fromkeys(keys) if key in index]
+                books = books.iloc[np.sort(np.concatenate(positions))] if positions else books.iloc[:0]
+        return group_summary(books, metrics, by)
+
+
+def group_summary(books, metrics, by=None):
+    """
+    Calcula métricas de GROUP_METRICS para todos los grupos de un DataFrame.
+
+    Es la pasada agrupada de BookDataManager.summarize sin índices: sirve
+    para filas ya seleccionadas, como las que reconstruye cada trabajador
+    de parallel_analysis.
+
+    Args:
+        books (pandas.DataFrame): Libros con los nombres de columna limpios
+        metrics (list): Nombres de métricas de GROUP_METRICS
+        by (str, optional): Columna que define los grupos; sin columna se
+            resume todo el DataFrame bajo la clave None
+
+    Returns:
+        dict: Grupo -> {métrica: valor}. Las filas con clave nula se descartan.
+    """
+    if by is not None:
+        # groupby descarta las claves nulas; se quitan antes para que ngroup() no tenga NaN
+        books = books[books[by].notna().to_numpy()]
+    books = books.reset_index(drop=True).assign(
+        _popular=books['Reviews'].to_numpy() > POPULAR_REVIEWS_THRESHOLD,
+        _highly_rated=books['User Rating'].to_numpy() >= HIGH_RATING_THRESHOLD,
+        _expensive=books['Price'].to_numpy() >= EXPENSIVE_PRICE_THRESHOLD,
+    )
+    if books.empty:
+        return {}
+
+    # Un solo agrupamiento (hash de la clave) compartido por todas las métricas
+    groups = books.groupby(books[by] if by is not None else np.zeros(len(books), dtype=np.int8),
+                           sort=False)
+    group_keys = groups.size().index
+    # tolist() devuelve escalares nativos; DataFrame.to_dict('index') es mucho más lento
+    columns = [GROUP_METRICS[metric](groups, books).reindex(group_keys).tolist() for metric in metrics]
+    keys = [None] if by is None else group_keys.tolist()
+    return {key: dict(zip(metrics, values)) for key, *values in zip(keys, *columns)}
+
+
+class BaseAnalyzer(ABC):
+    """
+    Clase base de los analizadores de libros.
+
+    Cada analizador declara qué grupo analiza (``group_by`` y ``group_key``)
+    y qué métricas de GROUP_METRICS necesita (``metrics``); así
+    AnalysisExecutor puede combinar varios analizadores en una sola pasada
+    agrupada y entregar a cada uno su parte ya calculada.
+
+    Attributes:
+        data_manager (BookDataManager): Fuente de los datos
+        group_by (str): Columna que define el grupo (None para el catálogo completo)
+        metrics (tuple): Métricas que necesita el analizador
+    """
+
+    group_by = None
+    metrics = ()
+
+    def __init__(self, data_manager):
+        """
+        Args:
+            data_manager (BookDataManager): Gestor de datos compartido por los analizadores
+        """
+        self.data_manager = data_manager
+
+    @property
+    def group_key(self):
+        """Grupo analizado dentro de ``group_by`` (None para el catálogo completo)."""
+        return None
+
+    @abstractmethod
+    def analyze(self):
+        """
+        Ejecuta el análisis.
+
+        Returns:
+            dict: Métricas calculadas
+        """
+
+    @abstractmethod
+    def build_results(self, summary):
+        """
+        Arma los resultados a partir de las métricas ya calculadas.
+
+        Args:
+            summary (dict): {métrica: valor} del grupo, o None si no tiene libros
+
+        Returns:
+            dict: Resultados en el formato de analyze()
+        """
+
+    def _summary(self):
+        """Métricas del grupo de este analizador, calculadas solo sobre sus filas."""
+        keys = None if self.group_by is None else [self.group_key]
+        return self.data_manager.summarize(self.metrics, by=self.group_by, keys=keys).get(self.group_key)
+
+    def display_results(self, results):
+        """
+        Muestra los resultados de forma legible.
+
+        Args:
+            results (dict): Resultado de analyze()
+        """
+        print(f"\n=== {results.get('title', type(self).__name__)} ===")
+        for key, value in results.items():
+            if key == 'title':
+                continue
+            if isinstance(value, dict):
+                print(f'{key}:')
+                for inner_key, inner_value in value.items():
+                    print(f'  {inner_key}: {self._format(inner_value)}')
+            elif isinstance(value, list):
+                print(f'{key}:')
+                for item in value:
+                    print(f'  - {self._format(item)}')
+            else:
+                print(f'{key}: {self._format(value)}')
+
+    @staticmethod
+    def _format(value):
+        """Formatea números con dos decimales y deja el resto sin cambios."""
+        if isinstance(value, (float, np.floating)):
+            return f'{value:.2f}'
+        return value
+
+
+class GeneralAnalyzer(BaseAnalyzer):
+    """Estadísticas resumidas del dataset completo."""
+
+    metrics = ('total_books', 'average_rating', 'average_price', 'total_reviews',
+               'genre_distribution', 'year_range', 'highly_rated_books', 'expensive_books')
+
+    def analyze(self):
+        """
+        Calcula las métricas generales del catálogo.
+
+        Returns:
+            dict: Totales, promedios, distribución de géneros, rango de años y
+                conteos de libros altamente calificados y caros
+        """
+        return self.build_results(self._summary())
+
+    def build_results(self, summary):
+        """
+        Arma los resultados generales a partir de las métricas del catálogo.
+
+        Args:
+            summary (dict): Métricas del catálogo completo
+
+        Returns:
+            dict: Resultados del análisis general
+
+        Raises:
+            ValueError: Si el catálogo está vacío
+        """
+        if summary is None:
+            raise ValueError('El catálogo no tiene libros')
+        return {'title': 'Análisis General', **summary}
+
+
+class GenreAnalyzer(BaseAnalyzer):
+    """Análisis detallado de un género."""
+
+    group_by = 'Genre'
+    metrics = ('total_books', 'average_rating', 'average_price', 'total_reviews', 'popular_books',
+               'highly_rated_books', 'price_range', 'year_range')
+
+    def __init__(self, data_manager, genre):
+        """
+        Args:
+            data_manager (BookDataManager): Gestor de datos
+            genre (str): Género a analizar
+        """
+        super().__init__(data_manager)
+        self.genre = genre
+
+    @property
+    def group_key(self):
+        return self.genre
+
+    def analyze(self):
+        """
+        Calcula las métricas del género.
+
+        Returns:
+            dict: Estadísticas del género, libros populares y altamente
+                calificados, rango de precios y de años
+
+        Raises:
+            ValueError: Si no hay libros del género
+        """
+        return self.build_results(self._summary())
+
+    def build_results(self, summary):
+        """
+        Arma los resultados del género a partir de sus métricas.
+
+        Args:
+            summary (dict): Métricas del género
+
+        Returns:
+            dict: Resultados del análisis del género
+
+        Raises:
+            ValueError: Si no hay libros del género
+        """
+        if summary is None:
+            raise ValueError(f'No hay libros del género {self.genre!r}')
+        return {'title': f'Análisis del Género: {self.genre}', **summary}
+
+
+class AuthorAnalyzer(BaseAnalyzer):
+    """Análisis detallado de un autor."""
+
+    group_by = 'Author'
+    metrics = ('total_books', 'average_rating', 'average_price', 'total_reviews', 'best_rated_book',
+               'most_reviewed_book', 'genres', 'year_range', 'books')
+
+    def __init__(self, data_manager, author_name):
+        """
+        Args:
+            data_manager (BookDataManager): Gestor de datos
+            author_name (str): Autor a analizar
+        """
+        super().__init__(data_manager)
+        self.author_name = author_name
+
+    @property
+    def group_key(self):
+        return self.author_name
+
+    def analyze(self):
+        """
+        Calcula las métricas del autor.
+
+        Returns:
+            dict: Estadísticas del autor, mejor libro calificado, libro más
+                reseñado, géneros, rango de años y lista de libros
+
+        Raises:
+            ValueError: Si no hay libros del autor
+        """
+        return self.build_results(self._summary())
+
+    def build_results(self, summary):
+        """
+        Arma los resultados del autor a partir de sus métricas.
+
+        Args:
+            summary (dict): Métricas del autor
+
+        Returns:
+            dict: Resultados del análisis del autor
+
+        Raises:
+            ValueError: Si no hay libros del autor
+        """
+        if summary is None:
+            raise ValueError(f'No hay libros del autor {self.author_name!r}')
+        return {'title': f'Análisis del Autor: {self.author_name}', **summary}
+
+
+class AnalysisExecutor:
+    """
+    Ejecuta varios analizadores con una pasada agrupada por columna.
+
+    Los analizadores se reúnen según su ``group_by``: para cada columna se
+    unen los grupos y las métricas que piden y se calcula todo con un solo
+    BookDataManager.summarize. Un reporte con un AuthorAnalyzer por autor,
+    un GenreAnalyzer por género y el GeneralAnalyzer cuesta así tres
+    pasadas agrupadas en lugar de una por analizador.
+
+    Attributes:
+        data_manager (BookDataManager): Gestor de datos compartido
+    """
+
+    def __init__(self, data_manager):
+        """
+        Args:
+            data_manager (BookDataManager): Gestor de datos compartido por los analizadores
+        """
+        self.data_manager = data_manager
+
+    def run(self, analyzers, skip_missing=False):
+        """
+        Ejecuta los analizadores y devuelve sus resultados en el mismo orden.
+
+        Args:
+            analyzers (list): Instancias de BaseAnalyzer
+            skip_missing (bool): Si es True, los grupos sin libros devuelven
+                None en lugar de lanzar ValueError
+
+        Returns:
+            list: Resultado de cada analizador (el mismo dict que su analyze())
+
+        Raises:
+            ValueError: Si algún grupo no tiene libros y skip_missing es False
+        """
+        requests = {}
+        for analyzer in analyzers:
+            keys, metrics = requests.setdefault(analyzer.group_by, ({}, {}))
+            keys[analyzer.group_key] = None
+            metrics.update(dict.fromkeys(analyzer.metrics))
+
+        summaries = {}
+        for by, (keys, metrics) in requests.items():
+            summaries[by] = self.data_manager.summarize(list(metrics), by=by,
+                                                        keys=None if by is None else list(keys))
+
+        results = []
+        for analyzer in analyzers:
+            summary = summaries[analyzer.group_by].get(analyzer.group_key)
+            if summary is None and skip_missing:
+                results.append(None)
+                continue
+            # Cada analizador recibe solo sus métricas de la pasada compartida
+            results.append(analyzer.build_results({metric: summary[metric] for metric in analyzer.metrics}
+                                                  if summary is not None else None))
+        return results
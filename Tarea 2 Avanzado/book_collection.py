@@ -0,0 +1,269 @@
+import numpy as np
+import pandas as pd
+
+from book_analyzer_classes import HIGH_RATING_THRESHOLD
+
+
+def _decode(uniques, codes):
+    """Valores de un diccionario de códigos; el código -1 (nulo) se convierte en None."""
+    values = np.full(len(codes), None, dtype=object)
+    valid = codes >= 0
+    values[valid] = uniques[codes[valid]]
+    return values
+
+
+class BookCollection:
+    """
+    Colección columnar de libros.
+
+    Guarda el nombre, el autor, el precio y la calificación de todos los
+    libros como arreglos contiguos: los nombres y autores se internan como
+    códigos enteros sobre un diccionario de valores distintos (como una
+    columna categórica), y el precio y la calificación son arreglos de
+    numpy. Los libros individuales son vistas ``Book`` de una fila, que no
+    copian datos; las operaciones masivas (``is_highly_rated``,
+    ``highly_rated``) se calculan vectorizadas sobre toda la colección.
+
+    Attributes:
+        prices (numpy.ndarray): Precio de cada libro
+        ratings (numpy.ndarray): Calificación de cada libro
+    """
+
+    def __init__(self, name_codes, names, author_codes, authors, prices, ratings):
+        """
+        Args:
+            name_codes (numpy.ndarray): Código del nombre de cada libro
+            names (numpy.ndarray): Nombres distintos (diccionario de códigos)
+            author_codes (numpy.ndarray): Código del autor de cada libro
+            authors (numpy.ndarray): Autores distintos (diccionario de códigos)
+            prices (numpy.ndarray): Precio de cada libro
+            ratings (numpy.ndarray): Calificación de cada libro
+
+        Raises:
+            ValueError: Si los arreglos no tienen la misma longitud
+        """
+        if not len(name_codes) == len(author_codes) == len(prices) == len(ratings):
+            raise ValueError('Todas las columnas deben tener la misma longitud')
+        self._name_codes = name_codes
+        self._names = names
+        self._author_codes = author_codes
+        self._authors = authors
+        self.prices = prices
+        self.ratings = ratings
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Construye la colección a partir de un DataFrame con el esquema del dataset.
+
+        Args:
+            df (pandas.DataFrame): Columnas 'Name', 'Author', 'Price' y 'User Rating'
+
+        Returns:
+            BookCollection: La colección
+        """
+        name_codes, names = pd.factorize(df['Name'])
+        author_codes, authors = pd.factorize(df['Author'])
+        return cls(name_codes.astype(np.int32), np.asarray(names, dtype=object),
+                   author_codes.astype(np.int32), np.asarray(authors, dtype=object),
+                   df['Price'].to_numpy(), df['User Rating'].to_numpy(dtype=np.float64))
+
+    @classmethod
+    def from_data_manager(cls, data_manager):
+        """
+        Construye la colección con todos los libros de un BookDataManager.
+
+        Args:
+            data_manager (BookDataManager): Gestor de datos
+
+        Returns:
+            BookCollection: La colección
+        """
+        return cls.from_frame(data_manager.get_data())
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Construye la colección a partir de tuplas (name, author, price, rating).
+
+        Args:
+            records (iterable): Tuplas con los datos de cada libro
+
+        Returns:
+            BookCollection: La colección
+        """
+        df = pd.DataFrame(list(records), columns=['Name', 'Author', 'Price', 'User Rating'])
+        return cls.from_frame(df)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, position):
+        """Vista Book de una fila (admite posiciones negativas)."""
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError('Posición fuera de la colección')
+        return Book._view(self, position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield Book._view(self, position)
+
+    @property
+    def names(self):
+        """numpy.ndarray: Nombre de cada libro (materializa el arreglo; None si es nulo)."""
+        return _decode(self._names, self._name_codes)
+
+    @property
+    def authors(self):
+        """numpy.ndarray: Autor de cada libro (materializa el arreglo; None si es nulo)."""
+        return _decode(self._authors, self._author_codes)
+
+    @property
+    def nbytes(self):
+        """int: Bytes de los arreglos (cada texto internado cuenta solo como una referencia)."""
+        return sum(array.nbytes for array in (self._name_codes, self._author_codes, self.prices, self.ratings,
+                                              self._names, self._authors))
+
+    def take(self, positions):
+        """
+        Subcolección con las filas indicadas; comparte los diccionarios de nombres y autores.
+
+        Args:
+            positions (array-like): Posiciones o máscara booleana
+
+        Returns:
+            BookCollection: Las filas seleccionadas
+        """
+        positions = np.asarray(positions)
+        return BookCollection(self._name_codes[positions], self._names, self._author_codes[positions],
+                              self._authors, self.prices[positions], self.ratings[positions])
+
+    def is_highly_rated(self, threshold=HIGH_RATING_THRESHOLD):
+        """
+        Indica qué libros tienen una calificación alta, para toda la colección a la vez.
+
+        Args:
+            threshold (float): Calificación mínima
+
+        Returns:
+            numpy.ndarray: Máscara booleana
+        """
+        return self.ratings >= threshold
+
+    def highly_rated(self, threshold=HIGH_RATING_THRESHOLD):
+        """
+        Libros con calificación alta.
+
+        Args:
+            threshold (float): Calificación mínima
+
+        Returns:
+            BookCollection: Subcolección de libros altamente calificados
+        """
+        return self.take(self.is_highly_rated(threshold))
+
+    def to_frame(self):
+        """
+        Convierte la colección en DataFrame.
+
+        Returns:
+            pandas.DataFrame: Columnas Name, Author (categóricas), Price y User Rating
+        """
+        return pd.DataFrame({
+            'Name': pd.Categorical.from_codes(self._name_codes, categories=pd.Index(self._names)),
+            'Author': pd.Categorical.from_codes(self._author_codes, categories=pd.Index(self._authors)),
+            'Price': self.prices,
+            'User Rating': self.ratings,
+        })
+
+
+class Book:
+    """
+    Libro: vista ligera de una fila de BookCollection.
+
+    Usa ``__slots__`` y solo guarda la colección y la posición; los campos se
+    leen de los arreglos de la colección. ``Book(name, author, price,
+    rating)`` sigue funcionando: crea un libro independiente que guarda sus
+    cuatro valores en una tupla, sin construir arreglos.
+
+    Los libros son inmutables (``book.price = 9`` lanza AttributeError): para
+    cambiar datos se modifica la colección (``collection.prices[i] = 9``) o
+    se crea un libro nuevo.
+    """
+
+    __slots__ = ('_collection', '_position', '_values')
+
+    def __init__(self, name, author, price, rating):
+        """
+        Args:
+            name (str): Título del libro
+            author (str): Autor
+            price (float): Precio
+            rating (float): Calificación de los usuarios
+        """
+        self._collection = None
+        self._position = None
+        self._values = (name, author, price, rating)
+
+    @classmethod
+    def _view(cls, collection, position):
+        """Crea la vista de una fila sin copiar datos."""
+        book = cls.__new__(cls)
+        book._collection = collection
+        book._position = position
+        book._values = None
+        return book
+
+    @property
+    def name(self):
+        if self._values is not None:
+            return self._values[0]
+        collection = self._collection
+        code = collection._name_codes[self._position]
+        return collection._names[code] if code >= 0 else None
+
+    @property
+    def author(self):
+        if self._values is not None:
+            return self._values[1]
+        collection = self._collection
+        code = collection._author_codes[self._position]
+        return collection._authors[code] if code >= 0 else None
+
+    @property
+    def price(self):
+        if self._values is not None:
+            return self._values[2]
+        return self._collection.prices[self._position].item()
+
+    @property
+    def rating(self):
+        if self._values is not None:
+            return self._values[3]
+        return self._collection.ratings[self._position].item()
+
+    def display_info(self):
+        """
+        Devuelve la ficha del libro.
+
+        Returns:
+            str: Título, autor y precio
+        """
+        return f'Título: "{self.name}", Autor: {self.author}, Precio: ${self.price}'
+
+    def is_highly_rated(self, threshold=HIGH_RATING_THRESHOLD):
+        """
+        Indica si el libro tiene una calificación alta.
+
+        Args:
+            threshold (float): Calificación mínima
+
+        Returns:
+            bool: True si la calificación es mayor o igual al umbral
+        """
+        return self.rating >= threshold
+
+    def __repr__(self):
+        return f'Book({self.name!r}, {self.author!r}, {self.price!r}, {self.rating!r})'
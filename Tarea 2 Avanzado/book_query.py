@@ -0,0 +1,384 @@
+import numpy as np
+import pandas as pd
+
+
+class Predicate:
+    """
+    Condición vectorizada sobre las columnas del catálogo.
+
+    Se construye con ``col``: ``col('User Rating') >= 4.8``. Las condiciones se
+    combinan con ``&``, ``|`` y ``~`` y se evalúan como máscaras booleanas de
+    numpy sobre columnas completas, nunca fila por fila. Las comparaciones de
+    igualdad y de rango recuerdan su columna y sus límites para que BookQuery
+    pueda usar los índices de BookDataManager.
+    """
+
+    def __init__(self, evaluate, column=None, kind=None, args=(), children=()):
+        """
+        Args:
+            evaluate (callable): Función get(columna) -> máscara booleana
+            column (str, optional): Columna comparada (para usar su índice)
+            kind (str, optional): 'eq', 'range' o 'and'
+            args (tuple): Valor buscado ('eq') o límites (low, high) ('range')
+            children (tuple): Condiciones combinadas ('and')
+        """
+        self._evaluate = evaluate
+        self.column = column
+        self.kind = kind
+        self.args = args
+        self.children = children
+
+    def mask(self, get):
+        """
+        Evalúa la condición.
+
+        Args:
+            get (callable): Devuelve los valores de una columna como arreglo
+
+        Returns:
+            numpy.ndarray: Máscara booleana
+        """
+        return np.asarray(self._evaluate(get), dtype=bool)
+
+    def conjuncts(self):
+        """Condiciones que deben cumplirse todas (aplana los ``&`` anidados)."""
+        if self.kind == 'and':
+            return [conjunct for child in self.children for conjunct in child.conjuncts()]
+        return [self]
+
+    def __and__(self, other):
+        return Predicate(lambda get: self.mask(get) & other.mask(get), kind='and', children=(self, other))
+
+    def __or__(self, other):
+        return Predicate(lambda get: self.mask(get) | other.mask(get))
+
+    def __invert__(self):
+        return Predicate(lambda get: ~self.mask(get))
+
+
+class Column:
+    """
+    Referencia a una columna para construir condiciones (ver ``col``).
+
+    Attributes:
+        name (str): Nombre de la columna
+    """
+
+    # Las comparaciones devuelven condiciones, no booleanos: no se puede usar en sets ni dicts
+    __hash__ = None
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Nombre de la columna (también las creadas con label_bins)
+        """
+        self.name = name
+
+    def _range(self, operator, low, high):
+        name = self.name
+        return Predicate(lambda get: operator(get(name)), column=name, kind='range', args=(low, high))
+
+    def __eq__(self, value):
+        name = self.name
+        return Predicate(lambda get: get(name) == value, column=name, kind='eq', args=(value,))
+
+    def __ne__(self, value):
+        name = self.name
+        return Predicate(lambda get: get(name) != value)
+
+    def __ge__(self, value):
+        return self._range(lambda values: values >= value, value, None)
+
+    def __gt__(self, value):
+        # El índice da las filas >= value; la máscara descarta las iguales
+        return self._range(lambda values: values > value, value, None)
+
+    def __le__(self, value):
+        return self._range(lambda values: values <= value, None, value)
+
+    def __lt__(self, value):
+        return self._range(lambda values: values < value, None, value)
+
+    def between(self, low, high):
+        """
+        Condición low <= columna <= high.
+
+        Args:
+            low (float): Límite inferior incluido
+            high (float): Límite superior incluido
+
+        Returns:
+            Predicate: La condición
+        """
+        return self._range(lambda values: (values >= low) & (values <= high), low, high)
+
+    def isin(self, values):
+        """
+        Condición "la columna toma alguno de los valores".
+
+        Args:
+            values (iterable): Valores aceptados
+
+        Returns:
+            Predicate: La condición
+        """
+        name, values = self.name, list(values)
+        return Predicate(lambda get: pd.Series(get(name), copy=False).isin(values).to_numpy())
+
+
+def col(name):
+    """
+    Crea una referencia a una columna para escribir condiciones.
+
+    Args:
+        name (str): Nombre de la columna
+
+    Returns:
+        Column: Referencia a la columna (ej: ``col('Genre') == 'Fiction'``)
+    """
+    return Column(name)
+
+
+def bin_labels(values, thresholds, labels):
+    """
+    Asigna a cada valor la etiqueta de su intervalo.
+
+    Los umbrales son límites inferiores crecientes: los valores menores que
+    el primero reciben labels[0] y los mayores o iguales a thresholds[i]
+    reciben labels[i + 1] (lo mismo que ``pd.cut(..., right=False)``). Los NaN
+    quedan sin etiqueta.
+
+    Args:
+        values (array-like): Valores numéricos
+        thresholds (list): Umbrales crecientes
+        labels (list): Una etiqueta más que umbrales
+
+    Returns:
+        pandas.Categorical: Etiqueta de cada valor
+
+    Raises:
+        ValueError: Si el número de etiquetas no es len(thresholds) + 1
+    """
+    if len(labels) != len(thresholds) + 1:
+        raise ValueError('Se necesita una etiqueta más que umbrales')
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.searchsorted(np.asarray(thresholds, dtype=np.float64), values, side='right')
+    codes[np.isnan(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=list(labels))
+
+
+class BookQuery:
+    """
+    Consulta perezosa y componible sobre el catálogo de BookDataManager.
+
+    ``where``, ``select`` y ``label_bins`` solo registran la operación y
+    devuelven una consulta nueva (la original no cambia), así que se pueden
+    encadenar al estilo funcional. Nada se evalúa hasta pedir un resultado
+    (``count``, ``values``, ``to_frame`` o ``agg``). En ese momento:
+    - Las condiciones de igualdad o de rango sobre columnas indexadas dan
+      las filas candidatas (se usa la más selectiva).
+    - Todas las condiciones se evalúan juntas sobre esas filas, en una sola
+      máscara booleana.
+    - Las columnas derivadas y las reducciones se calculan solo sobre las
+      filas seleccionadas, con operaciones nativas de numpy/pandas.
+
+    Ejemplo::
+
+        elite = (BookQuery(data_manager)
+                 .where(col('Genre') == 'Non Fiction', col('User Rating') >= 4.8))
+        elite.agg(total=('Price', 'sum'))
+    """
+
+    def __init__(self, data_manager, predicates=(), columns=None, labels=None):
+        """
+        Args:
+            data_manager (BookDataManager): Fuente de los datos
+            predicates (tuple): Condiciones acumuladas
+            columns (tuple, optional): Columnas seleccionadas (por defecto todas)
+            labels (dict, optional): Columnas derivadas: nombre -> (columna, umbrales, etiquetas)
+        """
+        self.data_manager = data_manager
+        self._predicates = tuple(predicates)
+        self._columns = columns
+        self._labels = dict(labels or {})
+
+    def _replace(self, **changes):
+        state = {'predicates': self._predicates, 'columns': self._columns, 'labels': self._labels}
+        state.update(changes)
+        return BookQuery(self.data_manager, **state)
+
+    def where(self, *predicates, **equals):
+        """
+        Agrega condiciones (todas deben cumplirse).
+
+        Args:
+            *predicates (Predicate): Condiciones construidas con ``col``
+            **equals: Igualdades abreviadas con el nombre de columna como
+                palabra clave (ej: ``Year=2019``)
+
+        Returns:
+            BookQuery: Consulta nueva con las condiciones agregadas
+        """
+        predicates = list(predicates) + [col(column) == value for column, value in equals.items()]
+        return self._replace(predicates=self._predicates + tuple(predicates))
+
+    def select(self, *columns):
+        """
+        Elige las columnas del resultado.
+
+        Args:
+            *columns (str): Columnas del catálogo o derivadas
+
+        Returns:
+            BookQuery: Consulta nueva con la proyección
+        """
+        return self._replace(columns=tuple(columns))
+
+    def label_bins(self, column, thresholds, labels, name=None):
+        """
+        Agrega una columna derivada con la etiqueta del intervalo de cada valor.
+
+        Equivale a ``list(map(get_rating_label, df['User Rating']))`` pero
+        vectorizado (ver ``bin_labels``); p. ej.
+        ``label_bins('User Rating', [3.5, 4.0, 4.5], ['Poor', 'Average', 'Good', 'Excellent'])``.
+
+        Args:
+            column (str): Columna numérica de origen
+            thresholds (list): Umbrales crecientes (límites inferiores)
+            labels (list): Una etiqueta más que umbrales
+            name (str, optional): Nombre de la columna nueva (por defecto '<column> Label')
+
+        Returns:
+            BookQuery: Consulta nueva con la columna derivada
+
+        Raises:
+            ValueError: Si el número de etiquetas no es len(thresholds) + 1
+        """
+        if len(labels) != len(thresholds) + 1:
+            raise ValueError('Se necesita una etiqueta más que umbrales')
+        name = name or f'{column} Label'
+        labels_by_name = dict(self._labels)
+        labels_by_name[name] = (column, tuple(thresholds), tuple(labels))
+        columns = self._columns + (name,) if self._columns is not None else None
+        return self._replace(labels=labels_by_name, columns=columns)
+
+    def _getter(self, positions):
+        """Devuelve get(columna): valores de las filas indicadas, calculados una vez por columna."""
+        df = self.data_manager.get_data()
+        cache = {}
+
+        def get(name):
+            if name not in cache:
+                if name in self._labels:
+                    column, thresholds, labels = self._labels[name]
+                    cache[name] = bin_labels(get(column), thresholds, labels)
+                elif name in df.columns:
+                    values = df[name].to_numpy()
+                    cache[name] = values if positions is None else values[positions]
+                else:
+                    raise KeyError(f'Columna inexistente: {name!r}')
+            return cache[name]
+
+        return get
+
+    def _candidates(self, conjuncts):
+        """Filas candidatas según el índice más selectivo (None si conviene recorrer todo)."""
+        manager = self.data_manager
+        best, best_size = None, len(manager.get_data())
+        for predicate in conjuncts:
+            kind = manager.index_kind(predicate.column) if predicate.column else None
+            if predicate.kind == 'eq' and kind == 'hash':
+                size = len(manager.positions(predicate.column, predicate.args[0]))
+            elif predicate.kind == 'range' and kind == 'sorted':
+                size = manager.count_in_range(predicate.column, *predicate.args)
+            else:
+                continue
+            if size < best_size:
+                best, best_size = predicate, size
+        if best is None:
+            return None
+        if best.kind == 'eq':
+            return manager.positions(best.column, best.args[0])
+        return manager.range_positions(best.column, *best.args)
+
+    def positions(self):
+        """
+        Evalúa las condiciones y devuelve las filas que las cumplen.
+
+        Returns:
+            numpy.ndarray: Posiciones en orden creciente
+        """
+        conjuncts = [conjunct for predicate in self._predicates for conjunct in predicate.conjuncts()]
+        candidates = self._candidates(conjuncts)
+        get = self._getter(candidates)
+        # Todas las condiciones se combinan en una sola máscara sobre las candidatas
+        mask = None
+        for predicate in conjuncts:
+            predicate_mask = predicate.mask(get)
+            mask = predicate_mask.copy() if mask is None else np.logical_and(mask, predicate_mask, out=mask)
+        base = np.arange(len(self.data_manager.get_data())) if candidates is None else candidates
+        return base if mask is None else base[mask]
+
+    def count(self):
+        """
+        Cuenta las filas que cumplen las condiciones.
+
+        Returns:
+            int: Número de filas
+        """
+        return len(self.positions())
+
+    def values(self, column):
+        """
+        Devuelve los valores de una columna en las filas seleccionadas.
+
+        Args:
+            column (str): Columna del catálogo o derivada
+
+        Returns:
+            numpy.ndarray: Valores en el orden original de las filas
+        """
+        return np.asarray(self._getter(self.positions())(column))
+
+    def to_frame(self):
+        """
+        Materializa la consulta.
+
+        Returns:
+            pandas.DataFrame: Filas seleccionadas con las columnas elegidas
+                (y las derivadas), con el índice original
+        """
+        positions = self.positions()
+        df = self.data_manager.get_data()
+        columns = self._columns if self._columns is not None else tuple(df.columns) + tuple(self._labels)
+        base = [column for column in columns if column not in self._labels]
+        result = df[base].iloc[positions] if base else pd.DataFrame(index=df.index[positions])
+        get = self._getter(positions)
+        derived = {name: get(name) for name in self._labels if name in columns}
+        if derived:
+            result = result.assign(**derived)
+        return result[list(columns)]
+
+    def agg(self, **aggregations):
+        """
+        Reduce las filas seleccionadas con reducciones nativas.
+
+        Args:
+            **aggregations: nombre=(columna, función), donde la función es el
+                nombre de una reducción de pandas ('sum', 'mean', 'min',
+                'max', 'count', 'std', 'median', 'nunique') o un callable
+                que recibe el arreglo de valores
+
+        Returns:
+            dict: nombre -> valor (escalares nativos de Python)
+        """
+        get = self._getter(self.positions())
+        results = {}
+        for name, (column, function) in aggregations.items():
+            values = get(column)
+            if callable(function):
+                value = function(values)
+            else:
+                value = getattr(pd.Series(values, copy=False), function)()
+            results[name] = value.item() if isinstance(value, np.generic) else value
+        return results
@@ -0,0 +1,42 @@
+from book_analyzer_classes import (
+    BOOKS_URL, AnalysisExecutor, AuthorAnalyzer, BookDataManager, GeneralAnalyzer, GenreAnalyzer)
+from book_collection import BookCollection
+from book_query import BookQuery, col
+
+
+if __name__ == "__main__":
+    # 1. Crear el gestor de datos (los índices se construyen una sola vez al cargar)
+    data_manager = BookDataManager(BOOKS_URL)
+
+    # 2. Todos los analizadores se tratan de manera uniforme (polimorfismo)
+    analyzers = [
+        GeneralAnalyzer(data_manager),
+        GenreAnalyzer(data_manager, "Fiction"),
+        AuthorAnalyzer(data_manager, "J.K. Rowling"),
+    ]
+    for analyzer in analyzers:
+        results = analyzer.analyze()
+        analyzer.display_results(results)
+
+    # 3. Consultas por rango con el índice ordenado
+    elite = data_manager.filter_by_range('User Rating', low=4.8)
+    print(f"\nLibros con rating >= 4.8: {len(elite)}")
+    print(f"Libros con precio entre 10 y 20: {data_manager.count_in_range('Price', 10, 20)}")
+
+    # 4. Reporte de todos los autores con una sola pasada agrupada
+    author_reports = AnalysisExecutor(data_manager).run(
+        [AuthorAnalyzer(data_manager, author) for author in data_manager.get_authors()])
+    most_reviewed = max(author_reports, key=lambda report: report['total_reviews'])
+    print(f"Autor con más reseñas: {most_reviewed['title']} ({most_reviewed['total_reviews']})")
+
+    # 5. Consultas vectorizadas: libros de no ficción de élite y etiquetas de calificación
+    elite = BookQuery(data_manager).where(col('Genre') == 'Non Fiction', col('User Rating') >= 4.8)
+    print(f"Costo total de los libros de no ficción de élite: ${elite.agg(total=('Price', 'sum'))['total']}")
+    labeled = BookQuery(data_manager).label_bins(
+        'User Rating', [3.5, 4.0, 4.5], ['Poor', 'Average', 'Good', 'Excellent'], name='Rating Label')
+    print(labeled.select('Name', 'User Rating', 'Rating Label').to_frame().head(10))
+
+    # 6. Colección columnar: los libros son vistas de una fila, las operaciones son vectorizadas
+    collection = BookCollection.from_data_manager(data_manager)
+    print(collection[6].display_info())
+    print(f"Libros altamente calificados: {collection.is_highly_rated().sum()} de {len(collection)}")
@@ -0,0 +1,177 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from book_analyzer_classes import FLAG_COLUMNS, METRIC_COLUMNS, AnalysisExecutor, group_summary
+
+
+# Columnas del catálogo abiertas por cada proceso trabajador (una vez, como memmap)
+_shared = {}
+
+
+def _save_columns(df, workdir):
+    """
+    Escribe cada columna como .npy: las numéricas y booleanas tal cual, y
+    las demás como códigos int32 más un diccionario de valores. El
+    diccionario es de ancho fijo si todos los valores son texto; si no (por
+    ejemplo años guardados como objetos), se guarda como arreglo de objetos
+    para conservar los tipos originales.
+    """
+    layout = []
+    for number, column in enumerate(df.columns):
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values.dtype) or pd.api.types.is_bool_dtype(values.dtype):
+            np.save(os.path.join(workdir, f'{number}.npy'), values.to_numpy())
+            layout.append((column, 'numeric'))
+            continue
+        codes, uniques = pd.factorize(values)
+        np.save(os.path.join(workdir, f'{number}.npy'), codes.astype(np.int32))
+        uniques = np.asarray(uniques, dtype=object)
+        # infer_dtype recorre el diccionario en C; un all(isinstance(...)) en Python
+        # cuesta casi un segundo con un millón de títulos distintos
+        if pd.api.types.infer_dtype(uniques, skipna=False) == 'string':
+            np.save(os.path.join(workdir, f'{number}_values.npy'), uniques.astype(str))
+            layout.append((column, 'text'))
+        else:
+            np.save(os.path.join(workdir, f'{number}_values.npy'), uniques, allow_pickle=True)
+            layout.append((column, 'object'))
+    return layout
+
+
+def _init_worker(workdir, layout):
+    """Abre las columnas compartidas y el orden de filas por grupo en modo memmap de solo lectura."""
+    _shared['layout'] = layout
+    _shared['columns'] = {}
+    for number, (column, kind) in enumerate(layout):
+        values = np.load(os.path.join(workdir, f'{number}.npy'), mmap_mode='r')
+        path = os.path.join(workdir, f'{number}_values.npy')
+        if kind == 'text':
+            uniques = np.load(path, mmap_mode='r')
+        elif kind == 'object':
+            # Los arreglos de objetos no admiten memmap: cada trabajador carga el diccionario
+            uniques = np.load(path, allow_pickle=True)
+        else:
+            uniques = None
+        _shared['columns'][column] = (values, uniques)
+    _shared['order'] = np.load(os.path.join(workdir, 'order.npy'), mmap_mode='r')
+
+
+def _frame(positions):
+    """Reconstruye las filas indicadas del catálogo a partir de las columnas compartidas."""
+    data = {}
+    for column, _ in _shared['layout']:
+        values, uniques = _shared['columns'][column]
+        if uniques is None:
+            data[column] = values[positions]
+            continue
+        codes = values[positions]
+        text = uniques[codes].astype(object)
+        # Código -1: valor nulo en el catálogo original
+        text[codes < 0] = None
+        data[column] = text
+    return pd.DataFrame(data)
+
+
+def _analyze_chunk(task):
+    """Analiza un grupo de claves contiguas en el orden compartido; se ejecuta en un trabajador."""
+    analyzer_class, keys, start, stop = task
+    # Las filas de las claves de la tarea son un tramo contiguo de 'order'; se
+    # reordenan para conservar el orden original dentro de cada grupo
+    positions = np.sort(_shared['order'][start:stop])
+    # Las filas ya son exactamente las de las claves: se agrupan directamente,
+    # sin construir un BookDataManager con sus índices para usarlos una vez
+    summaries = group_summary(_frame(positions), analyzer_class.metrics, by=analyzer_class.group_by)
+    # build_results solo lee el resumen, así que los analizadores no necesitan gestor
+    return [analyzer_class(None, key).build_results(summaries[key]) for key in keys]
+
+
+def _partition(keys, sizes, n_tasks):
+    """Divide las claves en tramos contiguos con un número de filas parecido."""
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    target = max(1, bounds[-1] / n_tasks)
+    tasks, first = [], 0
+    for last in range(1, len(keys) + 1):
+        if last == len(keys) or bounds[last] - bounds[first] >= target:
+            tasks.append((keys[first:last], int(bounds[first]), int(bounds[last])))
+            first = last
+    return tasks
+
+
+def analyze_parallel(data_manager, analyzer_class, keys='all', n_jobs=None, tasks_per_job=4,
+                     skip_missing=False):
+    """
+    Ejecuta un analizador por clave (autor o género) repartiendo las claves entre procesos.
+
+    Las columnas que leen las métricas del analizador se escriben una sola
+    vez en archivos .npy temporales (el texto como códigos más un
+    diccionario) que cada trabajador abre como memmap, de modo que el
+    DataFrame no se serializa
+    para cada tarea y el sistema operativo comparte las páginas entre
+    procesos. Las filas de todas las claves pedidas se ordenan por clave en
+    un arreglo compartido; cada tarea recibe un tramo contiguo de claves con
+    un número de filas parecido, reconstruye solo esas filas y calcula sus
+    métricas con group_summary en una pasada agrupada, sin construir un
+    BookDataManager ni sus índices.
+
+    Args:
+        data_manager (BookDataManager): Gestor con el catálogo
+        analyzer_class (type): AuthorAnalyzer, GenreAnalyzer u otra subclase
+            de BaseAnalyzer que reciba (data_manager, clave)
+        keys (list or str): Claves a analizar o 'all' para todas
+        n_jobs (int, optional): Número de procesos (por defecto todos los núcleos);
+            con 1 se analiza en el proceso actual con AnalysisExecutor
+        tasks_per_job (int): Tareas por proceso, para equilibrar la carga
+        skip_missing (bool): Si es True, las claves sin libros devuelven None
+            en lugar de lanzar ValueError
+
+    Returns:
+        dict: Clave -> resultado de analyze() (en el orden de las claves)
+
+    Raises:
+        ValueError: Si alguna clave no tiene libros y skip_missing es False
+    """
+    by = analyzer_class.group_by
+    if keys == 'all':
+        keys = list(data_manager.count_by(by))
+    keys = list(dict.fromkeys(keys))
+    groups = [data_manager.positions(by, key) for key in keys]
+    missing = [key for key, positions in zip(keys, groups) if len(positions) == 0]
+    if missing and not skip_missing:
+        raise ValueError(f'No hay libros para las claves: {missing[:10]}')
+
+    present = [key for key, positions in zip(keys, groups) if len(positions)]
+    results = dict.fromkeys(keys)
+    if not present:
+        return results
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1:
+        # Con un solo proceso el reparto solo agrega escritura de columnas y
+        # serialización de resultados: se analiza en el proceso actual
+        analyzers = [analyzer_class(data_manager, key) for key in present]
+        results.update(zip(present, AnalysisExecutor(data_manager).run(analyzers)))
+        return results
+    order = np.concatenate([positions for positions in groups if len(positions)])
+    sizes = [len(positions) for positions in groups if len(positions)]
+    tasks = [(analyzer_class, chunk, start, stop)
+             for chunk, start, stop in _partition(present, sizes, n_jobs * tasks_per_job)]
+
+    # Solo se escriben las columnas que leen las métricas del analizador
+    needed = {by, *FLAG_COLUMNS}.union(*(METRIC_COLUMNS[metric] for metric in analyzer_class.metrics))
+    books = data_manager.get_data()
+    books = books[[column for column in books.columns if column in needed]]
+
+    workdir = tempfile.mkdtemp(prefix='book_analysis_')
+    try:
+        layout = _save_columns(books, workdir)
+        np.save(os.path.join(workdir, 'order.npy'), order)
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks)),
+                                 initializer=_init_worker, initargs=(workdir, layout)) as executor:
+            for (_, chunk, _, _), chunk_results in zip(tasks, executor.map(_analyze_chunk, tasks)):
+                results.update(zip(chunk, chunk_results))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
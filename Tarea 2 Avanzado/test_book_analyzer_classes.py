@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+import pytest
+from book_analyzer_classes import (
+    AnalysisExecutor, AuthorAnalyzer, BookDataManager, GeneralAnalyzer, GenreAnalyzer)
+
+
+def make_books(n=2000, seed=0):
+    """Catálogo sintético de n libros con 50 autores y los nombres de columna del CSV original"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Name': [f'Libro {i}' for i in range(n)],
+        'Author': rng.choice([f'Autor {i}' for i in range(50)], n),
+        'User  Rating ': rng.choice(np.round(np.arange(3.3, 5.0, 0.1), 1), n),
+        'Reviews': rng.integers(0, 90000, n),
+        'Price': rng.integers(0, 110, n),
+        'Year': rng.integers(2009, 2020, n),
+        'Genre': rng.choice(['Fiction', 'Non Fiction'], n),
+    })
+
+
+def test_indexed_lookups_match_full_scans():
+    """Los filtros por índice hash y por rango coinciden con recorrer todo el DataFrame"""
+    df = make_books()
+    manager = BookDataManager(df)
+    assert 'User Rating' in manager.df.columns
+    books = manager.df
+
+    pd.testing.assert_frame_equal(manager.filter_by_author('Autor 7'), books[books['Author'] == 'Autor 7'])
+    pd.testing.assert_frame_equal(manager.filter_by_genre('Fiction'), books[books['Genre'] == 'Fiction'])
+    pd.testing.assert_frame_equal(manager.filter_by_year(2015), books[books['Year'] == 2015])
+    assert manager.filter_by_author('Nadie').empty
+
+    pd.testing.assert_frame_equal(manager.filter_by_range('User Rating', low=4.8),
+                                  books[books['User Rating'] >= 4.8])
+    pd.testing.assert_frame_equal(manager.filter_by_range('Price', 10, 20),
+                                  books[books['Price'].between(10, 20)])
+    assert manager.count_in_range('Reviews', high=20000) == (books['Reviews'] <= 20000).sum()
+    assert manager.count_in_range('Price', 30, 10) == 0
+    with pytest.raises(KeyError):
+        manager.filter_by_range('Name', low='A')
+
+
+def test_analyzers():
+    """Los analizadores general, por género y por autor calculan sus métricas sobre los datos"""
+    manager = BookDataManager(make_books())
+    books = manager.df
+
+    general = GeneralAnalyzer(manager).analyze()
+    assert general['total_books'] == len(books)
+    assert general['genre_distribution'] == books['Genre'].value_counts().to_dict()
+    assert general['highly_rated_books'] == (books['User Rating'] >= 4.7).sum()
+    assert general['expensive_books'] == (books['Price'] >= 20).sum()
+
+    fiction = GenreAnalyzer(manager, 'Fiction').analyze()
+    assert fiction['popular_books'] == ((books['Genre'] == 'Fiction') & (books['Reviews'] > 20000)).sum()
+
+    author = AuthorAnalyzer(manager, 'Autor 3').analyze()
+    own = books[books['Author'] == 'Autor 3']
+    assert author['total_books'] == len(own)
+    assert author['most_reviewed_book'] == own.loc[own['Reviews'].idxmax(), 'Name']
+    with pytest.raises(ValueError):
+        AuthorAnalyzer(manager, 'Nadie').analyze()
+
+
+def test_executor_matches_individual_analyzers():
+    """AnalysisExecutor devuelve lo mismo que cada analyze() y None para grupos sin libros"""
+    manager = BookDataManager(make_books())
+    analyzers = ([GeneralAnalyzer(manager)]
+                 + [GenreAnalyzer(manager, genre) for genre in manager.get_genres()]
+                 + [AuthorAnalyzer(manager, author) for author in manager.get_authors()]
+                 + [AuthorAnalyzer(manager, 'Nadie')])
+
+    results = AnalysisExecutor(manager).run(analyzers, skip_missing=True)
+    assert results[-1] is None
+    for analyzer, result in zip(analyzers[:-1], results[:-1]):
+        assert result == analyzer.analyze()
+    with pytest.raises(ValueError):
+        AnalysisExecutor(manager).run(analyzers)
+
+
+def test_executor_handles_null_keys_and_all_null_groups():
+    """Las claves nulas se descartan y un grupo sin valores da NaN o None en vez de fallar"""
+    books = make_books(300)
+    books.loc[3, 'Author'] = None
+    first = books['Author'] == books['Author'].iloc[0]
+    books.loc[first, ['Reviews', 'User  Rating ']] = np.nan
+    manager = BookDataManager(books)
+    analyzers = [AuthorAnalyzer(manager, author) for author in manager.get_authors()]
+
+    results = AnalysisExecutor(manager).run(analyzers)
+    for analyzer, result in zip(analyzers, results):
+        expected = analyzer.analyze()
+        # Sin calificaciones la media es NaN (NaN != NaN)
+        assert result.pop('average_rating') == pytest.approx(expected.pop('average_rating'), nan_ok=True)
+        assert result == expected
+    empty = results[0]
+    assert empty['best_rated_book'] is None and empty['most_reviewed_book'] is None
+    assert empty['books'] == books.loc[first, 'Name'].tolist()
+    assert sum(result['total_books'] for result in results) == len(books) - 1
+
+
+def test_append_matches_full_reload():
+    """Agregar lotes con append deja los datos, índices y métricas igual que cargar todo de una vez"""
+    books = make_books(3000)
+    manager = BookDataManager(books.iloc[:2000])
+    manager.append(books.iloc[2000:2500]).append(books.iloc[2500:])
+    full = BookDataManager(books)
+
+    general = GeneralAnalyzer(manager).analyze()
+    expected = GeneralAnalyzer(full).analyze()
+    assert general['average_rating'] == pytest.approx(expected.pop('average_rating'))
+    assert general['average_price'] == pytest.approx(expected.pop('average_price'))
+    assert {key: value for key, value in general.items() if key in expected} == expected
+
+    pd.testing.assert_frame_equal(manager.df, full.df)
+    pd.testing.assert_frame_equal(manager.filter_by_author('Autor 7'), full.filter_by_author('Autor 7'))
+    pd.testing.assert_frame_equal(manager.filter_by_range('User Rating', 4.5, 4.8),
+                                  full.filter_by_range('User Rating', 4.5, 4.8))
+    assert AuthorAnalyzer(manager, 'Autor 7').analyze() == AuthorAnalyzer(full, 'Autor 7').analyze()
+    with pytest.raises(ValueError):
+        manager.append(books[['Name', 'Author']])
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from book_analyzer_classes import BookDataManager
+from book_collection import Book, BookCollection
+from test_book_analyzer_classes import make_books
+
+
+def test_book_is_a_slotted_view():
+    """Book muestra su información, evalúa su calificación y no admite atributos nuevos ni cambios"""
+    book = Book("1984", "George Orwell", 8, 4.7)
+    assert book.display_info() == 'Título: "1984", Autor: George Orwell, Precio: $8'
+    assert book.is_highly_rated()
+    assert not book.is_highly_rated(threshold=4.8)
+    with pytest.raises(AttributeError):
+        book.extra = 1
+    with pytest.raises(AttributeError):
+        book.price = 9
+
+
+def test_collection_from_data_manager():
+    """La colección columnar reproduce las filas del gestor y filtra los libros mejor calificados"""
+    manager = BookDataManager(make_books())
+    books = manager.df
+    collection = BookCollection.from_data_manager(manager)
+
+    assert len(collection) == len(books)
+    row = books.iloc[6]
+    book = collection[6]
+    assert (book.name, book.author, book.price, book.rating) == (
+        row['Name'], row['Author'], row['Price'], row['User Rating'])
+    assert collection[-1].name == books['Name'].iloc[-1]
+    with pytest.raises(IndexError):
+        collection[len(books)]
+
+    expected = (books['User Rating'] >= 4.7).to_numpy()
+    np.testing.assert_array_equal(collection.is_highly_rated(), expected)
+    np.testing.assert_array_equal([book.is_highly_rated() for book in collection], expected)
+    highly_rated = collection.highly_rated()
+    np.testing.assert_array_equal(highly_rated.names, books['Name'].to_numpy()[expected])
+    frame = collection.to_frame()
+    pd.testing.assert_series_equal(frame['Author'].astype(str), books['Author'].astype(str), check_dtype=False)
+
+
+def test_null_names_and_authors_stay_null():
+    """Los autores nulos se conservan como None al indexar, tomar filas y mostrar un libro"""
+    collection = BookCollection.from_records([('A', 'x', 1, 4.0), ('B', None, 2, 4.8), ('C', 'y', 3, 4.9)])
+
+    assert collection[1].author is None
+    assert list(collection.authors) == ['x', None, 'y']
+    assert list(collection.take([1]).authors) == [None]
+    assert collection[1].display_info() == 'Título: "B", Autor: None, Precio: $2'
@@ -0,0 +1,56 @@
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import pytest
+from book_analyzer_classes import BookDataManager
+from book_query import BookQuery, bin_labels, col
+from test_book_analyzer_classes import make_books
+
+
+def get_rating_label(rating):
+    """Etiqueta de calificación calculada libro por libro, como referencia de label_bins"""
+    if rating >= 4.5:
+        return 'Excellent'
+    elif rating >= 4.0:
+        return 'Good'
+    elif rating >= 3.5:
+        return 'Average'
+    return 'Poor'
+
+
+def test_query_matches_map_filter_reduce():
+    """BookQuery da los mismos resultados que map, filter y reduce sobre los registros"""
+    manager = BookDataManager(make_books())
+    books = manager.df
+    query = BookQuery(manager)
+
+    elite_records = list(filter(lambda x: x['Genre'] == 'Non Fiction' and x['User Rating'] >= 4.8,
+                                books.to_dict('records')))
+    elite = query.where(col('Genre') == 'Non Fiction').where(col('User Rating') >= 4.8)
+    assert elite.values('Price').tolist() == [book['Price'] for book in elite_records]
+    assert elite.agg(total=('Price', 'sum'))['total'] == reduce(lambda x, y: x + y,
+                                                                [book['Price'] for book in elite_records])
+
+    labeled = query.label_bins('User Rating', [3.5, 4.0, 4.5], ['Poor', 'Average', 'Good', 'Excellent'],
+                               name='Rating Label')
+    assert labeled.values('Rating Label').tolist() == list(map(get_rating_label, books['User Rating']))
+    excellent = labeled.where(col('Rating Label') == 'Excellent').select('Name', 'Rating Label').to_frame()
+    assert list(excellent.columns) == ['Name', 'Rating Label']
+    pd.testing.assert_index_equal(excellent.index, books.index[books['User Rating'] >= 4.5])
+
+    # Condiciones sin índice, combinadas y negadas
+    expected = ((books['Price'] < 5) | (books['Price'] > 100)) & (books['Genre'] != 'Fiction')
+    assert query.where((col('Price') < 5) | (col('Price') > 100), ~(col('Genre') == 'Fiction')).count() == expected.sum()
+    expected = books['Year'].isin([2010, 2011]) & books['Reviews'].between(100, 5000) & (books['Author'] == 'Autor 1')
+    result = query.where(col('Year').isin([2010, 2011]), col('Reviews').between(100, 5000), Author='Autor 1')
+    pd.testing.assert_frame_equal(result.to_frame(), books[expected])
+
+
+def test_bin_labels():
+    """bin_labels asigna cada valor a su tramo, deja NaN como nulo y valida las etiquetas"""
+    labels = bin_labels([3.0, 3.5, 4.49, 4.5, np.nan], [3.5, 4.5], ['bajo', 'medio', 'alto'])
+    assert labels.tolist()[:4] == ['bajo', 'medio', 'medio', 'alto']
+    assert pd.isna(labels[4])
+    with pytest.raises(ValueError):
+        bin_labels([1.0], [1.0, 2.0], ['a', 'b'])
@@ -0,0 +1,42 @@
+import pytest
+from book_analyzer_classes import AnalysisExecutor, AuthorAnalyzer, BookDataManager, GenreAnalyzer
+from parallel_analysis import analyze_parallel
+from test_book_analyzer_classes import make_books
+
+
+def test_parallel_matches_executor():
+    """analyze_parallel coincide con AnalysisExecutor para autores y géneros, con y sin claves faltantes"""
+    books = make_books()
+    books.loc[5, 'Genre'] = None
+    manager = BookDataManager(books)
+    authors = manager.get_authors()
+
+    results = analyze_parallel(manager, AuthorAnalyzer, 'all', n_jobs=2)
+    expected = AnalysisExecutor(manager).run([AuthorAnalyzer(manager, author) for author in authors])
+    assert list(results) == authors
+    assert list(results.values()) == expected
+    assert analyze_parallel(manager, AuthorAnalyzer, 'all', n_jobs=1) == results
+
+    genres = analyze_parallel(manager, GenreAnalyzer, ['Non Fiction', 'Fiction'], n_jobs=2)
+    assert genres['Fiction'] == GenreAnalyzer(manager, 'Fiction').analyze()
+
+    partial = analyze_parallel(manager, AuthorAnalyzer, ['Autor 3', 'Nadie'], n_jobs=2, skip_missing=True)
+    assert partial == {'Autor 3': AuthorAnalyzer(manager, 'Autor 3').analyze(), 'Nadie': None}
+    with pytest.raises(ValueError):
+        analyze_parallel(manager, AuthorAnalyzer, ['Nadie'], n_jobs=2)
+
+
+def test_parallel_preserves_non_text_object_columns():
+    """Las columnas de objetos no textuales, como años enteros, conservan sus tipos en los trabajadores"""
+    books = make_books(500)
+    # Años como objetos (enteros) y columnas que ningún analizador usa
+    books['Year'] = books['Year'].astype(object)
+    books.loc[7, 'Year'] = None
+    books['Bestseller'] = books['Reviews'] > 50000
+    books['Notas'] = [{'id': i} for i in range(len(books))]
+    manager = BookDataManager(books)
+
+    results = analyze_parallel(manager, AuthorAnalyzer, 'all', n_jobs=2)
+    expected = AnalysisExecutor(manager).run([AuthorAnalyzer(manager, author) for author in manager.get_authors()])
+    assert list(results.values()) == expected
+    assert all(isinstance(result['year_range'][0], int) for result in results.values())
@@ -0,0 +1,244 @@
+"""
+Suite de benchmarks de los caminos críticos del repositorio.
+
+Mide DataPipeline.preprocess/train/evaluate, get_house_values y
+UnitConverter.transform sobre datos sintéticos con los esquemas de
+Housing.csv y ai4i2020.csv, registra rendimiento (filas/s), latencia y pico
+de memoria, y compara contra una línea base guardada para detectar
+regresiones.
+
+Uso:
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e4 1e5 --save-baseline
+    python benchmarks/run_benchmarks.py --sizes 1e3 1e4 1e5
+    python benchmarks/run_benchmarks.py --sizes 1e6 1e7 1e8 --only preprocess get_house_values
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from synthetic import HOUSING_CSV, REPO_ROOT, generate_ai4i, generate_housing, iter_chunks
+
+# Los proyectos son carpetas independientes, no paquetes instalables
+sys.path.insert(0, os.path.join(REPO_ROOT, 'Proyecto Final'))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'Tarea 1 Individual'))
+
+from house_stats import get_house_values  # noqa: E402
+from pipeline import DataPipeline  # noqa: E402
+from unit_converter import UnitConverter  # noqa: E402
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+def _fitted_pipeline():
+    pipeline = DataPipeline()
+    pipeline.preprocess(pd.read_csv(HOUSING_CSV))
+    return pipeline
+
+
+def bench_preprocess(housing, n_rows, max_fit_rows):
+    pipeline = _fitted_pipeline()
+    return lambda: [pipeline.preprocess(chunk) for chunk in iter_chunks(housing, n_rows)]
+
+
+def _rows(df, n_rows):
+    """Exactamente n_rows filas: si el bloque sintético es más corto, se repite."""
+    if n_rows <= len(df):
+        return df.iloc[:n_rows]
+    return df.iloc[np.arange(n_rows) % len(df)].reset_index(drop=True)
+
+
+def bench_train(housing, n_rows, max_fit_rows):
+    if n_rows > max_fit_rows:
+        return None
+    pipeline = _fitted_pipeline()
+    X, y = pipeline.preprocess(_rows(housing, n_rows))
+    return lambda: pipeline.train(X, y, LinearRegression())
+
+
+def bench_evaluate(housing, n_rows, max_fit_rows):
+    if n_rows > max_fit_rows:
+        return None
+    pipeline = _fitted_pipeline()
+    X, y = pipeline.preprocess(_rows(housing, n_rows))
+    pipeline.model = LinearRegression().fit(X, y)
+    return lambda: pipeline.evaluate(X, y)
+
+
+def bench_get_house_values(housing, n_rows, max_fit_rows):
+    return lambda: get_house_values(iter_chunks(housing, n_rows))
+
+
+def bench_unit_converter(sensors, n_rows, max_fit_rows):
+    converter = UnitConverter(column_name='air_temperature_k')
+    return lambda: [converter.transform(chunk) for chunk in iter_chunks(sensors, n_rows)]
+
+
+# nombre -> (dataset, función que prepara la medición)
+BENCHMARKS = {
+    'preprocess': ('housing', bench_preprocess),
+    'train': ('housing', bench_train),
+    'evaluate': ('housing', bench_evaluate),
+    'get_house_values': ('housing', bench_get_house_values),
+    'unit_converter': ('ai4i', bench_unit_converter),
+}
+
+
+def measure(run, repeats):
+    """
+    Mide una función: mejor tiempo de `repeats` ejecuciones y pico de memoria.
+
+    El pico de memoria se mide en una ejecución aparte con tracemalloc para
+    que su sobrecosto no afecte a los tiempos.
+
+    Args:
+        run (callable): Función a medir
+        repeats (int): Número de repeticiones cronometradas
+
+    Returns:
+        tuple: (mejor tiempo en segundos, pico de memoria en bytes)
+    """
+    best = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def run_suite(sizes, names, repeats, chunk_rows, max_fit_rows):
+    """
+    Ejecuta los benchmarks seleccionados para cada tamaño.
+
+    Args:
+        sizes (list): Números de filas a medir
+        names (list): Benchmarks a ejecutar (claves de BENCHMARKS)
+        repeats (int): Repeticiones para los tamaños pequeños
+        chunk_rows (int): Filas del bloque sintético que se reutiliza
+        max_fit_rows (int): Máximo de filas para train/evaluate (en memoria)
+
+    Returns:
+        dict: {benchmark: {filas: {seconds, rows_per_second, peak_memory_bytes}}}
+    """
+    pool_rows = min(max(sizes), chunk_rows)
+    datasets = {'housing': generate_housing(pool_rows), 'ai4i': generate_ai4i(pool_rows)}
+    results = {}
+    for name in names:
+        dataset, prepare = BENCHMARKS[name]
+        results[name] = {}
+        for n_rows in sizes:
+            run = prepare(datasets[dataset], n_rows, max_fit_rows)
+            if run is None:
+                print(f'{name:>18} {n_rows:>12,d}  omitido (> --max-fit-rows)')
+                continue
+            # Menos repeticiones para los tamaños grandes
+            seconds, peak = measure(run, max(1, min(repeats, int(1e7 // n_rows))))
+            results[name][str(n_rows)] = {
+                'seconds': seconds,
+                'rows_per_second': n_rows / seconds,
+                'peak_memory_bytes': peak,
+            }
+            print(f'{name:>18} {n_rows:>12,d}  {seconds * 1000:>10.2f} ms  '
+                  f'{n_rows / seconds:>14,.0f} filas/s  {peak / 2 ** 20:>9.1f} MiB')
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compara resultados con una línea base.
+
+    Hay regresión si el rendimiento cae más de `tolerance` (fracción) o si el
+    pico de memoria crece más de `tolerance`.
+
+    Args:
+        results (dict): Resultados actuales de run_suite
+        baseline (dict): Resultados guardados
+        tolerance (float): Margen admitido, por ejemplo 0.2 para 20 %
+
+    Returns:
+        list: Descripción de cada regresión encontrada
+    """
+    regressions = []
+    for name, by_size in results.items():
+        for n_rows, current in by_size.items():
+            reference = baseline.get(name, {}).get(n_rows)
+            if reference is None:
+                continue
+            speed = current['rows_per_second'] / reference['rows_per_second']
+            memory = current['peak_memory_bytes'] / max(reference['peak_memory_bytes'], 1)
+            if speed < 1 - tolerance:
+                regressions.append(f'{name} @ {n_rows} filas: rendimiento {speed:.0%} de la línea base')
+            if memory > 1 + tolerance:
+                regressions.append(f'{name} @ {n_rows} filas: memoria {memory:.0%} de la línea base')
+    return regressions
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Benchmarks del pipeline de viviendas y de UnitConverter')
+    parser.add_argument('--sizes', nargs='+', type=float, default=[1e3, 1e4, 1e5],
+                        help='Tamaños en filas (hasta 1e8)')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--chunk-rows', type=int, default=1_000_000,
+                        help='Filas del bloque sintético que se reutiliza para tamaños mayores')
+    parser.add_argument('--max-fit-rows', type=int, default=1_000_000,
+                        help='Tamaño máximo para train/evaluate, que necesitan los datos en memoria')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Guarda los resultados como nueva línea base')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--output', help='Archivo JSON donde escribir los resultados')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes]
+    results = run_suite(sizes, args.only, args.repeats, args.chunk_rows, args.max_fit_rows)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as file:
+                baseline = json.load(file)
+        for name, by_size in results.items():
+            baseline.setdefault(name, {}).update(by_size)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2)
+        print(f'\nLínea base guardada en {args.baseline}')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('\nNo hay línea base; ejecute con --save-baseline para crearla.')
+        return 0
+    with open(args.baseline, encoding='utf-8') as file:
+        regressions = compare(results, json.load(file), args.tolerance)
+    if regressions:
+        print('\nRegresiones detectadas:')
+        for regression in regressions:
+            print(f'  - {regression}')
+        return 1
+    print('\nSin regresiones respecto de la línea base.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
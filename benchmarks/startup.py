@@ -0,0 +1,113 @@
+"""
+Benchmark del tiempo de arranque de los puntos de entrada.
+
+Ejecuta cada punto de entrada en un intérprete nuevo con ``python -X
+importtime`` y registra el tiempo total de importación, el tiempo de reloj
+del proceso y los paquetes que más tardan en cargarse.
+Importar un módulo no debería cargar pandas, matplotlib, scipy ni sklearn
+hasta que una función los necesite.
+
+Uso:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --only pipeline scoring_server --repeats 5 --top 8
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from synthetic import REPO_ROOT
+
+
+PROYECTO_FINAL = os.path.join(REPO_ROOT, 'Proyecto Final')
+TAREA_1 = os.path.join(REPO_ROOT, 'Tarea 1 Individual')
+
+# nombre -> (directorio de trabajo, código a ejecutar)
+ENTRY_POINTS = {
+    'pipeline': (PROYECTO_FINAL, 'import pipeline'),
+    'scoring_server': (PROYECTO_FINAL, 'import scoring_server'),
+    'house_stats': (PROYECTO_FINAL, 'import house_stats'),
+    'unit_converter': (TAREA_1, 'import unit_converter'),
+    'units': (TAREA_1, 'import units'),
+    'dataset_cache': (TAREA_1, 'import dataset_cache'),
+    # verificar_columnas es un script sin funciones: importarlo carga el dataset e imprime
+    # las columnas, así que se mide su ejecución completa
+    'verificar_columnas': (TAREA_1, 'import verificar_columnas'),
+    'run_histogram': (TAREA_1, 'import run_histogram'),
+    'histograma_temperatura': (TAREA_1, 'import histograma_temperatura'),
+    'scatter_plot_fixed': (TAREA_1, 'import scatter_plot_fixed'),
+    'scatterplot_analysis': (TAREA_1, 'import scatterplot_analysis'),
+    'report_runner': (TAREA_1, 'import report_runner'),
+    'failure_scoring': (TAREA_1, 'import failure_scoring'),
+    'sensor_ingestion': (TAREA_1, 'import sensor_ingestion'),
+}
+
+
+def parse_importtime(stderr):
+    """
+    Interpreta la salida de ``-X importtime``.
+
+    Returns:
+        tuple: (tiempo total de importación en segundos, dict con el tiempo
+            acumulado de cada paquete de primer nivel como pandas o sklearn,
+            en el punto donde se importó por primera vez)
+    """
+    total = 0.0
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        seconds = int(cumulative) / 1e6
+        # La sangría del nombre indica el nivel de anidamiento
+        if not name[1:].startswith(' '):
+            total += seconds
+        elif '.' not in name and not name.strip().startswith('_'):
+            packages[name.strip()] = max(seconds, packages.get(name.strip(), 0.0))
+    return total, packages
+
+
+def measure(name, repeats=3):
+    """Mejor de ``repeats`` ejecuciones de un punto de entrada."""
+    cwd, code = ENTRY_POINTS[name]
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=cwd,
+                                   capture_output=True, text=True, check=True)
+        wall = time.perf_counter() - start
+        import_seconds, packages = parse_importtime(completed.stderr)
+        result = {'wall_seconds': wall, 'import_seconds': import_seconds, 'packages': packages}
+        if best is None or result['wall_seconds'] < best['wall_seconds']:
+            best = result
+    return best
+
+
+def main():
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Tiempo de arranque de los puntos de entrada')
+    parser.add_argument('--only', nargs='+', choices=list(ENTRY_POINTS), default=list(ENTRY_POINTS))
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--top', type=int, default=5, help='Paquetes más lentos a mostrar')
+    parser.add_argument('--output', help='Archivo JSON donde escribir los resultados')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'punto de entrada':<24}{'reloj (s)':>10}{'import (s)':>12}  paquetes más lentos")
+    for name in args.only:
+        result = measure(name, args.repeats)
+        results[name] = result
+        slowest = sorted(result['packages'].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        packages = ', '.join(f'{package} {seconds:.3f}' for package, seconds in slowest)
+        print(f"{name:<24}{result['wall_seconds']:>10.3f}{result['import_seconds']:>12.3f}  {packages}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOUSING_CSV = os.path.join(REPO_ROOT, 'Proyecto Final', 'Housing.csv')
+AI4I_CSV = os.path.join(REPO_ROOT, 'Tarea 1 Desafio', 'ai4i2020.csv')
+
+# Los proyectos son carpetas independientes, no paquetes instalables
+sys.path.insert(0, os.path.join(REPO_ROOT, 'Tarea 1 Individual'))
+
+from typed_csv import clean_column_name  # noqa: E402
+
+
+def _bootstrap(reference, n_rows, seed):
+    """Genera n_rows filas remuestreando cada columna de forma independiente."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        column: reference[column].to_numpy()[rng.integers(0, len(reference), n_rows)]
+        for column in reference.columns
+    })
+
+
+def generate_housing(n_rows, seed=0):
+    """
+    Genera un DataFrame sintético con el esquema de Housing.csv.
+
+    Cada columna se remuestrea de la distribución observada en el archivo
+    real, por lo que los tipos y vocabularios coinciden con los del dataset.
+
+    Args:
+        n_rows (int): Número de filas
+        seed (int): Semilla aleatoria
+
+    Returns:
+        pandas.DataFrame: Datos sintéticos de viviendas
+    """
+    return _bootstrap(pd.read_csv(HOUSING_CSV), n_rows, seed)
+
+
+def generate_ai4i(n_rows, seed=0):
+    """
+    Genera un DataFrame sintético con el esquema de ai4i2020.csv.
+
+    Las columnas se devuelven con los nombres limpios que usan los scripts
+    de análisis (por ejemplo 'air_temperature_k').
+
+    Args:
+        n_rows (int): Número de filas
+        seed (int): Semilla aleatoria
+
+    Returns:
+        pandas.DataFrame: Datos sintéticos de sensores
+    """
+    reference = pd.read_csv(AI4I_CSV)
+    reference.columns = [clean_column_name(column) for column in reference.columns]
+    return _bootstrap(reference, n_rows, seed)
+
+
+def iter_chunks(frame, n_rows):
+    """
+    Recorre n_rows filas reutilizando un bloque ya generado.
+
+    Permite medir tamaños mayores que la memoria (hasta 1e8 filas) sin que
+    el costo de generar los datos entre en la medición.
+
+    Args:
+        frame (pandas.DataFrame): Bloque base
+        n_rows (int): Total de filas a entregar
+
+    Returns:
+        generator: Bloques de a lo sumo len(frame) filas
+    """
+    remaining = n_rows
+    while remaining > 0:
+        size = min(remaining, len(frame))
+        yield frame if size == len(frame) else frame.iloc[:size]
+        remaining -= size